@@ -37,6 +37,22 @@ from .cognitive_modes import (
     ModeConfig,
 )
 
+# 스트리밍 수집
+from .ingestion import (
+    IngestionService,
+    IngestionConfig,
+    IngestionStats,
+)
+
+# 세션 저장소
+from .storage import (
+    StorageBackend,
+    JSONStorageBackend,
+    SQLiteStorageBackend,
+    NPZStorageBackend,
+    create_storage_backend,
+)
+
 # 엔진 접근 (고급 사용자용)
 from .engines import (
     PanoramaMemoryEngine,
@@ -74,6 +90,16 @@ __all__ = [
     "CognitiveMode",
     "CognitiveModePresets",
     "ModeConfig",
+    # 스트리밍 수집
+    "IngestionService",
+    "IngestionConfig",
+    "IngestionStats",
+    # 세션 저장소
+    "StorageBackend",
+    "JSONStorageBackend",
+    "SQLiteStorageBackend",
+    "NPZStorageBackend",
+    "create_storage_backend",
     # 엔진 (고급)
     "PanoramaMemoryEngine",
     "PanoramaConfig",
@@ -33,16 +33,18 @@ Version: 2.0.1
 
 from __future__ import annotations
 
-import json
 import math
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Tuple
+
+import numpy as np
 
 # 엔진 임포트
 from .engines.panorama import PanoramaMemoryEngine, PanoramaConfig
-from .engines.memoryrank import MemoryRankEngine, MemoryRankConfig, MemoryNodeAttributes
+from .engines.panorama.keyword_index import content_text as memory_content_text, is_indexable_keyword
+from .engines.memoryrank import MemoryRankEngine, MemoryRankConfig, MemoryNodeAttributes, EdgeStore
 from .engines.pfc import PFCEngine, PFCConfig, Action
 from .engines.basal_ganglia import BasalGangliaEngine, BasalGangliaConfig
 from .engines.thalamus import ThalamusEngine, ThalamusConfig
@@ -53,6 +55,9 @@ from .engines.dynamics import DynamicsEngine, DynamicsConfig
 # 모드 임포트
 from .cognitive_modes import CognitiveMode, CognitiveModePresets, ModeConfig
 
+# 세션 저장소
+from .storage import StorageBackend, JSONStorageBackend, create_storage_backend
+
 # 파이프라인 임포트 (선택적)
 try:
     from .pipeline import (
@@ -66,6 +71,7 @@ try:
         CoreStrengthStep,
         TorqueGenerationStep,
         UtilityRecalculationStep,
+        FusedDecisionStep,
         ResultAssemblyStep,
     )
     PIPELINE_AVAILABLE = True
@@ -85,21 +91,34 @@ class CognitiveConfig:
     auto_save: bool = True
     auto_save_interval: int = 100  # n개 이벤트마다 자동 저장
     
+    # 세션 저장소: "json" (파일 5개) | "sqlite" (단일 트랜잭션) | "npz" (npz + msgpack)
+    storage_backend: str = "json"
+    # json 저장소의 Panorama 포맷: "json" (전체 재작성) | "sqlite" (WAL + 증분 저장)
+    panorama_format: str = "json"
+    
     # 엔진 설정
     working_memory_capacity: int = 7  # Miller's Law
     recency_half_life: float = 3600.0  # 1시간
     
+    # 랭크 캐시: 최근성 변화율(1 - exp(-λΔt))이 이 값을 넘으면 재랭킹
+    recency_drift_tolerance: float = 0.01
+    
     # PageRank 설정
     damping: float = 0.85
+    sparse_graph: bool = True  # 희소(CSR) 전이 행렬 사용 (메모리 ∝ 엣지 수, False 면 기존 밀집 N×N 행렬)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
             "storage_dir": self.storage_dir,
             "auto_save": self.auto_save,
             "auto_save_interval": self.auto_save_interval,
+            "storage_backend": self.storage_backend,
+            "panorama_format": self.panorama_format,
             "working_memory_capacity": self.working_memory_capacity,
             "recency_half_life": self.recency_half_life,
+            "recency_drift_tolerance": self.recency_drift_tolerance,
             "damping": self.damping,
+            "sparse_graph": self.sparse_graph,
         }
 
 
@@ -152,6 +171,7 @@ class CognitiveKernel:
         # 저장 경로 설정
         self.storage_path = Path(self.config.storage_dir) / session_name
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.storage = self._create_storage()
         
         # 엔진 초기화
         self._init_engines()
@@ -159,7 +179,19 @@ class CognitiveKernel:
         # 상태
         self._event_count = 0
         self._is_dirty = False
-        self._edges: List[Tuple[str, str, float]] = []
+        self._edges = EdgeStore()  # 기억 그래프 엣지 (중복 병합, 제거된 기억의 엣지는 소멸)
+        
+        # MemoryRank 그래프 동기화 상태 (증분 업데이트용)
+        # None이거나 엣지 저장소 epoch 가 바뀌면 다음 recall에서 전체 재구축
+        self._graph_edge_epoch: Optional[int] = None
+        self._graph_time: float = 0.0
+        self._graph_slots: Optional[np.ndarray] = None  # 그래프 노드 → Panorama 열 인덱스
+        self._graph_slots_epoch = -1
+        
+        # 랭크 캐시 (remember/clear/load/모드 변경 시 버전 증가 → 무효화)
+        self._memory_version = 0
+        self._rank_cache_version: Optional[int] = None
+        self._recall_cache: Dict[int, List[Dict[str, Any]]] = {}
         
         # 파이프라인 (선택적, None이면 기본 파이프라인 사용)
         self._pipeline: Optional[DecisionPipeline] = pipeline
@@ -183,11 +215,14 @@ class CognitiveKernel:
         self.panorama = PanoramaMemoryEngine(PanoramaConfig(
             recency_half_life=self.config.recency_half_life,
         ))
+        # 최대 이벤트 수 초과로 밀려난 기억의 엣지 제거
+        self.panorama.evict_listeners.append(self._forget_edges)
         
         # MemoryRank (중요도 랭킹)
         self.memoryrank = MemoryRankEngine(MemoryRankConfig(
             damping=self.mode_config.damping,
             local_weight_boost=self.mode_config.local_weight_boost,
+            sparse=self.config.sparse_graph,
         ))
         
         # PFC (의사결정)
@@ -252,6 +287,8 @@ class CognitiveKernel:
         
         # 엔진 재초기화
         self._init_engines()
+        self._graph_edge_epoch = None
+        self._invalidate_rank_cache()
     
     def set_pipeline(self, pipeline: DecisionPipeline) -> None:
         """
@@ -272,18 +309,12 @@ class CognitiveKernel:
         return DecisionPipeline([
             MemoryLoadStep(self, self.config.working_memory_capacity),
             WorkingMemoryStep(self.pfc),
-            ActionCreationStep(
-                self.pfc,
-                self._calculate_memory_relevance,
-                self._extract_keywords,
-                alpha=0.5,
-            ),
-            PFCDecisionStep(self.pfc),
-            EntropyCalculationStep(self.dynamics),  # DynamicsEngine 사용
-            CoreStrengthStep(self.dynamics, self),  # DynamicsEngine 사용
-            TorqueGenerationStep(self.dynamics, self.mode),  # DynamicsEngine 사용
-            UtilityRecalculationStep(
+            # Action 생성 → PFC → 엔트로피 → 코어 강도 → 토크 → 재계산 (1-pass 통합)
+            FusedDecisionStep(
                 self.pfc,
+                self.dynamics,
+                self,
+                self.mode,
                 self._calculate_memory_relevance,
                 self._extract_keywords,
                 alpha=0.5,
@@ -311,7 +342,7 @@ class CognitiveKernel:
             content: 이벤트 내용
             importance: 중요도 (0~1)
             emotion: 감정 강도 (0~1)
-            related_to: 연관된 기억 ID 리스트
+            related_to: 연관된 기억 ID 리스트 (Panorama 에 없는 ID 는 무시)
             
         Returns:
             생성된 기억 ID
@@ -332,19 +363,104 @@ class CognitiveKernel:
         
         # 연관 관계 저장 (MemoryRank 그래프용)
         if related_to:
-            for related_id in related_to:
-                self._edges.append((related_id, event_id, importance))
-                self._edges.append((event_id, related_id, importance * 0.5))  # 양방향 (비대칭)
+            self._edges.extend(self._related_edges(event_id, related_to, importance))
+        
+        # 메타데이터 저장 + 자동 저장 체크
+        self._note_remembered(1)
+        
+        return event_id
+    
+    def remember_many(self, records: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        기억 여러 개를 한 번에 저장 (대화 기록 백필 등)
         
-        # 메타데이터 저장
-        self._event_count += 1
+        remember() 를 레코드마다 호출한 것과 같은 기억과 엣지가 남지만,
+        Panorama 에는 시간 순 정렬 후 한 번에 병합하고, 엣지는 한 번에 추가하며,
+        자동 저장은 마지막에 최대 한 번만 한다.
+        
+        Args:
+            records: 기억 딕셔너리 목록
+                - event_type (필수): 이벤트 종류
+                - content: 이벤트 내용
+                - importance: 중요도 (0~1, 기본 0.5)
+                - related_to: 연관된 기억 ID 리스트
+                - timestamp: 기억 시각 (없으면 현재 시각)
+                - event_id: 기억 ID (없으면 자동 생성, 같은 배치 안의 related_to 참조용)
+            
+        Returns:
+            생성된 기억 ID 리스트 (레코드 순서)
+            
+        Example:
+            >>> kernel.remember_many([
+            ...     {"event_type": "chat", "content": {"text": "hi"}, "timestamp": t0},
+            ...     {"event_type": "chat", "content": {"text": "bye"}, "timestamp": t1},
+            ... ])
+        """
+        records = list(records)
+        if not records:
+            return []
+        
+        now = time.time()
+        event_ids = self.panorama.append_events([
+            {
+                "timestamp": record.get("timestamp", now),
+                "event_type": record["event_type"],
+                "payload": record.get("content") or {},
+                "importance": record.get("importance", 0.5),
+                "event_id": record.get("event_id"),
+            }
+            for record in records
+        ])
+        
+        # 연관 관계 (remember 와 같은 양방향 비대칭 엣지)
+        # 오래된 타임스탬프의 백필 기억은 추가되자마자 밀려날 수 있으므로,
+        # 병합/제거가 끝난 뒤 Panorama 에 남은 기억끼리만 잇는다
+        new_edges: List[Tuple[str, str, float]] = []
+        for record, event_id in zip(records, event_ids):
+            related_to = record.get("related_to")
+            if related_to:
+                new_edges.extend(
+                    self._related_edges(event_id, related_to, record.get("importance", 0.5))
+                )
+        self._edges.extend(new_edges)
+        
+        self._note_remembered(len(event_ids))
+        return event_ids
+    
+    def _related_edges(
+        self, event_id: str, related_to: Iterable[str], importance: float
+    ) -> List[Tuple[str, str, float]]:
+        """
+        연관 기억과의 양방향 (비대칭) 엣지
+        
+        Panorama 에 남아 있는 기억끼리만 잇는다. 추가 도중 이미 밀려났거나
+        저장된 적 없는 ID 와의 엣지는 _forget_edges 로 지울 수 없어 남기 때문.
+        """
+        get_event = self.panorama.get_event
+        if get_event(event_id) is None:
+            return []
+        edges: List[Tuple[str, str, float]] = []
+        for related_id in related_to:
+            if get_event(related_id) is not None:
+                edges.append((related_id, event_id, importance))
+                edges.append((event_id, related_id, importance * 0.5))  # 양방향 (비대칭)
+        return edges
+    
+    def _forget_edges(self, event_ids: List[str]) -> None:
+        """Panorama 에서 밀려난 기억의 엣지 제거 (다음 recall 에서 그래프 재구축)"""
+        self._edges.remove_nodes(event_ids)
+    
+    def _note_remembered(self, count: int) -> None:
+        """기억 count 개 추가 후 카운터 / 더티 플래그 / 랭크 캐시 / 자동 저장 처리"""
+        before = self._event_count
+        self._event_count += count
         self._is_dirty = True
+        self._invalidate_rank_cache()
         
-        # 자동 저장 체크
-        if self.config.auto_save and self._event_count % self.config.auto_save_interval == 0:
+        # 자동 저장 체크 (auto_save_interval 배수를 지나면 저장)
+        interval = self.config.auto_save_interval
+        if self.config.auto_save and self._event_count // interval > before // interval:
             self.save()
-        
-        return event_id
     
     def recall(self, k: int = 5) -> List[Dict[str, Any]]:
         """
@@ -361,8 +477,16 @@ class CognitiveKernel:
             >>> for m in memories:
             ...     print(f"{m['event_type']}: {m['importance']:.2f}")
         """
-        # MemoryRank 그래프 구축
-        self._rebuild_graph()
+        # 캐시된 랭크가 유효하면 그대로 사용
+        if self._is_rank_cache_valid():
+            cached = self._recall_cache.get(k)
+            if cached is not None:
+                return list(cached)
+        else:
+            # MemoryRank 그래프 갱신 (가능하면 증분)
+            self._update_graph()
+            self._rank_cache_version = self._memory_version
+            self._recall_cache.clear()
         
         # Top-k 조회
         top_memories = self.memoryrank.get_top_memories(k)
@@ -380,7 +504,29 @@ class CognitiveKernel:
                     "timestamp": event.timestamp,
                 })
         
-        return results
+        self._recall_cache[k] = results
+        return list(results)
+    
+    def _invalidate_rank_cache(self) -> None:
+        """랭크 캐시 무효화 (기억 버전 증가)"""
+        self._memory_version += 1
+        self._recall_cache.clear()
+    
+    def _is_rank_cache_valid(self) -> bool:
+        """
+        캐시된 랭크/Top-k 재사용 가능 여부
+        
+        - 마지막 랭킹 이후 remember/clear/load/모드 변경 없음
+        - 최근성 변화율 1 - exp(-λΔt) ≤ recency_drift_tolerance
+        - Loop Integrity Decay 모드는 매 회상마다 엣지가 확률적으로 소실되므로 캐시 안 함
+        """
+        if self._rank_cache_version != self._memory_version:
+            return False
+        if self.mode_config.loop_integrity_decay > 0:
+            return False
+        dt = max(0.0, time.time() - self._graph_time)
+        drift = 1.0 - math.exp(-self._recency_lambda() * dt)
+        return drift <= self.config.recency_drift_tolerance
     
     def decide(
         self,
@@ -419,6 +565,84 @@ class CognitiveKernel:
         # 레거시 방식 (기존 코드)
         return self._decide_legacy(options, context, use_habit, external_torque)
     
+    def decide_many(
+        self,
+        option_lists: List[List[str]],
+        contexts: Optional[List[Optional[str]]] = None,
+        use_habit: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 의사결정을 한 번에 처리 (배치)
+        
+        기억 회상과 Working Memory 로드는 한 번만 하고, 같은 기억 스냅샷과
+        키워드 색인을 모든 옵션 집합이 공유한다. 효용/softmax/엔트로피는
+        패딩된 NumPy 배열로 한꺼번에 계산한다.
+        
+        동역학 상태(세차 위상 φ, 히스토리)와 PFC 난수 소비는 option_lists
+        순서대로 진행되므로, 결과는 같은 순서로 decide() 를 반복 호출한 것과
+        같은 형식/상태를 갖는다 (커스텀 파이프라인은 사용하지 않음).
+        
+        Args:
+            option_lists: 옵션 리스트들 (결정 하나당 하나)
+            contexts: 결정별 상황 컨텍스트 (None 이면 모두 컨텍스트 없음)
+            use_habit: True면 습관 학습 결과도 반영
+            
+        Returns:
+            option_lists 순서의 결정 결과 리스트
+            
+        Example:
+            >>> results = kernel.decide_many(
+            ...     [["rest", "work"], ["coffee", "tea", "water"]],
+            ...     contexts=["tired", None],
+            ... )
+        """
+        option_lists = [list(options) for options in option_lists]
+        if contexts is None:
+            contexts = [None] * len(option_lists)
+        elif len(contexts) != len(option_lists):
+            raise ValueError("contexts must have the same length as option_lists")
+        
+        if not PIPELINE_AVAILABLE:
+            return [
+                self.decide(options, context, use_habit, use_pipeline=False)
+                for options, context in zip(option_lists, contexts)
+            ]
+        if not option_lists:
+            return []
+        
+        from .pipeline import FusedDecisionStep, ResultAssemblyStep
+        
+        # 회상 + Working Memory 로드 (배치당 한 번)
+        memories = self.recall(k=self.config.working_memory_capacity)
+        self.pfc.load_from_memoryrank([(m["id"], m["importance"]) for m in memories])
+        
+        fused = FusedDecisionStep(
+            self.pfc,
+            self.dynamics,
+            self,
+            self.mode,
+            self._calculate_memory_relevance,
+            self._extract_keywords,
+            alpha=0.5,
+        )
+        assemble = ResultAssemblyStep(self.pfc, self.basal_ganglia)
+        
+        # 분포/엔트로피는 배치로, 선택·습관·히스토리는 결정 순서대로
+        prepared = fused.prepare_many(option_lists, memories)
+        self.pfc.update_decay()
+        
+        results = []
+        for pipeline_context, context in zip(prepared, contexts):
+            pipeline_context.metadata.update({"context": context, "use_habit": use_habit})
+            fused.select(pipeline_context)
+            assemble.process(pipeline_context)
+            self.dynamics.update_history(
+                pipeline_context.entropy,
+                pipeline_context.core_strength,
+            )
+            results.append(pipeline_context.result or {})
+        return results
+    
     def _decide_with_pipeline(
         self,
         options: List[str],
@@ -614,43 +838,11 @@ class CognitiveKernel:
         external_torque: Optional[Dict[str, float]] = None,
     ) -> Dict[str, Any]:
         """파이프라인 패턴을 사용한 의사결정"""
-        from .pipeline import (
-            DecisionPipeline,
-            PipelineContext,
-            MemoryLoadStep,
-            WorkingMemoryStep,
-            ActionCreationStep,
-            PFCDecisionStep,
-            EntropyCalculationStep,
-            CoreStrengthStep,
-            TorqueGenerationStep,
-            UtilityRecalculationStep,
-            ResultAssemblyStep,
-        )
+        from .pipeline import PipelineContext
         
         # 파이프라인 가져오기 (없으면 기본 파이프라인 생성)
         if self._pipeline is None:
-            self._pipeline = DecisionPipeline([
-                MemoryLoadStep(self, self.config.working_memory_capacity),
-                WorkingMemoryStep(self.pfc),
-                ActionCreationStep(
-                    self.pfc,
-                    self._calculate_memory_relevance,
-                    self._extract_keywords,
-                    alpha=0.5,
-                ),
-                PFCDecisionStep(self.pfc),
-                EntropyCalculationStep(self.dynamics),  # DynamicsEngine 사용
-                CoreStrengthStep(self.dynamics, self),  # DynamicsEngine 사용
-                TorqueGenerationStep(self.dynamics, self.mode),  # DynamicsEngine 사용
-                UtilityRecalculationStep(
-                    self.pfc,
-                    self._calculate_memory_relevance,
-                    self._extract_keywords,
-                    alpha=0.5,
-                ),
-                ResultAssemblyStep(self.pfc, self.basal_ganglia),
-            ])
+            self._pipeline = self.get_default_pipeline()
         
         # 컨텍스트 생성
         pipeline_context = PipelineContext(
@@ -690,30 +882,19 @@ class CognitiveKernel:
             DecisionPipeline,
             MemoryLoadStep,
             WorkingMemoryStep,
-            ActionCreationStep,
-            PFCDecisionStep,
-            EntropyCalculationStep,
-            CoreStrengthStep,
-            TorqueGenerationStep,
-            UtilityRecalculationStep,
+            FusedDecisionStep,
             ResultAssemblyStep,
         )
         
         return DecisionPipeline([
             MemoryLoadStep(self, self.config.working_memory_capacity),
             WorkingMemoryStep(self.pfc),
-            ActionCreationStep(
-                self.pfc,
-                self._calculate_memory_relevance,
-                self._extract_keywords,
-                alpha=0.5,
-            ),
-            PFCDecisionStep(self.pfc),
-            EntropyCalculationStep(self.dynamics),  # DynamicsEngine 사용
-            CoreStrengthStep(self.dynamics, self),  # DynamicsEngine 사용
-            TorqueGenerationStep(self.dynamics, self.mode),  # DynamicsEngine 사용
-            UtilityRecalculationStep(
+            # Action 생성 → PFC → 엔트로피 → 코어 강도 → 토크 → 재계산 (1-pass 통합)
+            FusedDecisionStep(
                 self.pfc,
+                self.dynamics,
+                self,
+                self.mode,
                 self._calculate_memory_relevance,
                 self._extract_keywords,
                 alpha=0.5,
@@ -768,27 +949,32 @@ class CognitiveKernel:
         - importance_i: MemoryRank 중요도
         - match_score_i: 키워드 매칭 점수 (0~1)
         
+        키워드 포함 여부는 Panorama 키워드 역색인으로 조회한다
+        (색인에 없는 기억은 내용 문자열을 직접 검사, 결과는 같음).
+        
         Returns:
             관련성 점수 (0~1)
         """
         if not memories or not option_keywords:
             return 0.0
         
+        # Panorama 키워드 역색인: 내용 문자열 재구성/부분 문자열 스캔 대신 토큰 조회
+        index = self.panorama.keyword_index
+        use_index = index is not None and all(is_indexable_keyword(kw) for kw in option_keywords)
+        
         total_relevance = 0.0
         
         for mem in memories:
-            # 기억 내용을 문자열로 변환
-            content = mem.get("content", {})
-            if isinstance(content, dict):
-                # 딕셔너리면 모든 값들을 문자열로 합침
-                content_text = " ".join(str(v) for v in content.values()).lower()
-            else:
-                content_text = str(content).lower()
+            event_id = mem.get("id")
+            indexed = use_index and event_id in index
+            if not indexed:
+                # 색인에 없는 기억: 내용을 문자열로 변환해 직접 검사
+                content_text = memory_content_text(mem.get("content", {}))
             
             # 키워드 매칭 점수 계산
             match_score = 0.0
             for keyword in option_keywords:
-                if keyword in content_text:
+                if index.contains(event_id, keyword) if indexed else keyword in content_text:
                     # 키워드가 포함되어 있으면 점수 증가
                     match_score += 1.0 / len(option_keywords)
             
@@ -799,51 +985,119 @@ class CognitiveKernel:
         # 정규화 (0~1 범위로)
         return min(1.0, total_relevance)
     
+    def _recency_lambda(self) -> float:
+        """Panorama 최근성 감쇠 상수 λ = ln(2) / half_life"""
+        half_life = self.panorama.config.recency_half_life
+        return math.log(2) / half_life if half_life > 0 else 0.0
+    
+    def _sync_node_features(self, t_now: float) -> None:
+        """
+        MemoryRank 노드 속성을 Panorama 열 배열에서 벡터화 계산해 전달
+        
+        속성 = (recency, emotion, frequency=1.0, base_importance)
+        그래프 노드 ↔ Panorama 열 인덱스 매핑은 캐시하고, 새 노드만 추가 조회한다.
+        """
+        node_ids = self.memoryrank._index_to_id
+        n_cached = len(self._graph_slots) if self._graph_slots is not None else 0
+        if self._graph_slots is None or self._graph_slots_epoch != self.panorama.column_epoch:
+            self._graph_slots = self.panorama.get_event_indices(node_ids)
+        elif n_cached < len(node_ids):
+            self._graph_slots = np.concatenate([
+                self._graph_slots,
+                self.panorama.get_event_indices(node_ids[n_cached:]),
+            ])
+        self._graph_slots_epoch = self.panorama.column_epoch
+        
+        slots = self._graph_slots
+        columns = self.panorama.get_columns()
+        has_event = slots >= 0
+        features = np.zeros((len(slots), 4), dtype=float)
+        if len(columns["alive"]) > 0:
+            # Panorama에 없는 노드(-1)는 마스크로 제외 (raw score 1.0)
+            safe = np.where(has_event, slots, 0)
+            has_event &= columns["alive"][safe]
+            features[:, 0] = self.panorama.recency_array(t_now, safe)
+            features[:, 1] = columns["emotion"][safe]
+            features[:, 2] = 1.0
+            features[:, 3] = columns["importance"][safe]
+        self.memoryrank.set_node_features(features, has_event)
+    
+    def _update_graph(self):
+        """
+        MemoryRank 그래프 갱신
+        
+        마지막 동기화 이후 추가된 엣지만 증분 반영하고,
+        노드 속성(최근성 등)은 Panorama 열 배열에서 벡터화 재계산한다.
+        (동기화 전, 엣지 소멸, Loop Integrity Decay 모드면 전체 재구축)
+        """
+        if (
+            self._graph_edge_epoch != self._edges.epoch
+            or self.mode_config.loop_integrity_decay > 0
+            or not self.memoryrank.has_graph()
+        ):
+            self._rebuild_graph()
+            return
+        
+        # 새 엣지 반영 (추가분이 너무 많이 쌓였으면 전체 재구축)
+        new_edges = self._edges.take_pending()
+        if new_edges is None:
+            self._rebuild_graph()
+            return
+        if new_edges:
+            self.memoryrank.add_edges(new_edges)
+        
+        t_now = time.time()
+        
+        self._sync_node_features(t_now)
+        self._graph_time = t_now
+        self.memoryrank.compute_rank_vector()
+    
     def _rebuild_graph(self):
         """MemoryRank 그래프 재구축"""
-        events = self.panorama.get_all_events()
-        
-        # 이벤트가 없으면 종료
-        if not events:
+        if len(self.panorama) == 0:
             return
         
         # 엣지가 없으면 시간 순서로 연결
         if not self._edges:
+            events = self.panorama.get_all_events()
             if len(events) > 1:
-                for i in range(len(events) - 1):
-                    self._edges.append((events[i].id, events[i+1].id, 0.5))
+                self._edges.extend(
+                    (events[i].id, events[i+1].id, 0.5) for i in range(len(events) - 1)
+                )
             elif len(events) == 1:
                 # 이벤트가 1개뿐이면 자기 자신으로 연결
-                self._edges.append((events[0].id, events[0].id, 0.5))
-        
-        # 노드 속성 생성
-        recency_scores = self.panorama.get_recency_scores()
-        node_attrs = {}
-        
-        for event in events:
-            node_attrs[event.id] = self._MemoryNodeAttributes(
-                recency=recency_scores.get(event.id, 0.5),
-                emotion=event.payload.get("emotion", 0.0) if event.payload else 0.0,
-                frequency=1.0,
-                base_importance=event.importance,
-            )
+                self._edges.add(events[0].id, events[0].id, 0.5)
         
-        # 그래프 구축
-        # local_weight_boost는 MemoryRankConfig에서 처리됨
+        # 그래프 구축 (엣지 저장소 열 → 인덱스 배열, 엣지 단위 루프 없음)
+        # local_weight_boost는 MemoryRankEngine에서 처리됨
+        node_ids, src, dst, weights = self._edges.graph_arrays()
+        self._edges.take_pending()  # 재구축에 모두 포함됨
         
         # Loop Integrity Decay (알츠하이머: 엣지 소실)
-        edges_to_use = self._edges
         if self.mode_config.loop_integrity_decay > 0:
             import random
-            # 엣지 소실 확률 적용
-            edges_to_use = [
-                edge for edge in self._edges
-                if random.random() > self.mode_config.loop_integrity_decay
-            ]
-        
-        if edges_to_use and node_attrs:
-            self.memoryrank.build_graph(edges_to_use, node_attrs)
-            self.memoryrank.calculate_importance()
+            # 엣지 소실 확률 적용 (병합된 엣지 단위)
+            keep = np.fromiter(
+                (random.random() > self.mode_config.loop_integrity_decay for _ in range(len(weights))),
+                dtype=bool, count=len(weights),
+            )
+            src, dst, weights = src[keep], dst[keep], weights[keep]
+            used = np.zeros(len(node_ids), dtype=bool)
+            used[src] = True
+            used[dst] = True
+            remap = np.cumsum(used) - 1
+            node_ids = [nid for nid, u in zip(node_ids, used.tolist()) if u]
+            src, dst = remap[src], remap[dst]
+        
+        if len(weights):
+            t_now = time.time()
+            self.memoryrank.build_graph_arrays(node_ids, src, dst, weights)
+            # 노드 속성 (Panorama 열 배열 → 벡터화)
+            self._graph_slots = None
+            self._sync_node_features(t_now)
+            self.memoryrank.compute_rank_vector()
+            self._graph_edge_epoch = self._edges.epoch
+            self._graph_time = t_now
     
     # ==================================================================
     # 영속성 (장기 기억의 핵심)
@@ -853,43 +1107,12 @@ class CognitiveKernel:
         """
         세션 저장 (장기 기억)
         
+        실제 저장 포맷은 CognitiveConfig.storage_backend 가 정한다.
+        
         Returns:
             저장 통계
         """
-        stats = {}
-        
-        # Panorama 저장
-        panorama_path = self.storage_path / "panorama.json"
-        stats["events"] = self.panorama.save_to_json(str(panorama_path))
-        
-        # MemoryRank 저장
-        if self.memoryrank._M is not None:
-            memoryrank_path = self.storage_path / "memoryrank.json"
-            result = self.memoryrank.save_to_json(str(memoryrank_path))
-            stats["nodes"] = result["nodes"]
-        
-        # Edges 저장
-        edges_path = self.storage_path / "edges.json"
-        edges_path.write_text(json.dumps(self._edges, indent=2))
-        stats["edges"] = len(self._edges)
-        
-        # BasalGanglia Q-values 저장
-        q_path = self.storage_path / "q_values.json"
-        q_data = {}
-        if hasattr(self.basal_ganglia, '_q_table'):
-            q_data = {k: dict(v) for k, v in self.basal_ganglia._q_table.items()}
-        q_path.write_text(json.dumps(q_data, indent=2))
-        
-        # 메타데이터 저장
-        meta_path = self.storage_path / "meta.json"
-        meta_path.write_text(json.dumps({
-            "session_name": self.session_name,
-            "event_count": self._event_count,
-            "last_saved": time.time(),
-            "config": self.config.to_dict(),
-            "mode": self.mode.value,
-        }, indent=2))
-        
+        stats = self.storage.save(self)
         self._is_dirty = False
         return stats
     
@@ -900,55 +1123,54 @@ class CognitiveKernel:
         Returns:
             로드 통계
         """
-        stats = {}
-        
-        # Panorama 로드
-        panorama_path = self.storage_path / "panorama.json"
-        if panorama_path.exists():
-            stats["events"] = self.panorama.load_from_json(str(panorama_path))
-        
-        # MemoryRank 로드
-        memoryrank_path = self.storage_path / "memoryrank.json"
-        if memoryrank_path.exists():
-            result = self.memoryrank.load_from_json(str(memoryrank_path))
-            stats["nodes"] = result["nodes"]
-        
-        # Edges 로드
-        edges_path = self.storage_path / "edges.json"
-        if edges_path.exists():
-            self._edges = json.loads(edges_path.read_text())
-            stats["edges"] = len(self._edges)
-        
-        # BasalGanglia Q-values 로드
-        q_path = self.storage_path / "q_values.json"
-        if q_path.exists():
-            q_data = json.loads(q_path.read_text())
-            if hasattr(self.basal_ganglia, '_q_table'):
-                from collections import defaultdict
-                self.basal_ganglia._q_table = defaultdict(
-                    lambda: defaultdict(float),
-                    {k: defaultdict(float, v) for k, v in q_data.items()}
-                )
+        stats = self.storage.load(self)
         
-        # 메타데이터 로드
-        meta_path = self.storage_path / "meta.json"
-        if meta_path.exists():
-            meta = json.loads(meta_path.read_text())
-            self._event_count = meta.get("event_count", 0)
-            # 모드 복구 (선택적)
-            if "mode" in meta:
-                try:
-                    self.mode = CognitiveMode(meta["mode"])
-                    self.mode_config = CognitiveModePresets.get_config(self.mode)
-                except ValueError:
-                    pass
+        # 로드된 엣지 기준으로 다음 recall에서 그래프 재구축
+        self._graph_edge_epoch = None
+        self._invalidate_rank_cache()
         
         self._is_dirty = False
         return stats
     
     def _session_exists(self) -> bool:
         """세션 파일 존재 여부"""
-        return (self.storage_path / "meta.json").exists()
+        return self.storage.exists()
+    
+    def _create_storage(self) -> StorageBackend:
+        """설정에 맞는 세션 저장소 생성"""
+        if self.config.storage_backend == JSONStorageBackend.name:
+            return JSONStorageBackend(self.storage_path, panorama_format=self.config.panorama_format)
+        return create_storage_backend(self.config.storage_backend, self.storage_path)
+    
+    # 저장소 백엔드가 사용하는 상태 변환 헬퍼
+    
+    def _session_meta(self) -> Dict[str, Any]:
+        """메타데이터 (세션 이름, 이벤트 수, 설정, 모드)"""
+        return {
+            "session_name": self.session_name,
+            "event_count": self._event_count,
+            "last_saved": time.time(),
+            "config": self.config.to_dict(),
+            "mode": self.mode.value,
+        }
+    
+    def _restore_session_meta(self, meta: Dict[str, Any]) -> None:
+        self._event_count = meta.get("event_count", 0)
+        # 모드 복구 (선택적)
+        if "mode" in meta:
+            try:
+                self.mode = CognitiveMode(meta["mode"])
+                self.mode_config = CognitiveModePresets.get_config(self.mode)
+            except ValueError:
+                pass
+    
+    def _q_table_state(self) -> Dict[str, Any]:
+        """BasalGanglia Q-테이블 (JSON 직렬화 가능한 사전, 문자열 ↔ ID 사전 포함)"""
+        return self.basal_ganglia.get_q_table_state()
+    
+    def _restore_q_table(self, q_data: Dict[str, Any]) -> None:
+        if q_data:
+            self.basal_ganglia.load_q_table_state(q_data)
     
     # ==================================================================
     # 컨텍스트 매니저 (자동 저장)
@@ -996,6 +1218,8 @@ class CognitiveKernel:
         """모든 기억 삭제 (주의!)"""
         self.panorama.clear()
         self._edges.clear()
+        self._graph_edge_epoch = None
+        self._invalidate_rank_cache()
         self._event_count = 0
         self._is_dirty = True
     
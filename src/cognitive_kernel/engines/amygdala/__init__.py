@@ -32,6 +32,7 @@ Blockchain: PHAM v4 (Signed)
 from .amygdala_engine import AmygdalaEngine
 from .config import AmygdalaConfig
 from .data_types import EmotionState, ThreatSignal, FearMemory
+from .matcher import AhoCorasick, AmygdalaMatcher
 from .fear_learning import (
     RescorlaWagnerLearner,
     RescorlaWagnerConfig,
@@ -45,6 +46,8 @@ __all__ = [
     'EmotionState',
     'ThreatSignal',
     'FearMemory',
+    'AhoCorasick',
+    'AmygdalaMatcher',
     # 이론적 학습 모듈 (Rescorla-Wagner)
     'RescorlaWagnerLearner',
     'RescorlaWagnerConfig',
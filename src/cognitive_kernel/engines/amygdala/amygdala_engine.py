@@ -51,11 +51,92 @@ Blockchain: PHAM v4 (Signed)
 import math
 import time
 import re
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Sequence
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 from .config import AmygdalaConfig
 from .data_types import EmotionState, ThreatSignal, FearMemory
+from .matcher import AmygdalaMatcher
+
+
+# 부정어 패턴 (위협 키워드 앞 5자 / 뒤 8자 창에서 검사)
+NEGATION_PATTERNS = (
+    '안 ', '않아', '않는', '않다', '않을', '않고', '않겠',
+    '못 ', '못하', '아니', '아닌', '없어', '없다',
+    '싶지 않', '싶지않', '하지 않', '하지않', '안 할', '안할',
+    'not ', "don't", "doesn't", "didn't", "won't", "wouldn't",
+    'never ', 'no ', "isn't", "aren't", "can't", "cannot",
+)
+
+
+def _score_threat(matcher: AmygdalaMatcher, text_lower: str) -> Tuple[float, str, List[str]]:
+    """
+    텍스트 하나의 위협 점수 (상태 변경 없음)
+    
+    Returns:
+        (정규화 위협 점수, 주 위협 유형, 감지 단어 목록)
+    """
+    threat_scores = defaultdict(float)
+    detected_words = []
+    
+    # 컴파일된 오토마톤으로 한 번 스캔 (키워드 설정 순서대로 매칭 결과)
+    for hit in matcher.match_threats(text_lower):
+        if hit.negated and hit.category != 'self_harm':
+            continue  # 부정문이므로 위협 아님
+        
+        threat_scores[hit.threat_type] += hit.weight
+        if hit.word not in detected_words:
+            detected_words.append(hit.word)
+    
+    # 총 위협 점수
+    total_threat = sum(threat_scores.values())
+    normalized_threat = min(1.0, total_threat / 2.0)
+    main_threat_type = max(threat_scores, key=threat_scores.get) if threat_scores else 'unknown'
+    return normalized_threat, main_threat_type, detected_words
+
+
+def _score_emotion(matcher: AmygdalaMatcher, text_lower: str) -> Tuple[float, float, str]:
+    """
+    텍스트 하나의 입력 감정 (관성 적용 전, 상태 변경 없음)
+    
+    Returns:
+        (입력 valence, 입력 arousal, 주 감정)
+    """
+    detected_emotions = []
+    total_valence = 0.0
+    total_arousal = 0.0
+    count = 0
+    
+    for hit in matcher.match_emotions(text_lower):
+        detected_emotions.append(hit.emotion)
+        total_valence += hit.valence
+        total_arousal += hit.arousal
+        count += 1
+    
+    if count > 0:
+        input_valence = total_valence / count
+        input_arousal = total_arousal / count
+        dominant = max(set(detected_emotions), key=detected_emotions.count) if detected_emotions else 'neutral'
+    else:
+        input_valence = 0.0
+        input_arousal = 0.3
+        dominant = 'neutral'
+    return input_valence, input_arousal, dominant
+
+
+# 프로세스 풀 워커별 매처 (initializer 에서 한 번 컴파일)
+_worker_matcher: Optional[AmygdalaMatcher] = None
+
+
+def _init_worker(threat_keywords: Dict, emotion_map: Dict) -> None:
+    global _worker_matcher
+    _worker_matcher = AmygdalaMatcher(threat_keywords, emotion_map, NEGATION_PATTERNS)
+
+
+def _score_chunk(texts: List[str], threat: bool) -> List[Tuple]:
+    score = _score_threat if threat else _score_emotion
+    return [score(_worker_matcher, text) for text in texts]
 
 
 class AmygdalaEngine:
@@ -104,6 +185,9 @@ class AmygdalaEngine:
         config.validate()
         self.config = config
         
+        # 위협/감정/부정어 다중 패턴 매처
+        self.compile_patterns()
+        
         # 공포 조건화 메모리
         self.fear_memories: Dict[str, FearMemory] = {}
         
@@ -122,6 +206,18 @@ class AmygdalaEngine:
             'memories_enhanced': 0,
         }
     
+    def compile_patterns(self):
+        """
+        threat_keywords / emotion_map / 부정어를 오토마톤으로 컴파일
+        
+        초기화 때 한 번 호출된다. 실행 중 config 의 키워드를 바꿨다면 다시 호출한다.
+        """
+        self._matcher = AmygdalaMatcher(
+            self.config.threat_keywords,
+            self.config.emotion_map,
+            NEGATION_PATTERNS,
+        )
+    
     # ============================================
     # 핵심 기능: 위협 감지
     # ============================================
@@ -139,61 +235,13 @@ class AmygdalaEngine:
         Returns:
             ThreatSignal if threat detected, None otherwise
         """
-        text_lower = input_text.lower()
-        text_no_space = text_lower.replace(' ', '')
-        
-        # 부정어 패턴
-        negations_strict = [
-            '안 ', '않아', '않는', '않다', '않을', '않고', '않겠',
-            '못 ', '못하', '아니', '아닌', '없어', '없다',
-            '싶지 않', '싶지않', '하지 않', '하지않', '안 할', '안할',
-            'not ', "don't", "doesn't", "didn't", "won't", "wouldn't",
-            'never ', 'no ', "isn't", "aren't", "can't", "cannot",
-        ]
-        
-        threat_scores = defaultdict(float)
-        detected_words = []
-        
-        for category, info in self.config.threat_keywords.items():
-            for word in info['words']:
-                word_no_space = word.replace(' ', '')
-                if word in text_lower or word_no_space in text_no_space:
-                    # 부정어 체크
-                    idx = text_lower.find(word)
-                    if idx == -1:
-                        idx = text_no_space.find(word_no_space)
-                        context_pre = text_no_space[max(0, idx-5):idx]
-                        context_post = text_no_space[idx:idx+len(word_no_space)+8]
-                    else:
-                        context_pre = text_lower[max(0, idx-5):idx]
-                        context_post = text_lower[idx:idx+len(word)+8]
-                    
-                    has_negation_pre = any(neg in context_pre for neg in negations_strict)
-                    has_negation_post = any(neg in context_post for neg in negations_strict)
-                    
-                    if (has_negation_pre or has_negation_post) and category != 'self_harm':
-                        continue  # 부정문이므로 위협 아님
-                    
-                    score = info['weight']
-                    threat_scores[info['type']] += score
-                    if word not in detected_words:
-                        detected_words.append(word)
-        
-        # 총 위협 점수
-        total_threat = sum(threat_scores.values())
-        normalized_threat = min(1.0, total_threat / 2.0)
+        normalized_threat, main_threat_type, detected_words = _score_threat(
+            self._matcher, input_text.lower()
+        )
         
         # 임계값 체크
         if normalized_threat >= self.config.threat_threshold:
-            main_threat_type = max(threat_scores, key=threat_scores.get) if threat_scores else 'unknown'
-            response = self._determine_response(normalized_threat, main_threat_type)
-            
-            signal = ThreatSignal(
-                source=', '.join(detected_words[:3]),
-                threat_level=normalized_threat,
-                threat_type=main_threat_type,
-                response=response
-            )
+            signal = self._make_threat_signal(normalized_threat, main_threat_type, detected_words)
             
             self.recent_threats.append(signal)
             self.recent_threats = self.recent_threats[-10:]
@@ -203,6 +251,59 @@ class AmygdalaEngine:
         
         return None
     
+    def detect_threat_many(
+        self,
+        texts: Sequence[str],
+        processes: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> List[Optional[ThreatSignal]]:
+        """
+        위협 감지 (배치)
+        
+        텍스트마다 detect_threat() 를 순서대로 호출한 것과 같은 결과와 상태
+        (recent_threats 최근 10개, stats) 를 만든다. 텍스트별 점수 계산은
+        서로 독립이므로 processes 를 주면 프로세스 풀에서 나눠 계산한다.
+        
+        Args:
+            texts: 입력 텍스트 목록
+            processes: 워커 프로세스 수 (None/1 이면 현재 프로세스에서 계산)
+            chunk_size: 워커 하나에 넘기는 텍스트 수
+            
+        Returns:
+            텍스트별 ThreatSignal (임계값 미만이면 None)
+        """
+        scores = self._score_many(texts, processes, chunk_size, threat=True)
+        
+        threshold = self.config.threat_threshold
+        signals: List[Optional[ThreatSignal]] = []
+        for normalized_threat, main_threat_type, detected_words in scores:
+            if normalized_threat >= threshold:
+                signals.append(
+                    self._make_threat_signal(normalized_threat, main_threat_type, detected_words)
+                )
+            else:
+                signals.append(None)
+        
+        detected = [signal for signal in signals if signal is not None]
+        if detected:
+            self.recent_threats = (self.recent_threats + detected)[-10:]
+            self.stats['threats_detected'] += len(detected)
+        
+        return signals
+    
+    def _make_threat_signal(
+        self,
+        normalized_threat: float,
+        main_threat_type: str,
+        detected_words: List[str],
+    ) -> ThreatSignal:
+        return ThreatSignal(
+            source=', '.join(detected_words[:3]),
+            threat_level=normalized_threat,
+            threat_type=main_threat_type,
+            response=self._determine_response(normalized_threat, main_threat_type)
+        )
+    
     def _determine_response(self, threat_level: float, threat_type: str) -> str:
         """위협에 대한 반응 결정"""
         if threat_type == 'self_harm':
@@ -237,29 +338,9 @@ class AmygdalaEngine:
         Returns:
             EmotionState
         """
-        text_lower = input_text.lower()
-        
-        detected_emotions = []
-        total_valence = 0.0
-        total_arousal = 0.0
-        count = 0
-        
-        for emotion_name, info in self.config.emotion_map.items():
-            for word in info['words']:
-                if word in text_lower:
-                    detected_emotions.append(emotion_name)
-                    total_valence += info['valence']
-                    total_arousal += info['arousal']
-                    count += 1
-        
-        if count > 0:
-            input_valence = total_valence / count
-            input_arousal = total_arousal / count
-            dominant = max(set(detected_emotions), key=detected_emotions.count) if detected_emotions else 'neutral'
-        else:
-            input_valence = 0.0
-            input_arousal = 0.3
-            dominant = 'neutral'
+        input_valence, input_arousal, dominant = _score_emotion(
+            self._matcher, input_text.lower()
+        )
         
         # 감정 관성 적용
         inertia = self.config.emotion_inertia
@@ -276,6 +357,69 @@ class AmygdalaEngine:
         
         return self.current_emotion
     
+    def process_emotion_many(
+        self,
+        texts: Sequence[str],
+        processes: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> List[EmotionState]:
+        """
+        감정 분석 (배치)
+        
+        텍스트별 입력 (V, A) 를 먼저 모두 계산한 뒤, 감정 관성을
+        순차 스캔으로 적용한다:
+            V_t = (1-α)·V_input,t + α·V_{t-1}
+        텍스트마다 process_emotion() 을 호출한 것과 같은 값이 나온다.
+        
+        Args:
+            texts: 입력 텍스트 목록
+            processes: 워커 프로세스 수 (None/1 이면 현재 프로세스에서 계산)
+            chunk_size: 워커 하나에 넘기는 텍스트 수
+            
+        Returns:
+            텍스트별 EmotionState (관성 반영)
+        """
+        scores = self._score_many(texts, processes, chunk_size, threat=False)
+        
+        inertia = self.config.emotion_inertia
+        keep = 1 - inertia
+        valence = self.current_emotion.valence
+        arousal = self.current_emotion.arousal
+        
+        states: List[EmotionState] = []
+        for input_valence, input_arousal, dominant in scores:
+            valence = input_valence * keep + valence * inertia
+            arousal = input_arousal * keep + arousal * inertia
+            states.append(EmotionState(valence=valence, arousal=arousal, dominant=dominant))
+        
+        if states:
+            self.current_emotion = states[-1]
+            self.stats['emotions_processed'] += len(states)
+        
+        return states
+    
+    def _score_many(
+        self,
+        texts: Sequence[str],
+        processes: Optional[int],
+        chunk_size: int,
+        threat: bool,
+    ) -> List[Tuple]:
+        """텍스트별 점수 (상태 변경 없음, 필요하면 프로세스 풀 사용)"""
+        texts = [text.lower() for text in texts]
+        if not processes or processes <= 1 or len(texts) <= chunk_size:
+            score = _score_threat if threat else _score_emotion
+            return [score(self._matcher, text) for text in texts]
+        
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(self.config.threat_keywords, self.config.emotion_map),
+        ) as pool:
+            results = pool.map(_score_chunk, chunks, [threat] * len(chunks))
+            return [score for chunk in results for score in chunk]
+    
     # ============================================
     # 핵심 기능: 기억 강화
     # ============================================
@@ -327,6 +471,48 @@ class AmygdalaEngine:
         """
         threat = self.detect_threat(content)
         emotion = self.process_emotion(content)
+        return self._enhancement_record(content, base_importance, emotion, threat)
+    
+    def enhance_memory_many(
+        self,
+        contents: Sequence[str],
+        base_importances: Optional[Sequence[float]] = None,
+        processes: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        기억 강화 (배치)
+        
+        detect_threat_many / process_emotion_many 로 한 번에 분석한 뒤
+        텍스트별로 enhance_memory() 와 같은 정보를 만든다.
+        
+        Args:
+            contents: 기억할 내용 목록
+            base_importances: 기본 중요도 목록 (None이면 모두 0.5)
+            processes: 워커 프로세스 수 (배치 분석용)
+            
+        Returns:
+            강화된 기억 정보 목록 (입력 순서)
+        """
+        if base_importances is None:
+            base_importances = [0.5] * len(contents)
+        elif len(base_importances) != len(contents):
+            raise ValueError("base_importances must have the same length as contents")
+        
+        threats = self.detect_threat_many(contents, processes=processes)
+        emotions = self.process_emotion_many(contents, processes=processes)
+        return [
+            self._enhancement_record(content, base_importance, emotion, threat)
+            for content, base_importance, emotion, threat
+            in zip(contents, base_importances, emotions, threats)
+        ]
+    
+    def _enhancement_record(
+        self,
+        content: str,
+        base_importance: float,
+        emotion: EmotionState,
+        threat: Optional[ThreatSignal],
+    ) -> Dict[str, Any]:
         enhancement = self.calculate_memory_enhancement(emotion, threat)
         enhanced_importance = min(1.0, base_importance * enhancement)
         
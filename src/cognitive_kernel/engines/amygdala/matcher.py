@@ -0,0 +1,317 @@
+"""
+Amygdala Pattern Matcher
+편도체 다중 패턴 매처 (Aho–Corasick)
+
+위협 키워드 / 감정 단어 / 부정어를 하나의 오토마톤으로 컴파일해
+입력 텍스트를 한 번의 선형 스캔으로 처리한다.
+
+기존 방식:
+    키워드마다 `word in text` + 공백 제거 텍스트 재검사,
+    매칭될 때마다 find() 와 모든 부정어에 대한 `neg in context` 검사
+    → 비용 ∝ (키워드 수 + 부정어 수) × 텍스트 길이
+
+컴파일 방식:
+    - 소문자 텍스트, 공백 제거 텍스트를 각각 한 번씩 스캔
+    - 패턴별 첫 등장 위치(offset)와 부정어 등장 구간을 기록
+    - 부정어 창(window) 검사는 접두 최댓값 배열로 O(1)
+    → 비용 ∝ 텍스트 길이 + 매칭 수
+
+판정 결과(어떤 단어가 잡히는지, 부정 판정, 점수 합산 순서)는
+기존 중첩 루프와 같다.
+
+Author: GNJz (Qquarts)
+Version: 1.0.0-alpha
+License: MIT License
+"""
+
+import re
+from bisect import bisect_right
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class AhoCorasick:
+    """
+    Aho–Corasick 다중 문자열 검색 오토마톤
+
+    패턴은 추가된 순서대로 0부터 ID 를 받는다 (같은 문자열은 같은 ID).
+    빈 패턴은 항상 위치 0 에서 매칭된 것으로 본다 (`'' in text` 와 같은 의미).
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[Tuple[int, ...]] = [()]
+        self._lengths: List[int] = []
+        self._root_search = None
+        self._built = False
+        for pattern in patterns:
+            self.add(pattern)
+
+    def add(self, pattern: str) -> int:
+        """패턴 추가 (이미 있으면 기존 ID)"""
+        pid = self._ids.get(pattern)
+        if pid is not None:
+            return pid
+        pid = self._ids[pattern] = len(self.patterns)
+        self.patterns.append(pattern)
+        self._built = False
+        return pid
+
+    def pattern_id(self, pattern: str) -> int:
+        return self._ids[pattern]
+
+    def build(self) -> "AhoCorasick":
+        """트라이 + 실패 링크 구성 (출력은 실패 체인을 미리 합쳐 둔다)"""
+        goto: List[Dict[str, int]] = [{}]
+        own: List[List[int]] = [[]]
+        for pid, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    own.append([])
+                state = nxt
+            own[state].append(pid)
+
+        fail = [0] * len(goto)
+        outputs: List[Tuple[int, ...]] = [()] * len(goto)
+        queue = deque(goto[0].values())
+        for state in queue:
+            outputs[state] = tuple(own[state])
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fallback = goto[f].get(ch, 0)
+                fail[nxt] = fallback if fallback != nxt else 0
+                outputs[nxt] = tuple(own[nxt]) + outputs[fail[nxt]]
+                queue.append(nxt)
+
+        self._goto, self._fail, self._outputs = goto, fail, outputs
+        self._lengths = [len(p) for p in self.patterns]
+        first_chars = ''.join(sorted(goto[0]))
+        self._root_search = re.compile(
+            '[' + re.escape(first_chars) + ']' if first_chars else '(?!)'
+        ).search
+        self._built = True
+        return self
+
+    def scan(self, text: str) -> List[Tuple[int, int]]:
+        """모든 매칭 (start, pid) — 끝 위치 순, 겹치는 매칭 포함 (빈 패턴 제외)"""
+        if not self._built:
+            self.build()
+        goto, fail, outputs, lengths = self._goto, self._fail, self._outputs, self._lengths
+        root_search = self._root_search
+        matches: List[Tuple[int, int]] = []
+        n = len(text)
+        state = 0
+        i = 0
+        while i < n:
+            if not state:
+                # 루트에서는 패턴 첫 글자가 나올 때까지 C 수준 검색으로 건너뜀
+                found = root_search(text, i)
+                if found is None:
+                    break
+                i = found.start()
+            ch = text[i]
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt if nxt is not None else 0
+            i += 1
+            out = outputs[state]
+            if out:
+                for pid in out:
+                    matches.append((i - lengths[pid], pid))
+        return matches
+
+    def first_starts(self, text: str) -> Dict[int, int]:
+        """패턴별 첫 등장 위치 (`text.find(pattern)` 과 같은 값, 없는 패턴은 키 없음)"""
+        first: Dict[int, int] = {}
+        for start, pid in self.scan(text):
+            # 같은 패턴은 길이가 같으므로 끝 위치 순 = 시작 위치 순
+            if pid not in first:
+                first[pid] = start
+        for pid, pattern in enumerate(self.patterns):
+            if not pattern:
+                first[pid] = 0
+        return first
+
+
+class ThreatHit(NamedTuple):
+    """위협 키워드 매칭 (설정 순서)"""
+    category: str
+    word: str
+    weight: float
+    threat_type: str
+    negated: bool
+
+
+class EmotionHit(NamedTuple):
+    """감정 단어 매칭 (설정 순서)"""
+    emotion: str
+    valence: float
+    arousal: float
+
+
+class _ScanResult:
+    """텍스트 하나의 스캔 결과 (첫 등장 위치 + 부정어 창 판정)"""
+
+    __slots__ = ("first", "_neg_ends", "_neg_max_start", "_always_negated")
+
+    def __init__(self,
+                 automaton: AhoCorasick,
+                 text: str,
+                 negation_ids: frozenset,
+                 always_negated: bool):
+        first: Dict[int, int] = {}
+        # 부정어 매칭은 끝 위치 순으로 나온다 → 끝 위치 목록 + 시작 위치 누적 최댓값
+        neg_ends: List[int] = []
+        neg_max_start: List[int] = []
+        lengths = automaton._lengths
+        best = -1
+        for start, pid in automaton.scan(text):
+            if pid not in first:
+                first[pid] = start
+            if pid in negation_ids:
+                if start > best:
+                    best = start
+                neg_ends.append(start + lengths[pid])
+                neg_max_start.append(best)
+        for pid, pattern in enumerate(automaton.patterns):
+            if not pattern:
+                first[pid] = 0
+
+        self.first = first
+        self._neg_ends = neg_ends
+        self._neg_max_start = neg_max_start
+        self._always_negated = always_negated
+
+    def has_negation(self, lo: int, hi: int) -> bool:
+        """text[lo:hi] 안에 부정어가 통째로 들어 있는지 (`neg in text[lo:hi]`)"""
+        if self._always_negated:
+            return True
+        # 끝 위치 ≤ hi 인 부정어 중 시작 위치가 lo 이상인 것이 있는지
+        k = bisect_right(self._neg_ends, hi)
+        return k > 0 and self._neg_max_start[k - 1] >= lo
+
+
+class AmygdalaMatcher:
+    """
+    위협 키워드 / 감정 맵 / 부정어를 한 오토마톤으로 컴파일한 매처
+
+    Args:
+        threat_keywords: AmygdalaConfig.threat_keywords
+        emotion_map: AmygdalaConfig.emotion_map
+        negations: 부정어 패턴 목록
+    """
+
+    def __init__(self,
+                 threat_keywords: Dict,
+                 emotion_map: Dict,
+                 negations: Sequence[str]):
+        automaton = AhoCorasick()
+
+        # (category, word, weight, type, pid(word), pid(공백 제거 word))
+        self._threat_entries: List[Tuple[str, str, float, str, int, int]] = []
+        for category, info in threat_keywords.items():
+            for word in info['words']:
+                self._threat_entries.append((
+                    category,
+                    word,
+                    info['weight'],
+                    info['type'],
+                    automaton.add(word),
+                    automaton.add(word.replace(' ', '')),
+                ))
+
+        # (emotion, valence, arousal, pid)
+        self._emotion_entries: List[Tuple[str, float, float, int]] = []
+        for emotion_name, info in emotion_map.items():
+            for word in info['words']:
+                self._emotion_entries.append((
+                    emotion_name,
+                    info['valence'],
+                    info['arousal'],
+                    automaton.add(word),
+                ))
+
+        self._negation_ids = frozenset(automaton.add(neg) for neg in negations)
+        self._always_negated = any(not neg for neg in negations)
+        self._automaton = automaton.build()
+        self._pattern_lengths = automaton._lengths
+
+        # 같은 텍스트를 위협/감정에서 연달아 볼 때 재스캔하지 않도록 직전 결과 보관
+        self._last: Optional[Tuple[str, _ScanResult]] = None
+
+    def _scan(self, text: str) -> _ScanResult:
+        last = self._last
+        if last is not None and last[0] == text:
+            return last[1]
+        result = _ScanResult(self._automaton, text, self._negation_ids, self._always_negated)
+        self._last = (text, result)
+        return result
+
+    def match_threats(self, text_lower: str) -> List[ThreatHit]:
+        """
+        위협 키워드 매칭 (설정 순서)
+
+        기존 규칙과 같다:
+            - 소문자 텍스트에 단어가 있거나, 공백 제거 텍스트에 공백 제거 단어가 있으면 매칭
+            - 부정어 검사는 첫 등장 위치 기준 앞 5자 / 단어 + 뒤 8자 창
+              (소문자 텍스트에 없으면 공백 제거 텍스트 기준)
+        """
+        lower = self._scan(text_lower)
+        compact: Optional[_ScanResult] = None
+        lengths = self._pattern_lengths
+
+        hits: List[ThreatHit] = []
+        for category, word, weight, threat_type, pid, pid_ns in self._threat_entries:
+            idx = lower.first.get(pid)
+            if idx is not None:
+                scan = lower
+                length = lengths[pid]
+            else:
+                if compact is None:
+                    text_no_space = text_lower.replace(' ', '')
+                    if text_no_space == text_lower:
+                        compact = lower
+                    else:
+                        compact = _ScanResult(
+                            self._automaton,
+                            text_no_space,
+                            self._negation_ids,
+                            self._always_negated,
+                        )
+                idx = compact.first.get(pid_ns)
+                if idx is None:
+                    continue
+                scan = compact
+                length = lengths[pid_ns]
+
+            negated = (
+                scan.has_negation(max(0, idx - 5), idx)
+                or scan.has_negation(idx, idx + length + 8)
+            )
+            hits.append(ThreatHit(category, word, weight, threat_type, negated))
+        return hits
+
+    def match_emotions(self, text_lower: str) -> List[EmotionHit]:
+        """감정 단어 매칭 (설정 순서, 단어마다 한 번)"""
+        first = self._scan(text_lower).first
+        return [
+            EmotionHit(emotion_name, valence, arousal)
+            for emotion_name, valence, arousal, pid in self._emotion_entries
+            if pid in first
+        ]
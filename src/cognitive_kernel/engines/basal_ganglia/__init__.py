@@ -9,6 +9,8 @@ Version: 1.0.0-alpha
 from .basal_ganglia_engine import BasalGangliaEngine
 from .data_types import ActionType, Action, ActionResult
 from .config import BasalGangliaConfig
+from .q_table import QTable, ActionView
+from .replay_buffer import ReplayBuffer
 
 __all__ = [
     'BasalGangliaEngine',
@@ -16,6 +18,9 @@ __all__ = [
     'Action',
     'ActionResult',
     'BasalGangliaConfig',
+    'QTable',
+    'ActionView',
+    'ReplayBuffer',
 ]
 
 __version__ = '1.0.0-alpha'
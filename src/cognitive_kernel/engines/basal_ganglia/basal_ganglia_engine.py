@@ -32,15 +32,18 @@ Version: 1.0.0-alpha
     - Frank (2005): Go/NoGo model of basal ganglia
 """
 
-import math
 import time
 import random
 import hashlib
-from typing import Dict, List, Tuple, Optional, Any
-from collections import defaultdict
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, List, Tuple, Optional, Any
+
+import numpy as np
 
 from .data_types import ActionType, Action, ActionResult
 from .config import BasalGangliaConfig
+from .q_table import QTable, QTableMapping, ActionView, HABIT_THRESHOLD
+from .replay_buffer import ReplayBuffer, Transition
 
 
 class BasalGangliaEngine:
@@ -72,17 +75,28 @@ class BasalGangliaEngine:
         self.config = config if config else BasalGangliaConfig()
         
         # ===== Q-테이블 (상황 → 행동 → 가치) =====
-        # {context: {action_name: Action}}
-        self.q_table: Dict[str, Dict[str, Action]] = defaultdict(dict)
+        # 배열 기반 (인턴된 컨텍스트/행동 ID → NumPy 열)
+        self._table = QTable()
         
         # 컨텍스트 해싱 모드
         self.use_hash = use_hash
         
+        # ===== 컨텍스트 인턴 캐시 (원문 → 컨텍스트 ID, LRU) =====
+        self._context_cache: "OrderedDict[str, int]" = OrderedDict()
+        
         # ===== 도파민 상태 =====
         self.dopamine_level = self.config.dopamine_baseline  # 현재 도파민 (0~1)
         
         # ===== 최근 행동 기록 =====
-        self.recent_actions: List[Tuple[str, str, float]] = []  # (context, action, reward)
+        self.recent_actions: Deque[Tuple[str, str, float]] = deque(
+            maxlen=self.config.max_history
+        )  # (context, action, reward)
+        
+        # ===== 경험 재생 버퍼 (선택) =====
+        self.replay_buffer: Optional[ReplayBuffer] = (
+            ReplayBuffer(self.config.replay_capacity)
+            if self.config.replay_capacity > 0 else None
+        )
         
         # ===== 통계 =====
         self.stats = {
@@ -93,6 +107,11 @@ class BasalGangliaEngine:
             'total_reward': 0.0,
         }
     
+    @property
+    def q_table(self) -> QTableMapping:
+        """{context: {action_name: Action}} 형태의 Q-테이블 뷰 (ActionView)"""
+        return QTableMapping(self._table)
+    
     # ============================================
     # 1. 행동 선택 (Action Selection)
     # ============================================
@@ -118,11 +137,11 @@ class BasalGangliaEngine:
         """
         self.stats['total_decisions'] += 1
         
-        # 컨텍스트 정규화
-        context = self._normalize_context(context)
+        # 컨텍스트 정규화 + 인턴
+        cid = self._context_id(context)
         
         # 1. 습관 체크 (Fast Path)
-        habit_action = self._check_habit(context, possible_actions)
+        habit_action = self._check_habit(cid, possible_actions)
         if habit_action:
             self.stats['habit_executions'] += 1
             return ActionResult(
@@ -134,12 +153,12 @@ class BasalGangliaEngine:
             )
         
         # 2. Q-값 기반 선택 (Slow Path)
-        actions = self._get_or_create_actions(context, possible_actions)
+        rows = self._get_or_create_rows(cid, possible_actions)
         
-        if not actions:
+        if len(rows) == 0:
             # 행동 없음
             return ActionResult(
-                action=Action(name="none", context=context),
+                action=Action(name="none", context=self._table.context_name(cid)),
                 decision=ActionType.NOGO,
                 confidence=0.0,
                 is_automatic=False,
@@ -150,7 +169,7 @@ class BasalGangliaEngine:
         if allow_exploration and self._should_explore():
             # 탐색: 랜덤 또는 낮은 Q-값 행동
             self.stats['explorations'] += 1
-            action = self._explore(actions)
+            action = self._table.view(self._explore(rows))
             return ActionResult(
                 action=action,
                 decision=ActionType.EXPLORE,
@@ -161,7 +180,8 @@ class BasalGangliaEngine:
         
         # 활용: Q-값 기반 소프트맥스 선택
         self.stats['deliberate_executions'] += 1
-        action, confidence = self._exploit(actions)
+        row, confidence = self._exploit(rows)
+        action = self._table.view(row)
         
         # Go/NoGo 결정
         decision = ActionType.GO if confidence > 0.3 else ActionType.NOGO
@@ -174,41 +194,38 @@ class BasalGangliaEngine:
             reasoning=f"선택: '{action.name}' (Q={action.q_value:.2f}, 확신: {confidence:.2f})"
         )
     
-    def _check_habit(self, context: str, possible_actions: List[str]) -> Optional[Action]:
+    def _check_habit(self, cid: int, possible_actions: List[str]) -> Optional[ActionView]:
         """
         습관 체크
         
         습관화된 행동이 있으면 즉시 반환 (Fast Path)
+        possible_actions 순서에서 처음 나오는 습관 행동
         """
-        if context not in self.q_table:
+        if not self._table.has_context_id(cid):
             return None
         
-        for action_name in possible_actions:
-            if action_name in self.q_table[context]:
-                action = self.q_table[context][action_name]
-                if action.is_habit:
-                    return action
+        rows = self._table.find_many_id(cid, possible_actions)
+        rows = rows[rows >= 0]
+        if len(rows) == 0:
+            return None
         
-        return None
+        is_habit = self._table.habit_strength[rows] >= HABIT_THRESHOLD
+        if not is_habit.any():
+            return None
+        return self._table.view(rows[int(np.argmax(is_habit))])
+    
+    def _get_or_create_rows(self, cid: int, action_names: List[str]) -> np.ndarray:
+        """행동 행 번호 가져오기 또는 생성 (새 행동은 탐색 보너스로 초기화)"""
+        return self._table.get_or_create_many_id(
+            cid,
+            action_names,
+            q_value=self.config.exploration_bonus,  # 초기값에 탐색 보너스
+        )
     
-    def _get_or_create_actions(self, context: str, action_names: List[str]) -> List[Action]:
+    def _get_or_create_actions(self, context: str, action_names: List[str]) -> List[ActionView]:
         """행동 객체 가져오기 또는 생성"""
-        actions = []
-        
-        for name in action_names:
-            if name in self.q_table[context]:
-                actions.append(self.q_table[context][name])
-            else:
-                # 새 행동 생성
-                action = Action(
-                    name=name,
-                    context=context,
-                    q_value=self.config.exploration_bonus  # 초기값에 탐색 보너스
-                )
-                self.q_table[context][name] = action
-                actions.append(action)
-        
-        return actions
+        rows = self._get_or_create_rows(self._context_id(context), action_names)
+        return [self._table.view(row) for row in rows]
     
     def _should_explore(self) -> bool:
         """
@@ -221,7 +238,7 @@ class BasalGangliaEngine:
         explore_prob = 0.1 + (1 - self.dopamine_level) * 0.2
         return random.random() < explore_prob
     
-    def _explore(self, actions: List[Action]) -> Action:
+    def _explore(self, rows: np.ndarray) -> int:
         """
         탐색: 낮은 실행 횟수 행동 선호
         
@@ -229,13 +246,12 @@ class BasalGangliaEngine:
             weights = [1.0 / (execution_count + 1) for action in actions]
             → 실행 횟수가 적은 행동에 높은 가중치
         """
-        weights = [1.0 / (a.execution_count + 1) for a in actions]
-        total = sum(weights)
-        probs = [w / total for w in weights]
+        weights = 1.0 / (self._table.execution_count[rows] + 1)
+        probs = weights / weights.sum()
         
-        return random.choices(actions, weights=probs)[0]
+        return int(rows[self._choose(probs)])
     
-    def _exploit(self, actions: List[Action]) -> Tuple[Action, float]:
+    def _exploit(self, rows: np.ndarray) -> Tuple[int, float]:
         """
         활용: Q-값 기반 소프트맥스 선택
         
@@ -246,20 +262,25 @@ class BasalGangliaEngine:
         """
         tau = self.config.tau
         
-        # 소프트맥스 확률 계산
-        q_values = [a.q_value for a in actions]
-        max_q = max(q_values) if q_values else 0
-        
-        # 수치 안정성을 위해 max 빼기
-        exp_values = [math.exp((q - max_q) / tau) for q in q_values]
-        total = sum(exp_values)
-        probs = [e / total for e in exp_values]
+        # 소프트맥스 확률 계산 (수치 안정성을 위해 max 빼기)
+        q_values = self._table.q_value[rows]
+        exp_values = np.exp((q_values - q_values.max()) / tau)
+        probs = exp_values / exp_values.sum()
         
         # 선택
-        selected = random.choices(actions, weights=probs)[0]
-        confidence = probs[actions.index(selected)]
+        index = self._choose(probs)
+        return int(rows[index]), float(probs[index])
+    
+    @staticmethod
+    def _choose(probs: np.ndarray) -> int:
+        """
+        가중치 샘플링 인덱스 (random.choices 와 같은 난수 소비/결과)
         
-        return selected, confidence
+        누적 가중치에서 random() × 합을 이진 탐색
+        """
+        cum_weights = np.cumsum(probs)
+        r = random.random() * cum_weights[-1]
+        return min(int(np.searchsorted(cum_weights, r, side="right")), len(probs) - 1)
     
     def _normalize_context(self, context: str) -> str:
         """
@@ -276,6 +297,27 @@ class BasalGangliaEngine:
         # 기본: 50자로 자름 (디버깅 용이)
         return normalized[:50]
     
+    def _context_id(self, context: str) -> int:
+        """
+        원문 컨텍스트 → 컨텍스트 ID (정규화 + 인턴, LRU 캐시)
+        
+        자주 반복되는 원문은 소문자화/자르기/MD5 없이 사전 조회 한 번으로 끝난다.
+        캐시 크기는 config.context_cache_size 로 제한 (0이면 캐시 안 함).
+        """
+        cache = self._context_cache
+        cid = cache.get(context)
+        if cid is not None:
+            cache.move_to_end(context)
+            return cid
+        
+        cid = self._table.intern_context(self._normalize_context(context))
+        capacity = self.config.context_cache_size
+        if capacity > 0:
+            cache[context] = cid
+            if len(cache) > capacity:
+                cache.popitem(last=False)
+        return cid
+    
     # ============================================
     # 2. 학습 (Learning)
     # ============================================
@@ -303,15 +345,14 @@ class BasalGangliaEngine:
             reward: 받은 보상 (-1 ~ +1)
             next_context: 다음 상황 (None이면 종료 상태)
         """
-        context = self._normalize_context(context)
+        if self.replay_buffer is not None:
+            self.replay_buffer.add(context, action_name, reward, next_context)
         
-        # 행동 가져오기
-        if action_name not in self.q_table[context]:
-            self.q_table[context][action_name] = Action(
-                name=action_name, context=context
-            )
+        cid = self._context_id(context)
+        context = self._table.context_name(cid)
         
-        action = self.q_table[context][action_name]
+        # 행동 가져오기 (없으면 Q=0 으로 생성)
+        action = self._table.view(self._table.get_or_create_id(cid, action_name))
         
         # 실행 기록
         action.execution_count += 1
@@ -326,9 +367,8 @@ class BasalGangliaEngine:
         
         # 다음 상태의 최대 Q-값
         if next_context:
-            next_context = self._normalize_context(next_context)
-            next_q_values = [a.q_value for a in self.q_table[next_context].values()]
-            max_next_q = max(next_q_values) if next_q_values else 0
+            next_rows = self._table.context_rows_id(self._context_id(next_context))
+            max_next_q = float(self._table.q_value[next_rows].max()) if len(next_rows) else 0
         else:
             max_next_q = 0
         
@@ -355,9 +395,163 @@ class BasalGangliaEngine:
         
         # 기록
         self.recent_actions.append((context, action_name, reward))
-        self.recent_actions = self.recent_actions[-self.config.max_history:]
         self.stats['total_reward'] += reward
     
+    def learn_batch(self,
+                    transitions: Iterable[Transition],
+                    record: bool = True) -> int:
+        """
+        여러 경험을 한 번에 학습 (오프라인 보상 로그 / 경험 재생)
+        
+        learn() 을 같은 순서로 반복 호출한 것과 같은 Q-값, 습관 강도,
+        도파민 레벨을 만든다. 서로 간섭하지 않는 연속 구간 단위로 처리:
+            - 구간 안에서 같은 (상황, 행동) 행은 한 번만 갱신
+            - 구간 안에서 앞서 갱신된 상황을 다음 상황으로 읽지 않음
+        구간 안의 TD 오차 / Q 갱신 / 습관 갱신은 벡터 연산이고,
+        도파민은 순서 의존 점화식이므로 스칼라 루프로 따라간다.
+        
+        Args:
+            transitions: (context, action, reward[, next_context]) 목록
+            record: False면 실행 횟수/최근 기록/통계/재생 버퍼를 갱신하지 않음 (재생용)
+            
+        Returns:
+            학습한 경험 수
+        """
+        transitions = list(transitions)
+        n = len(transitions)
+        if n == 0:
+            return 0
+        
+        if record and self.replay_buffer is not None:
+            self.replay_buffer.extend(transitions)
+        
+        # 컨텍스트 ID (종료 상태는 -1)
+        context_id = self._context_id
+        contexts = [context_id(t[0]) for t in transitions]
+        actions = [t[1] for t in transitions]
+        rewards = [float(t[2]) for t in transitions]
+        next_contexts = [
+            context_id(t[3]) if len(t) > 3 and t[3] else -1
+            for t in transitions
+        ]
+        
+        table = self._table
+        now = time.time()
+        start = 0
+        while start < n:
+            # 1. 간섭 없는 구간 [start, end) 결정 (새 행은 여기서 생성)
+            base_size = len(table)
+            written_rows = set()
+            written_contexts = set()
+            rows: List[int] = []
+            end = start
+            while end < n:
+                context = contexts[end]
+                next_context = next_contexts[end]
+                if next_context in written_contexts:
+                    break
+                row = table.find_id(context, actions[end])
+                if row in written_rows:
+                    break
+                if row < 0:
+                    row = table.get_or_create_id(context, actions[end], 0.0, now)
+                written_rows.add(row)
+                written_contexts.add(context)
+                rows.append(row)
+                end += 1
+            
+            self._learn_segment(
+                np.array(rows, dtype=np.int64),
+                contexts[start:end],
+                np.array(rewards[start:end], dtype=np.float64),
+                next_contexts[start:end],
+                base_size,
+                now if record else None,
+            )
+            start = end
+        
+        if record:
+            names = [table.context_name(cid) for cid in contexts]
+            self.recent_actions.extend(zip(names, actions, rewards))
+            self.stats['total_reward'] = sum(rewards, self.stats['total_reward'])
+        return n
+    
+    def _learn_segment(self,
+                       rows: np.ndarray,
+                       contexts: List[int],
+                       rewards: np.ndarray,
+                       next_contexts: List[int],
+                       base_size: int,
+                       now: Optional[float]) -> None:
+        """간섭 없는 구간 하나의 TD 업데이트 (learn_batch 내부용)"""
+        table = self._table
+        
+        # 다음 상태의 최대 Q-값 (구간 시작 전에 있던 행만, 서로 다른 상황당 한 번)
+        distinct: Dict[int, int] = {}
+        group = np.array(
+            [
+                -1 if c < 0 else distinct.setdefault(c, len(distinct))
+                for c in next_contexts
+            ],
+            dtype=np.int64,
+        )
+        maxima = np.append(table.context_max_q_ids(list(distinct), limit=base_size), np.nan)
+        max_next_q = maxima[group]  # group == -1 → 마지막 nan (종료 상태)
+        
+        # 자기 상황으로 돌아가는 새 행동: 방금 만든 행(Q=0)도 후보
+        self_new = (rows >= base_size) & (
+            np.array(next_contexts, dtype=np.int64) == np.array(contexts, dtype=np.int64)
+        )
+        max_next_q[self_new] = np.fmax(max_next_q[self_new], 0.0)
+        max_next_q = np.nan_to_num(max_next_q, nan=0.0)
+        
+        # 실행 기록
+        if now is not None:
+            table.execution_count[rows] += 1
+            table.last_executed[rows] = now
+            table.success_count[rows] += (rewards > 0)
+        
+        # TD 오차 (벡터)
+        q_values = table.q_value[rows]
+        td_errors = rewards + self.config.gamma * max_next_q - q_values
+        
+        # 도파민 보정 학습률 (순서 의존 점화식)
+        alpha = self.config.alpha
+        baseline = self.config.dopamine_baseline
+        boost_factor = self.config.dopamine_boost_factor
+        dopamine = self.dopamine_level
+        learning_rates = np.empty(len(rows), dtype=np.float64)
+        for i, td_error in enumerate(td_errors.tolist()):
+            dopamine_boost = max(-0.5, min(0.5, (dopamine - baseline) * boost_factor))
+            learning_rates[i] = alpha * (1.0 + dopamine_boost)
+            dopamine = max(0, min(1, dopamine + td_error * 0.1))
+            dopamine += 0.05 * (baseline - dopamine)
+        self.dopamine_level = dopamine
+        
+        table.q_value[rows] = q_values + learning_rates * td_errors
+        
+        # 습관 강화/약화 (성공/실패 시)
+        beta = self.config.habit_beta
+        habits = table.habit_strength[rows]
+        habits = np.where(rewards > 0, habits + beta * (1 - habits), habits)
+        habits = np.where(rewards < 0, np.maximum(0.0, habits - beta * 0.5), habits)
+        table.habit_strength[rows] = habits
+    
+    def replay(self,
+               batch_size: int,
+               rng: Optional[np.random.Generator] = None) -> int:
+        """
+        경험 재생: 버퍼에서 무작위로 뽑은 경험을 다시 학습
+        
+        실행 횟수/최근 기록/통계는 바꾸지 않는다 (새 경험이 아니므로).
+        
+        Returns:
+            학습한 경험 수 (버퍼가 없거나 비어 있으면 0)
+        """
+        if self.replay_buffer is None:
+            return 0
+        return self.learn_batch(self.replay_buffer.sample(batch_size, rng), record=False)
+    
     def set_dopamine_level(self, level: float) -> None:
         """
         도파민 레벨 설정
@@ -391,7 +585,7 @@ class BasalGangliaEngine:
         decay = 0.05
         self.dopamine_level += decay * (self.config.dopamine_baseline - self.dopamine_level)
     
-    def _strengthen_habit(self, action: Action):
+    def _strengthen_habit(self, action: ActionView):
         """
         습관 강화
         
@@ -402,7 +596,7 @@ class BasalGangliaEngine:
         beta = self.config.habit_beta
         action.habit_strength += beta * (1 - action.habit_strength)
     
-    def _weaken_habit(self, action: Action):
+    def _weaken_habit(self, action: ActionView):
         """
         습관 약화
         
@@ -417,20 +611,15 @@ class BasalGangliaEngine:
     # 3. 습관 관리
     # ============================================
     
-    def get_habits(self) -> List[Action]:
+    def get_habits(self) -> List[ActionView]:
         """모든 습관화된 행동 반환"""
-        habits = []
-        for context, actions in self.q_table.items():
-            for action in actions.values():
-                if action.is_habit:
-                    habits.append(action)
-        return habits
+        return [self._table.view(row) for row in self._table.habit_rows()]
     
     def break_habit(self, context: str, action_name: str):
         """습관 깨기"""
-        context = self._normalize_context(context)
-        if context in self.q_table and action_name in self.q_table[context]:
-            self.q_table[context][action_name].habit_strength = 0.0
+        row = self._table.find_id(self._context_id(context), action_name)
+        if row >= 0:
+            self._table.habit_strength[row] = 0.0
     
     def decay_all(self):
         """
@@ -438,51 +627,67 @@ class BasalGangliaEngine:
         
         수식:
             Q(s,a) = Q(s,a) * (1 - decay_rate)
+            1시간 이상 실행하지 않은 습관: H = H * 0.99
         """
-        decay = self.config.decay_rate
-        for context, actions in self.q_table.items():
-            for action in actions.values():
-                action.q_value *= (1 - decay)
-                # 너무 오래된 습관도 약화
-                time_since = time.time() - action.last_executed
-                if time_since > 3600:  # 1시간 이상
-                    action.habit_strength *= 0.99
+        self._table.decay(self.config.decay_rate, stale_after=3600, habit_factor=0.99)
     
     # ============================================
     # 4. 상태 조회
     # ============================================
     
-    def get_best_action(self, context: str) -> Optional[Action]:
+    def get_best_action(self, context: str) -> Optional[ActionView]:
         """특정 상황에서 최선의 행동"""
-        context = self._normalize_context(context)
-        if context not in self.q_table:
+        rows = self._table.context_rows_id(self._context_id(context))
+        if len(rows) == 0:
             return None
         
-        actions = list(self.q_table[context].values())
-        if not actions:
-            return None
-        
-        return max(actions, key=lambda a: a.q_value)
+        return self._table.view(rows[int(np.argmax(self._table.q_value[rows]))])
     
     def get_state(self) -> Dict[str, Any]:
         """전체 상태 반환"""
-        habits = self.get_habits()
+        habit_rows = self._table.habit_rows()[:5]  # 상위 5개
         
         return {
             'dopamine': round(self.dopamine_level, 3),
-            'total_contexts': len(self.q_table),
-            'total_actions': sum(len(a) for a in self.q_table.values()),
+            'total_contexts': self._table.num_contexts,
+            'total_actions': len(self._table),
             'habits': [
                 {
-                    'context': h.context, 
-                    'action': h.name, 
-                    'strength': round(h.habit_strength, 3)
+                    'context': self._table.context_of(row), 
+                    'action': self._table.action_name_of(row), 
+                    'strength': round(float(self._table.habit_strength[row]), 3)
                 }
-                for h in habits[:5]  # 상위 5개
+                for row in habit_rows
             ],
             'stats': self.stats.copy(),
         }
     
+    def get_q_table_state(self) -> Dict[str, Any]:
+        """
+        Q-테이블 직렬화 상태 (JSON 직렬화 가능)
+        
+        정규화된 컨텍스트 문자열 ↔ ID, 행동 이름 ↔ ID 사전과 행 열을 담는다.
+        """
+        return self._table.to_state()
+    
+    def load_q_table_state(self, state: Dict[str, Any]) -> None:
+        """
+        get_q_table_state() 결과로 Q-테이블 복원
+        
+        {context: {action_name: q_value}} 형태의 예전 사전도 받아들인다.
+        """
+        self._context_cache.clear()
+        if "contexts" in state and "q_value" in state:
+            self._table = QTable.from_state(state)
+            return
+        
+        self._table = QTable()
+        for context, actions in state.items():
+            cid = self._context_id(context)
+            for action_name, q_value in actions.items():
+                row = self._table.get_or_create_id(cid, action_name)
+                self._table.q_value[row] = float(q_value)
+    
     def get_stats(self) -> Dict[str, Any]:
         """통계 반환"""
         return self.stats.copy()
@@ -48,6 +48,8 @@ class BasalGangliaConfig:
     
     # ===== 메모리 설정 =====
     max_history: int = 100               # 최대 행동 기록 수
+    replay_capacity: int = 0             # 경험 재생 버퍼 용량 (0이면 사용 안 함)
+    context_cache_size: int = 4096       # 원문 컨텍스트 → ID LRU 캐시 크기 (0이면 캐시 안 함)
     
     # ===== 성향 설정 (Bias) =====
     # 외부에서 주입 가능한 행동 성향
@@ -89,6 +91,8 @@ class BasalGangliaConfig:
             },
             'memory': {
                 'max_history': self.max_history,
+                'replay_capacity': self.replay_capacity,
+                'context_cache_size': self.context_cache_size,
             },
             'bias': {
                 'impulsivity': self.impulsivity,
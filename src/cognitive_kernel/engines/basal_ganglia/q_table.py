@@ -0,0 +1,496 @@
+"""
+Basal Ganglia Q-Table (Array-backed)
+기저핵 Q-테이블 - 배열 기반 저장소
+
+Author: GNJz (Qquarts)
+Version: 1.0.0-alpha
+
+구조:
+    - 컨텍스트 / 행동 이름은 정수 ID 로 인턴(intern)
+    - (컨텍스트, 행동) 쌍 하나 = 행(row) 하나
+    - 행 값은 NumPy 열(column)에 보관:
+      q_value, habit_strength, execution_count, success_count, last_executed
+    - 컨텍스트별 {행동 ID: 행} 사전으로 조회 (삽입 순서 유지)
+
+    감쇠(decay_all), 습관 스캔, 소프트맥스 활용은 열 단위 벡터 연산으로 처리.
+    기존 API(q_table[context][name] → Action)는 ActionView 어댑터로 유지.
+"""
+
+import time
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from .data_types import Action
+
+
+# Action.is_habit 과 같은 임계값
+HABIT_THRESHOLD = 0.7
+
+
+class QTable:
+    """
+    배열 기반 Q-테이블
+
+    행은 추가만 된다 (삭제 없음). 열은 용량이 부족하면 두 배로 늘린다.
+    """
+
+    def __init__(self, initial_capacity: int = 64):
+        # 인턴 테이블
+        self._context_ids: Dict[str, int] = {}
+        self._contexts: List[str] = []
+        self._action_ids: Dict[str, int] = {}
+        self._action_names: List[str] = []
+
+        # 컨텍스트 ID → {행동 ID: 행}
+        self._context_rows: List[Dict[int, int]] = []
+        self._num_active_contexts = 0
+
+        # 열 (앞쪽 _size 개만 유효)
+        self._size = 0
+        capacity = max(1, int(initial_capacity))
+        self._q = np.zeros(capacity, dtype=np.float64)
+        self._habit = np.zeros(capacity, dtype=np.float64)
+        self._executions = np.zeros(capacity, dtype=np.int64)
+        self._successes = np.zeros(capacity, dtype=np.int64)
+        self._last_executed = np.zeros(capacity, dtype=np.float64)
+        self._row_context = np.zeros(capacity, dtype=np.int64)
+        self._row_action = np.zeros(capacity, dtype=np.int64)
+
+    # ============================================
+    # 열 (유효 구간 뷰)
+    # ============================================
+
+    @property
+    def q_value(self) -> np.ndarray:
+        return self._q[:self._size]
+
+    @property
+    def habit_strength(self) -> np.ndarray:
+        return self._habit[:self._size]
+
+    @property
+    def execution_count(self) -> np.ndarray:
+        return self._executions[:self._size]
+
+    @property
+    def success_count(self) -> np.ndarray:
+        return self._successes[:self._size]
+
+    @property
+    def last_executed(self) -> np.ndarray:
+        return self._last_executed[:self._size]
+
+    # ============================================
+    # 컨텍스트 인턴
+    # ============================================
+
+    def intern_context(self, context: str) -> int:
+        """컨텍스트 ID (없으면 새로 부여, 행은 만들지 않음)"""
+        cid = self._context_ids.get(context)
+        if cid is None:
+            cid = self._context_ids[context] = len(self._contexts)
+            self._contexts.append(context)
+            self._context_rows.append({})
+        return cid
+
+    def context_id(self, context: str) -> int:
+        """컨텍스트 ID (없으면 -1)"""
+        return self._context_ids.get(context, -1)
+
+    def context_name(self, cid: int) -> str:
+        return self._contexts[cid]
+
+    def _intern_action(self, action_name: str) -> int:
+        aid = self._action_ids.get(action_name)
+        if aid is None:
+            aid = self._action_ids[action_name] = len(self._action_names)
+            self._action_names.append(action_name)
+        return aid
+
+    # ============================================
+    # 행 조회 / 생성 (컨텍스트 ID 기준)
+    # ============================================
+
+    def find_id(self, cid: int, action_name: str) -> int:
+        """행 번호 (없으면 -1)"""
+        aid = self._action_ids.get(action_name)
+        if cid < 0 or aid is None:
+            return -1
+        return self._context_rows[cid].get(aid, -1)
+
+    def get_or_create_id(self,
+                         cid: int,
+                         action_name: str,
+                         q_value: float = 0.0,
+                         now: Optional[float] = None) -> int:
+        """행 번호 (없으면 q_value 로 새 행 생성)"""
+        aid = self._intern_action(action_name)
+        rows = self._context_rows[cid]
+        row = rows.get(aid)
+        if row is None:
+            if not rows:
+                self._num_active_contexts += 1
+            row = rows[aid] = self._append_row(cid, aid, q_value, now)
+        return row
+
+    def get_or_create_many_id(self,
+                              cid: int,
+                              action_names: Sequence[str],
+                              q_value: float = 0.0) -> np.ndarray:
+        """여러 행동의 행 번호 배열 (없는 행은 생성, action_names 순서)"""
+        now = time.time()
+        return np.fromiter(
+            (self.get_or_create_id(cid, name, q_value, now) for name in action_names),
+            dtype=np.int64,
+            count=len(action_names),
+        )
+
+    def find_many_id(self, cid: int, action_names: Sequence[str]) -> np.ndarray:
+        """여러 행동의 행 번호 배열 (없으면 -1)"""
+        if cid < 0:
+            return np.full(len(action_names), -1, dtype=np.int64)
+        rows = self._context_rows[cid]
+        action_ids = self._action_ids
+        return np.fromiter(
+            (rows.get(action_ids.get(name, -1), -1) for name in action_names),
+            dtype=np.int64,
+            count=len(action_names),
+        )
+
+    def context_rows_id(self, cid: int) -> np.ndarray:
+        """컨텍스트의 모든 행 번호 (삽입 순서)"""
+        if cid < 0:
+            return np.zeros(0, dtype=np.int64)
+        rows = self._context_rows[cid]
+        return np.fromiter(rows.values(), dtype=np.int64, count=len(rows))
+
+    def context_max_q_ids(self, cids: Sequence[int], limit: Optional[int] = None) -> np.ndarray:
+        """
+        컨텍스트별 최대 Q-값 (행이 없으면 nan)
+
+        모든 컨텍스트의 행을 하나로 모아 maximum.reduceat 한 번으로 계산.
+        limit 이 있으면 행 번호 < limit 인 행만 본다 (그 시점 이전에 있던 행).
+        """
+        result = np.full(len(cids), np.nan)
+        flat: List[int] = []
+        starts: List[int] = []
+        present: List[int] = []
+        for k, cid in enumerate(cids):
+            rows = self._context_rows[cid] if cid >= 0 else None
+            if not rows:
+                continue
+            present.append(k)
+            starts.append(len(flat))
+            flat.extend(rows.values())
+        if not flat:
+            return result
+
+        rows = np.array(flat, dtype=np.int64)
+        values = self._q[rows]
+        if limit is not None:
+            values = np.where(rows < limit, values, -np.inf)
+        maxima = np.maximum.reduceat(values, starts)
+        maxima[np.isneginf(maxima)] = np.nan
+        result[present] = maxima
+        return result
+
+    def has_context_id(self, cid: int) -> bool:
+        """행이 하나라도 있는 컨텍스트인지"""
+        return cid >= 0 and bool(self._context_rows[cid])
+
+    # ============================================
+    # 행 조회 / 생성 (컨텍스트 문자열 기준)
+    # ============================================
+
+    def find(self, context: str, action_name: str) -> int:
+        return self.find_id(self.context_id(context), action_name)
+
+    def get_or_create(self,
+                      context: str,
+                      action_name: str,
+                      q_value: float = 0.0,
+                      now: Optional[float] = None) -> int:
+        return self.get_or_create_id(self.intern_context(context), action_name, q_value, now)
+
+    def find_many(self, context: str, action_names: Sequence[str]) -> np.ndarray:
+        return self.find_many_id(self.context_id(context), action_names)
+
+    def context_rows(self, context: str) -> np.ndarray:
+        return self.context_rows_id(self.context_id(context))
+
+    def has_context(self, context: str) -> bool:
+        return self.has_context_id(self.context_id(context))
+
+    def contexts(self) -> List[str]:
+        """행이 있는 컨텍스트 (처음 등장한 순서)"""
+        return [c for c, rows in zip(self._contexts, self._context_rows) if rows]
+
+    @property
+    def num_contexts(self) -> int:
+        """행이 있는 컨텍스트 수"""
+        return self._num_active_contexts
+
+    def context_of(self, row: int) -> str:
+        return self._contexts[self._row_context[row]]
+
+    def action_name_of(self, row: int) -> str:
+        return self._action_names[self._row_action[row]]
+
+    def _append_row(self, cid: int, aid: int, q_value: float, now: Optional[float]) -> int:
+        if self._size == len(self._q):
+            self._grow(2 * len(self._q))
+        row = self._size
+        self._size += 1
+        self._q[row] = q_value
+        self._habit[row] = 0.0
+        self._executions[row] = 0
+        self._successes[row] = 0
+        self._last_executed[row] = time.time() if now is None else now
+        self._row_context[row] = cid
+        self._row_action[row] = aid
+        return row
+
+    def _grow(self, capacity: int) -> None:
+        for name in ("_q", "_habit", "_executions", "_successes",
+                     "_last_executed", "_row_context", "_row_action"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    # ============================================
+    # 벡터 연산
+    # ============================================
+
+    def decay(self,
+              decay_rate: float,
+              now: Optional[float] = None,
+              stale_after: float = 3600.0,
+              habit_factor: float = 0.99) -> None:
+        """
+        모든 Q-값 감쇠 + 오래된 습관 약화 (한 번의 벡터 연산)
+
+        수식:
+            Q(s,a) = Q(s,a) * (1 - decay_rate)
+            H = H * habit_factor   (마지막 실행 후 stale_after 초 초과 시)
+        """
+        if now is None:
+            now = time.time()
+        self.q_value[:] *= (1 - decay_rate)
+        stale = (now - self.last_executed) > stale_after
+        self.habit_strength[stale] *= habit_factor
+
+    def habit_rows(self, threshold: float = HABIT_THRESHOLD) -> np.ndarray:
+        """습관화된 행 (컨텍스트 등장 순서 → 컨텍스트 내 삽입 순서)"""
+        rows = np.flatnonzero(self.habit_strength >= threshold)
+        if len(rows) > 1:
+            rows = rows[np.argsort(self._row_context[rows], kind="stable")]
+        return rows
+
+    # ============================================
+    # 직렬화 (문자열 ↔ ID 사전 포함)
+    # ============================================
+
+    def to_state(self) -> Dict[str, list]:
+        """JSON 직렬화 가능한 상태 (인턴 테이블 + 열)"""
+        return {
+            "contexts": list(self._contexts),
+            "actions": list(self._action_names),
+            "row_context": self._row_context[:self._size].tolist(),
+            "row_action": self._row_action[:self._size].tolist(),
+            "q_value": self.q_value.tolist(),
+            "habit_strength": self.habit_strength.tolist(),
+            "execution_count": self.execution_count.tolist(),
+            "success_count": self.success_count.tolist(),
+            "last_executed": self.last_executed.tolist(),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, list]) -> "QTable":
+        """to_state() 결과로 복원 (ID 와 행 순서 유지)"""
+        n = len(state["q_value"])
+        table = cls(initial_capacity=max(64, n))
+        for context in state["contexts"]:
+            table.intern_context(context)
+        for action_name in state["actions"]:
+            table._intern_action(action_name)
+
+        table._size = n
+        table._q[:n] = state["q_value"]
+        table._habit[:n] = state["habit_strength"]
+        table._executions[:n] = state["execution_count"]
+        table._successes[:n] = state["success_count"]
+        table._last_executed[:n] = state["last_executed"]
+        table._row_context[:n] = state["row_context"]
+        table._row_action[:n] = state["row_action"]
+
+        for row, (cid, aid) in enumerate(zip(state["row_context"], state["row_action"])):
+            rows = table._context_rows[cid]
+            if not rows:
+                table._num_active_contexts += 1
+            rows[aid] = row
+        return table
+
+    def view(self, row: int) -> "ActionView":
+        return ActionView(self, int(row))
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class ActionView:
+    """
+    Q-테이블 행에 대한 Action 어댑터
+
+    Action 과 같은 속성(name, context, q_value, execution_count, success_count,
+    habit_strength, last_executed, success_rate, is_habit)을 제공하며,
+    값을 바꾸면 Q-테이블 열에 바로 반영된다.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: QTable, row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    @property
+    def name(self) -> str:
+        return self._table.action_name_of(self._row)
+
+    @property
+    def context(self) -> str:
+        return self._table.context_of(self._row)
+
+    @property
+    def q_value(self) -> float:
+        return float(self._table._q[self._row])
+
+    @q_value.setter
+    def q_value(self, value: float) -> None:
+        self._table._q[self._row] = value
+
+    @property
+    def execution_count(self) -> int:
+        return int(self._table._executions[self._row])
+
+    @execution_count.setter
+    def execution_count(self, value: int) -> None:
+        self._table._executions[self._row] = value
+
+    @property
+    def success_count(self) -> int:
+        return int(self._table._successes[self._row])
+
+    @success_count.setter
+    def success_count(self, value: int) -> None:
+        self._table._successes[self._row] = value
+
+    @property
+    def habit_strength(self) -> float:
+        return float(self._table._habit[self._row])
+
+    @habit_strength.setter
+    def habit_strength(self, value: float) -> None:
+        self._table._habit[self._row] = value
+
+    @property
+    def last_executed(self) -> float:
+        return float(self._table._last_executed[self._row])
+
+    @last_executed.setter
+    def last_executed(self, value: float) -> None:
+        self._table._last_executed[self._row] = value
+
+    @property
+    def success_rate(self) -> float:
+        """성공률 계산"""
+        executions = self.execution_count
+        if executions == 0:
+            return 0.0
+        return self.success_count / executions
+
+    @property
+    def is_habit(self) -> bool:
+        """습관화 여부 (Action.is_habit 과 같은 임계값)"""
+        return self.habit_strength >= HABIT_THRESHOLD
+
+    def to_action(self) -> Action:
+        """현재 값의 Action 스냅샷"""
+        return Action(
+            name=self.name,
+            context=self.context,
+            q_value=self.q_value,
+            execution_count=self.execution_count,
+            success_count=self.success_count,
+            habit_strength=self.habit_strength,
+            last_executed=self.last_executed,
+        )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ActionView):
+            return self._table is other._table and self._row == other._row
+        if isinstance(other, Action):
+            return self.to_action() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.to_action())
+
+
+class ContextActions(Mapping):
+    """q_table[context] 어댑터: {행동 이름: ActionView}"""
+
+    def __init__(self, table: QTable, context: str):
+        self._table = table
+        self._context = context
+
+    def __getitem__(self, action_name: str) -> ActionView:
+        row = self._table.find(self._context, action_name)
+        if row < 0:
+            raise KeyError(action_name)
+        return self._table.view(row)
+
+    def __setitem__(self, action_name: str, action: Action) -> None:
+        """Action 값을 Q-테이블 행으로 가져오기"""
+        row = self._table.get_or_create(self._context, action_name)
+        view = self._table.view(row)
+        view.q_value = action.q_value
+        view.execution_count = action.execution_count
+        view.success_count = action.success_count
+        view.habit_strength = action.habit_strength
+        view.last_executed = action.last_executed
+
+    def __iter__(self) -> Iterator[str]:
+        table = self._table
+        return (table.action_name_of(row) for row in table.context_rows(self._context))
+
+    def __len__(self) -> int:
+        return len(self._table.context_rows(self._context))
+
+
+class QTableMapping(Mapping):
+    """engine.q_table 어댑터: {context: {행동 이름: ActionView}}"""
+
+    def __init__(self, table: QTable):
+        self._table = table
+
+    def __getitem__(self, context: str) -> ContextActions:
+        # defaultdict 처럼 없는 컨텍스트도 (빈) 뷰를 돌려준다
+        return ContextActions(self._table, context)
+
+    def __contains__(self, context) -> bool:
+        return self._table.has_context(context)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.contexts())
+
+    def __len__(self) -> int:
+        return self._table.num_contexts
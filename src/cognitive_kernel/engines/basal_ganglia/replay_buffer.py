@@ -0,0 +1,112 @@
+"""
+Basal Ganglia Replay Buffer
+기저핵 경험 재생 버퍼 (링 버퍼)
+
+Author: GNJz (Qquarts)
+Version: 1.0.0-alpha
+
+생물학적 모델:
+    수면/휴식 중 해마-선조체 재활성화 (Experience Replay)
+    → 과거 (상황, 행동, 보상, 다음 상황) 경험을 다시 학습
+
+구조:
+    고정 용량 NumPy 배열 링 버퍼. 가득 차면 가장 오래된 경험을 덮어쓴다.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+# (context, action, reward, next_context)
+Transition = Tuple[str, str, float, Optional[str]]
+
+
+class ReplayBuffer:
+    """
+    경험 재생 링 버퍼
+
+    Args:
+        capacity: 최대 경험 수
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = int(capacity)
+        self._contexts = np.empty(self.capacity, dtype=object)
+        self._actions = np.empty(self.capacity, dtype=object)
+        self._rewards = np.zeros(self.capacity, dtype=np.float64)
+        self._next_contexts = np.empty(self.capacity, dtype=object)
+        self._pos = 0      # 다음에 쓸 위치
+        self._size = 0
+
+    def add(self,
+            context: str,
+            action_name: str,
+            reward: float,
+            next_context: Optional[str] = None) -> None:
+        """경험 하나 추가"""
+        pos = self._pos
+        self._contexts[pos] = context
+        self._actions[pos] = action_name
+        self._rewards[pos] = reward
+        self._next_contexts[pos] = next_context
+        self._pos = (pos + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def extend(self, transitions: Iterable[Transition]) -> None:
+        """경험 여러 개 추가 (배열 슬라이스 대입, 용량 초과분은 최근 것만 유지)"""
+        transitions = list(transitions)[-self.capacity:]
+        n = len(transitions)
+        if n == 0:
+            return
+
+        contexts = np.empty(n, dtype=object)
+        actions = np.empty(n, dtype=object)
+        next_contexts = np.empty(n, dtype=object)
+        contexts[:] = [t[0] for t in transitions]
+        actions[:] = [t[1] for t in transitions]
+        next_contexts[:] = [t[3] if len(t) > 3 else None for t in transitions]
+        rewards = np.fromiter((t[2] for t in transitions), dtype=np.float64, count=n)
+
+        # 링 위치 (끝에 닿으면 처음으로 감김)
+        positions = (self._pos + np.arange(n)) % self.capacity
+        self._contexts[positions] = contexts
+        self._actions[positions] = actions
+        self._rewards[positions] = rewards
+        self._next_contexts[positions] = next_contexts
+        self._pos = (self._pos + n) % self.capacity
+        self._size = min(self._size + n, self.capacity)
+
+    def sample(self,
+               batch_size: int,
+               rng: Optional[np.random.Generator] = None) -> List[Transition]:
+        """균등 무작위 샘플 (복원 추출)"""
+        if self._size == 0 or batch_size <= 0:
+            return []
+        rng = rng if rng is not None else np.random.default_rng()
+        return self._gather(rng.integers(0, self._size, size=batch_size))
+
+    def transitions(self) -> List[Transition]:
+        """저장된 경험 (오래된 것부터)"""
+        start = (self._pos - self._size) % self.capacity
+        return self._gather((start + np.arange(self._size)) % self.capacity)
+
+    def clear(self) -> None:
+        self._contexts[:] = None
+        self._actions[:] = None
+        self._next_contexts[:] = None
+        self._pos = 0
+        self._size = 0
+
+    def _gather(self, positions: np.ndarray) -> List[Transition]:
+        return list(zip(
+            self._contexts[positions].tolist(),
+            self._actions[positions].tolist(),
+            self._rewards[positions].tolist(),
+            self._next_contexts[positions].tolist(),
+        ))
+
+    def __len__(self) -> int:
+        return self._size
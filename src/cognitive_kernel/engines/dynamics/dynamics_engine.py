@@ -14,6 +14,8 @@ import math
 import time
 from typing import Dict, List, Optional, Tuple, Any, Union
 
+import numpy as np
+
 from .config import DynamicsConfig
 from .models import DynamicsState
 
@@ -59,6 +61,27 @@ class DynamicsEngine:
         self.state.entropy = entropy
         return entropy
     
+    def calculate_entropy_many(self, probabilities: np.ndarray) -> np.ndarray:
+        """
+        여러 확률 분포의 엔트로피를 한 번에 계산 (행 단위)
+        
+        패딩 칸은 확률 0 으로 채워져 있어야 한다 (0 은 합에서 제외).
+        state.entropy 는 마지막 행의 값으로 갱신된다 (순차 호출과 같은 최종 상태).
+        
+        Args:
+            probabilities: (B, L) 확률 행렬
+            
+        Returns:
+            길이 B 의 엔트로피 배열
+        """
+        probabilities = np.asarray(probabilities, dtype=float)
+        positive = probabilities > 0
+        logs = np.log(np.where(positive, probabilities, 1.0))
+        entropies = -np.sum(np.where(positive, probabilities * logs, 0.0), axis=-1)
+        if entropies.size:
+            self.state.entropy = float(entropies[-1])
+        return entropies
+    
     def calculate_core_strength(
         self,
         memories: List[Dict[str, Any]],
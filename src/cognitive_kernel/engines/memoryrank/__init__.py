@@ -4,6 +4,8 @@ Google PageRank 알고리즘 기반 기억 중요도 랭킹 엔진.
 - 기억 노드 그래프 구성
 - Personalized PageRank 계산
 - 속성 기반 가중치 (recency, emotion, frequency)
+- 희소(CSR) 전이 행렬 모드 (대규모 그래프)
+- 엣지 저장소 (노드 ID 인터닝, NumPy 열, 중복 병합, 노드 제거)
 - 영속성 레이어 (JSON, NumPy)
 
 🔗 장기 기억 지원:
@@ -12,14 +14,18 @@ Google PageRank 알고리즘 기반 기억 중요도 랭킹 엔진.
 """
 
 from .config import MemoryRankConfig
+from .edge_store import EdgeStore
 from .memoryrank_engine import MemoryRankEngine, MemoryNodeAttributes
 from .persistence import MemoryRankPersistence
+from .sparse import SparseTransitionMatrix
 
 __all__ = [
     "MemoryRankConfig",
+    "EdgeStore",
     "MemoryRankEngine",
     "MemoryNodeAttributes",
     "MemoryRankPersistence",
+    "SparseTransitionMatrix",
 ]
 
 __version__ = "1.1.0"
@@ -11,6 +11,7 @@ class MemoryRankConfig:
     - recency_weight / emotion_weight / frequency_weight:
       personalization 벡터를 만들 때 각 feature에 곱해지는 가중치
     - local_weight_boost: 로컬 연결 가중치 부스트 (1.0 = 부스트 없음, >1.0 = 로컬 연결 강화)
+    - sparse: True면 전이 행렬을 CSR 희소 배열로 구성 (메모리 ∝ 엣지 수)
     """
 
     damping: float = 0.85
@@ -22,3 +23,5 @@ class MemoryRankConfig:
     frequency_weight: float = 1.0
     
     local_weight_boost: float = 1.0  # 로컬 연결 가중치 부스트
+
+    sparse: bool = False  # 희소(CSR) 전이 행렬 사용
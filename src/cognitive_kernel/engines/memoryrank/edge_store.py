@@ -0,0 +1,350 @@
+"""
+MemoryRank Edge Store
+기억 그래프 엣지 저장소
+
+(src, dst, weight) 튜플 리스트 대신:
+- 노드 ID 인터닝 (문자열 → 정수 인덱스, 한 번만 저장)
+- NumPy src / dst / weight 열 (용량 두 배씩 증가)
+- 중복 엣지 병합 ((src, dst) 쌍당 슬롯 하나, 양수 가중치 합산)
+- 노드별 인접 오프셋 (CSR, 필요할 때 한 번 구성)
+- 노드 제거 (Panorama 에서 밀려난 기억) → 연결된 엣지 소멸,
+  죽은 슬롯이 쌓이면 압축 → 메모리가 살아 있는 기억 수에 비례
+
+병합해도 MemoryRank 전이 행렬은 같다 (중복 엣지는 어차피 가중치가 합산됨).
+가중치 <= 0 인 엣지는 0 으로 남아 노드만 그래프에 기여한다.
+
+Author: GNJz (Qquarts)
+Version: 1.0.0
+License: MIT License
+"""
+
+import uuid
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+Edge = Tuple[str, str, float]
+
+
+class EdgeStore:
+    """
+    인터닝된 노드 ID + NumPy 열 기반 엣지 저장소
+
+    - add / extend: 엣지 추가 (같은 (src, dst) 는 가중치 합산)
+    - remove_nodes: 노드와 연결된 엣지 제거 (O(k), 압축은 지연)
+    - graph_arrays: MemoryRankEngine.build_graph_arrays 입력 (정렬된 노드 + 인덱스 배열)
+    - neighbors: 노드의 나가는 엣지 (인접 오프셋 조회)
+    - take_pending: 마지막 조회 이후 추가된 원 엣지 (증분 그래프 갱신용)
+
+    Args:
+        capacity: 초기 엣지 슬롯 용량
+    """
+
+    COMPACT_MIN_SLOTS = 1024  # 이보다 작으면 압축하지 않음
+
+    def __init__(self, capacity: int = 1024):
+        self._capacity = max(1, int(capacity))
+        self._epoch = 0
+        self.clear()
+
+    # ------------------------------------------------------------------
+    # 추가
+    # ------------------------------------------------------------------
+    def add(self, src: str, dst: str, weight: float) -> None:
+        """엣지 하나 추가 (이미 있는 (src, dst) 면 양수 가중치를 더함)"""
+        weight = float(weight)
+        s = self._intern(src)
+        d = self._intern(dst)
+        key = (s << 32) | d
+        slot = self._pairs.get(key)
+        if slot is None:
+            slot = self._append_slot(s, d, max(weight, 0.0))
+            self._pairs[key] = slot
+        elif weight > 0:
+            self._w[slot] += weight
+        self._dirty[slot] = None
+        self._adjacency = None
+        self._record_pending((src, dst, weight))
+
+    def extend(self, edges: Iterable[Edge]) -> None:
+        """엣지 여러 개 추가"""
+        for src, dst, weight in edges:
+            self.add(src, dst, weight)
+
+    def load(self, edges: Iterable[Edge]) -> None:
+        """저장된 엣지로 내용 교체"""
+        self.clear()
+        self.extend(edges)
+
+    def clear(self) -> None:
+        """모든 엣지/노드 삭제 (저널 재발급)"""
+        self._names: List[Optional[str]] = []      # 노드 인덱스 → ID (제거되면 None)
+        self._index: Dict[str, int] = {}           # 살아 있는 노드 ID → 인덱스
+        self._alive = np.zeros(64, dtype=bool)
+        self._degree = np.zeros(64, dtype=np.int64)  # 노드에 닿는 슬롯 수
+
+        self._src = np.zeros(self._capacity, dtype=np.int64)
+        self._dst = np.zeros(self._capacity, dtype=np.int64)
+        self._w = np.zeros(self._capacity, dtype=float)
+        self._size = 0                             # 사용 중인 슬롯 수 (죽은 슬롯 포함)
+        self._pairs: Dict[int, int] = {}           # (src << 32 | dst) → 슬롯
+
+        self._dead_nodes = 0
+        self._dead_slots = 0                       # 죽은 슬롯 수 (상한 추정치)
+        self._live: Optional[np.ndarray] = None    # 살아 있는 슬롯 마스크 캐시
+        self._adjacency: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+        self._pending: Optional[List[Edge]] = []   # None 이면 넘침 → 전체 재구축 필요
+        self._epoch += 1
+        self._new_journal()
+
+    # ------------------------------------------------------------------
+    # 제거
+    # ------------------------------------------------------------------
+    def remove_nodes(self, node_ids: Iterable[str]) -> int:
+        """노드와 연결된 엣지 제거
+
+        엣지가 하나라도 사라지면 epoch 가 증가한다 (그래프 전체 재구축 필요).
+        죽은 슬롯이 전체의 절반을 넘으면 열을 압축한다.
+
+        Returns:
+            제거된 노드 수
+        """
+        removed = 0
+        lost = 0
+        for nid in node_ids:
+            idx = self._index.pop(nid, None)
+            if idx is None:
+                continue
+            self._alive[idx] = False
+            self._names[idx] = None
+            lost += int(self._degree[idx])
+            removed += 1
+        if not removed:
+            return 0
+
+        self._dead_nodes += removed
+        self._dead_slots += lost
+        self._live = None
+        if lost:
+            self._bump_epoch()
+        if self._size >= self.COMPACT_MIN_SLOTS and (
+            2 * self._dead_slots > self._size or 2 * self._dead_nodes > len(self._names)
+        ):
+            self.compact()
+        return removed
+
+    def compact(self) -> None:
+        """죽은 슬롯/노드를 버리고 열과 인덱스를 다시 채번"""
+        live = self._live_mask()
+        src = self._src[:self._size][live]
+        dst = self._dst[:self._size][live]
+        w = self._w[:self._size][live]
+
+        used = np.flatnonzero(self._alive[:len(self._names)])
+        remap = np.full(len(self._names), -1, dtype=np.int64)
+        remap[used] = np.arange(len(used), dtype=np.int64)
+        src = remap[src]
+        dst = remap[dst]
+
+        names = self._names
+        self._names = [names[i] for i in used.tolist()]
+        self._index = {nid: i for i, nid in enumerate(self._names)}
+        n_nodes = len(self._names)
+        self._alive = np.ones(max(64, n_nodes), dtype=bool)
+        self._alive[n_nodes:] = False
+        self._degree = np.zeros(len(self._alive), dtype=np.int64)
+        self._degree[:n_nodes] = np.bincount(src, minlength=n_nodes)
+        self._degree[:n_nodes] += np.bincount(dst[dst != src], minlength=n_nodes)
+
+        n = len(w)
+        capacity = max(self._capacity, 2 * n)
+        self._src = np.zeros(capacity, dtype=np.int64)
+        self._dst = np.zeros(capacity, dtype=np.int64)
+        self._w = np.zeros(capacity, dtype=float)
+        self._src[:n] = src
+        self._dst[:n] = dst
+        self._w[:n] = w
+        self._size = n
+        self._pairs = dict(zip(((src << 32) | dst).tolist(), range(n)))
+
+        self._dead_nodes = 0
+        self._dead_slots = 0
+        self._bump_epoch()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @property
+    def epoch(self) -> int:
+        """엣지가 사라질 때마다 (제거/압축/clear) 증가 → 그래프 재구축 판단용"""
+        return self._epoch
+
+    def graph_arrays(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """살아 있는 엣지 → (정렬된 노드 ID, src 인덱스, dst 인덱스, 가중치)
+
+        노드 순서는 build_graph 와 같이 ID 정렬 순서.
+        """
+        live = self._live_mask()
+        src = self._src[:self._size][live]
+        dst = self._dst[:self._size][live]
+        w = self._w[:self._size][live]
+
+        used = np.flatnonzero(
+            np.bincount(src, minlength=len(self._names))
+            + np.bincount(dst, minlength=len(self._names))
+        )
+        names = self._names
+        node_ids = [names[i] for i in used.tolist()]
+        order = sorted(range(len(node_ids)), key=node_ids.__getitem__)
+        remap = np.zeros(len(names), dtype=np.int64)
+        remap[used[order]] = np.arange(len(order), dtype=np.int64)
+        return [node_ids[i] for i in order], remap[src], remap[dst], w
+
+    def neighbors(self, node_id: str) -> List[Tuple[str, float]]:
+        """노드에서 나가는 살아 있는 엣지 [(dst_id, weight)] (삽입 순서)"""
+        idx = self._index.get(node_id)
+        if idx is None:
+            return []
+        offsets, dst, w = self.adjacency()
+        lo, hi = int(offsets[idx]), int(offsets[idx + 1])
+        names = self._names
+        return [(names[d], weight) for d, weight in zip(dst[lo:hi].tolist(), w[lo:hi].tolist())]
+
+    def adjacency(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """노드별 인접 오프셋 (CSR): out-edge 는 dst[offsets[i]:offsets[i+1]]"""
+        if self._adjacency is None:
+            live = self._live_mask()
+            src = self._src[:self._size][live]
+            order = np.argsort(src, kind="stable")
+            offsets = np.zeros(len(self._names) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(src, minlength=len(self._names)), out=offsets[1:])
+            self._adjacency = (
+                offsets,
+                self._dst[:self._size][live][order],
+                self._w[:self._size][live][order],
+            )
+        return self._adjacency
+
+    def take_pending(self) -> Optional[List[Edge]]:
+        """마지막 호출 이후 추가된 원 엣지 (넘쳤으면 None → 전체 재구축)"""
+        pending = self._pending
+        self._pending = []
+        return pending
+
+    def to_list(self) -> List[Edge]:
+        """살아 있는 (병합된) 엣지 리스트 (슬롯 순서)"""
+        return list(self)
+
+    def __iter__(self) -> Iterator[Edge]:
+        live = self._live_mask()
+        names = self._names
+        src = self._src[:self._size][live].tolist()
+        dst = self._dst[:self._size][live].tolist()
+        w = self._w[:self._size][live].tolist()
+        return ((names[s], names[d], weight) for s, d, weight in zip(src, dst, w))
+
+    def __len__(self) -> int:
+        """살아 있는 (병합된) 엣지 수"""
+        return int(np.count_nonzero(self._live_mask()))
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    @property
+    def node_count(self) -> int:
+        """살아 있는 노드 수"""
+        return len(self._index)
+
+    # ------------------------------------------------------------------
+    # 증분 영속성 (SQLite 슬롯 단위 upsert)
+    # ------------------------------------------------------------------
+    # 저장소는 journal_id 를 기록해 두고, 같으면 dirty_rows() 만 upsert 한다.
+    # 엣지 소멸/압축/clear 때 journal_id 가 바뀌므로 그때는 전체 재기록.
+
+    @property
+    def journal_id(self) -> str:
+        """슬롯 배치 식별자 (엣지가 사라지면 새로 발급)"""
+        return self._journal_id
+
+    def rows(self) -> List[Tuple[int, str, str, float]]:
+        """살아 있는 엣지 [(slot, src, dst, weight)]"""
+        return self._rows(np.flatnonzero(self._live_mask()))
+
+    def dirty_rows(self) -> List[Tuple[int, str, str, float]]:
+        """mark_clean 이후 추가/가중치 변경된 슬롯"""
+        slots = np.fromiter(self._dirty, dtype=np.int64, count=len(self._dirty))
+        return self._rows(slots[self._live_mask()[slots]])
+
+    def mark_clean(self) -> None:
+        """저장 완료 후 호출"""
+        self._dirty.clear()
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    def _intern(self, node_id: str) -> int:
+        idx = self._index.get(node_id)
+        if idx is None:
+            idx = len(self._names)
+            if idx == len(self._alive):
+                self._alive = np.concatenate([self._alive, np.zeros(idx, dtype=bool)])
+                self._degree = np.concatenate([self._degree, np.zeros(idx, dtype=np.int64)])
+            self._names.append(node_id)
+            self._index[node_id] = idx
+            self._alive[idx] = True
+        return idx
+
+    def _append_slot(self, s: int, d: int, weight: float) -> int:
+        slot = self._size
+        if slot == len(self._w):
+            self._src = np.concatenate([self._src, np.zeros(slot, dtype=np.int64)])
+            self._dst = np.concatenate([self._dst, np.zeros(slot, dtype=np.int64)])
+            self._w = np.concatenate([self._w, np.zeros(slot, dtype=float)])
+        self._src[slot] = s
+        self._dst[slot] = d
+        self._w[slot] = weight
+        self._size = slot + 1
+        self._degree[s] += 1
+        if d != s:
+            self._degree[d] += 1
+        self._live = None
+        return slot
+
+    def _live_mask(self) -> np.ndarray:
+        if self._live is None or len(self._live) != self._size:
+            alive = self._alive
+            self._live = alive[self._src[:self._size]] & alive[self._dst[:self._size]]
+        return self._live
+
+    def _rows(self, slots: np.ndarray) -> List[Tuple[int, str, str, float]]:
+        names = self._names
+        return [
+            (slot, names[s], names[d], weight)
+            for slot, s, d, weight in zip(
+                slots.tolist(),
+                self._src[slots].tolist(),
+                self._dst[slots].tolist(),
+                self._w[slots].tolist(),
+            )
+        ]
+
+    def _record_pending(self, edge: Edge) -> None:
+        pending = self._pending
+        if pending is None:
+            return
+        pending.append(edge)
+        # 아무도 가져가지 않아 너무 커지면 버린다 (다음 갱신은 전체 재구축)
+        if len(pending) > max(self.COMPACT_MIN_SLOTS, 2 * self._size):
+            self._pending = None
+
+    def _bump_epoch(self) -> None:
+        self._epoch += 1
+        self._live = None
+        self._adjacency = None
+        self._pending = None
+        self._new_journal()
+
+    def _new_journal(self) -> None:
+        self._journal_id = str(uuid.uuid4())
+        self._dirty: Dict[int, None] = {}
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional, Iterable
+from typing import Dict, List, Tuple, Optional, Iterable, Sequence
 
 import numpy as np
 
 from .config import MemoryRankConfig
+from .sparse import SparseTransitionMatrix
 
 
 @dataclass
@@ -35,21 +36,42 @@ class MemoryRankEngine:
     - 내부 표현:
         * 노드 id ↔ index 매핑
         * 열 정규화된 전이 행렬 M (N x N)
+          - config.sparse=True 이면 CSR 희소 행렬 (메모리 ∝ 엣지 수)
         * personalization vector v (N)
 
+    - 증분 업데이트:
+        * add_nodes / add_edges / update_personalization / decay_recency
+        * set_node_features: 속성을 (N, 4) 배열로 직접 전달 (벡터화)
+        * 기존 인덱스 매핑 유지, 이전 랭크 벡터에서 warm-start
+
     - 출력:
         * {node_id: rank_score} 딕셔너리
-        * get_top_memories(n) 로 상위 n개 조회
+        * get_top_memories(n) 로 상위 n개 조회 (argpartition 부분 정렬, 캐시)
+        * get_top_memories_batch(ks) 로 여러 k 를 한 번에 조회
     """
 
     def __init__(self, config: Optional[MemoryRankConfig] = None):
         self.config = config or MemoryRankConfig()
         self._id_to_index: Dict[str, int] = {}
-        self._index_to_id: List[str] = []
+        self._index_to_id: List[str] = []  # load_npy(mmap) 직후에는 읽기 전용 문자열 배열
         self._M: Optional[np.ndarray] = None  # transition matrix
+        self._M_sparse: Optional[SparseTransitionMatrix] = None  # sparse transition matrix
         self._v: Optional[np.ndarray] = None  # personalization vector
         self._r: Optional[np.ndarray] = None  # latest rank vector
 
+        # 증분 업데이트용 상태
+        self._edge_src: Optional[np.ndarray] = None  # 원 가중치 엣지 (COO)
+        self._edge_dst: Optional[np.ndarray] = None
+        self._edge_w: Optional[np.ndarray] = None
+        self._col_sums: Optional[np.ndarray] = None  # 열(src)별 원 가중치 합 (증분 재정규화용)
+        self._features: Optional[np.ndarray] = None  # (N, 4) recency/emotion/frequency/base
+        self._has_features: Optional[np.ndarray] = None  # 속성이 주어진 노드 마스크
+        self._r_warm: Optional[np.ndarray] = None  # warm-start 용 이전 랭크 벡터
+
+        # Top-k 캐시: 랭크 벡터 객체가 바뀌면(재계산/로드) 무효
+        self._top_r: Optional[np.ndarray] = None
+        self._top_idx: np.ndarray = np.zeros(0, dtype=np.int64)
+
     # ------------------------------------------------------------------
     # 그래프 구성
     # ------------------------------------------------------------------
@@ -68,6 +90,8 @@ class MemoryRankEngine:
             각 노드별 MemoryNodeAttributes
             없으면 균등한 베이스 중요도를 사용
         """
+        edges = list(edges)
+
         # 노드 수집
         node_ids: Dict[str, None] = {}
         for s, d, _ in edges:
@@ -77,47 +101,399 @@ class MemoryRankEngine:
         self._index_to_id = sorted(node_ids.keys())
         self._id_to_index = {nid: i for i, nid in enumerate(self._index_to_id)}
         n = len(self._index_to_id)
-        if n == 0:
-            self._M = None
-            self._v = None
+
+        self._features = np.zeros((n, 4), dtype=float)
+        self._has_features = np.zeros(n, dtype=bool)
+        self._edge_src, self._edge_dst, self._edge_w = self._edge_arrays(edges, node_attributes)
+        self._r_warm = None
+
+        self._rebuild_transition()
+
+        # personalization vector v 생성
+        self._v = self._build_personalization_vector(node_attributes) if n > 0 else None
+
+        # 기존 rank는 무효화
+        self._r = None
+
+    def build_graph_arrays(
+        self,
+        node_ids: Sequence[str],
+        src: np.ndarray,
+        dst: np.ndarray,
+        weights: np.ndarray,
+    ) -> None:
+        """인덱스 배열로 메모리 그래프를 구성한다 (엣지 단위 파이썬 루프 없음).
+
+        node_ids:
+            노드 id (인덱스 순서)
+        src, dst:
+            node_ids 인덱스 배열
+        weights:
+            원 가중치 (weight <= 0 제외, 로컬 연결 부스트 적용)
+
+        노드 속성은 set_node_features 로 따로 전달한다.
+        """
+        self._index_to_id = list(node_ids)
+        self._id_to_index = {nid: i for i, nid in enumerate(self._index_to_id)}
+        n = len(self._index_to_id)
+
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weights = np.asarray(weights, dtype=float)
+        keep = weights > 0
+        weights = weights[keep]
+        # _is_local_connection 이 모든 연결을 로컬로 보므로 부스트는 일괄 적용
+        if self.config.local_weight_boost > 1.0:
+            weights = weights * self.config.local_weight_boost
+
+        self._features = np.zeros((n, 4), dtype=float)
+        self._has_features = np.zeros(n, dtype=bool)
+        self._edge_src, self._edge_dst, self._edge_w = src[keep], dst[keep], weights
+        self._r_warm = None
+
+        self._rebuild_transition()
+        self._v = self._build_personalization_vector() if n > 0 else None
+        self._r = None
+
+    # ------------------------------------------------------------------
+    # 증분 업데이트 (전체 재구성 없이 노드/엣지/속성 추가)
+    # ------------------------------------------------------------------
+    def add_nodes(
+        self,
+        node_ids: Iterable[str],
+        node_attributes: Optional[Dict[str, MemoryNodeAttributes]] = None,
+    ) -> int:
+        """새 노드를 추가한다 (기존 인덱스 매핑 유지).
+
+        새 노드는 인덱스 끝에 붙고, 엣지가 없으면 dangling 노드가 된다.
+
+        Returns:
+            실제로 추가된 노드 수
+        """
+        self._ensure_incremental_state()
+        added = self._append_nodes(node_ids)
+        if node_attributes:
+            self._set_features(node_attributes)
+        if added:
+            empty = np.zeros(0, dtype=np.int64)
+            self._add_edge_arrays(empty, empty, np.zeros(0, dtype=float))
+        if added or node_attributes:
+            self._refresh(rebuild_matrix=False)
+        return added
+
+    def add_edges(
+        self,
+        edges: Iterable[Tuple[str, str, float]],
+        node_attributes: Optional[Dict[str, MemoryNodeAttributes]] = None,
+    ) -> int:
+        """엣지를 추가한다 (처음 보는 노드는 자동 추가).
+
+        전이 행렬은 제자리에서 갱신되고 (새 엣지가 닿은 src 열만 재정규화),
+        다음 calculate_importance() 는 이전 랭크 벡터에서 warm-start 한다.
+
+        Returns:
+            추가된 엣지 수 (weight <= 0 제외)
+        """
+        edges = list(edges)
+        self._ensure_incremental_state()
+
+        node_ids: Dict[str, None] = {}
+        for s, d, _ in edges:
+            node_ids[s] = None
+            node_ids[d] = None
+        self._append_nodes(node_ids)
+        if node_attributes:
+            self._set_features(node_attributes)
+
+        src, dst, w = self._edge_arrays(edges, node_attributes)
+        self._add_edge_arrays(src, dst, w)
+
+        self._refresh(rebuild_matrix=False)
+        return int(len(w))
+
+    def update_personalization(
+        self,
+        node_attributes: Dict[str, MemoryNodeAttributes],
+    ) -> None:
+        """주어진 노드들의 속성만 갱신하고 personalization vector 를 다시 만든다.
+
+        그래프에 없는 노드 id 는 무시한다.
+        """
+        self._ensure_incremental_state()
+        self._set_features(node_attributes)
+        self._refresh(rebuild_matrix=False)
+
+    def set_node_features(
+        self,
+        features: np.ndarray,
+        has_features: Optional[np.ndarray] = None,
+    ) -> None:
+        """노드 속성을 배열로 한 번에 설정한다 (벡터화 경로).
+
+        features:
+            (N, 4) 배열, 열 순서 = recency, emotion, frequency, base_importance
+            행 순서 = get_node_ids() 순서
+        has_features:
+            속성이 유효한 노드 마스크 (False 인 노드는 raw score 1.0)
+        """
+        self._ensure_incremental_state()
+        n = len(self._index_to_id)
+        features = np.asarray(features, dtype=float)
+        if features.shape != (n, 4):
+            raise ValueError(f"features shape must be ({n}, 4), got {features.shape}")
+
+        self._features = features.copy()
+        if has_features is None:
+            self._has_features = np.ones(n, dtype=bool)
+        else:
+            self._has_features = np.asarray(has_features, dtype=bool).copy()
+        self._refresh(rebuild_matrix=False)
+
+    def get_node_ids(self) -> List[str]:
+        """노드 id 목록 (인덱스 순서)."""
+        self._ensure_id_table()
+        return list(self._index_to_id)
+
+    def decay_recency(self, factor: float) -> None:
+        """모든 노드의 recency 에 같은 감쇠 계수를 곱한다.
+
+        recency = exp(-λ·Δt) 이므로 시간이 dt 흐르면 exp(-λ·dt) 를 곱하는 것과 같다.
+        """
+        self._ensure_incremental_state()
+        if self._features is None or len(self._features) == 0:
+            return
+        self._features[:, 0] *= float(factor)
+        self._refresh(rebuild_matrix=False)
+
+    def _append_nodes(self, node_ids: Iterable[str]) -> int:
+        """처음 보는 노드 id 를 인덱스 끝에 추가."""
+        new_ids = [nid for nid in dict.fromkeys(node_ids) if nid not in self._id_to_index]
+        if not new_ids:
+            return 0
+
+        start = len(self._index_to_id)
+        for offset, nid in enumerate(new_ids):
+            self._id_to_index[nid] = start + offset
+        self._index_to_id.extend(new_ids)
+
+        k = len(new_ids)
+        self._features = np.concatenate([self._features, np.zeros((k, 4), dtype=float)])
+        self._has_features = np.concatenate([self._has_features, np.zeros(k, dtype=bool)])
+
+        # warm-start 벡터도 새 노드만큼 확장 (균등 질량)
+        r_prev = self._r if self._r is not None else self._r_warm
+        if r_prev is not None and len(r_prev) == start:
+            n = start + k
+            self._r_warm = np.concatenate([r_prev, np.full(k, 1.0 / n)])
             self._r = None
+        return k
+
+    def _refresh(self, rebuild_matrix: bool) -> None:
+        """증분 변경 후 전이 행렬 / v 갱신, 랭크는 warm-start 용으로 보관."""
+        if rebuild_matrix:
+            self._rebuild_transition()
+        self._v = self._build_personalization_vector() if self._index_to_id else None
+
+        if self._r is not None:
+            self._r_warm = self._r
+        self._r = None
+
+    def _ensure_incremental_state(self) -> None:
+        """증분 상태가 없으면 (로드된 그래프 등) 현재 행렬/벡터에서 복원한다.
+
+        로드된 그래프는 정규화된 전이 확률을 원 가중치로,
+        personalization v 를 베이스 중요도로 사용한다.
+        """
+        self._ensure_id_table()
+        if self._features is not None and self._edge_src is not None:
             return
 
-        # 가중치 행렬 W[i, j] = j -> i 로의 weight
-        W = np.zeros((n, n), dtype=float)
+        n = len(self._index_to_id)
+        if self._M_sparse is not None:
+            src = self._M_sparse.indices
+            dst = self._M_sparse.row_ids()
+            w = self._M_sparse.data
+        elif self._M is not None:
+            dst, src = np.nonzero(self._M)
+            w = self._M[dst, src]
+        else:
+            src = dst = np.zeros(0, dtype=np.int64)
+            w = np.zeros(0, dtype=float)
+        self._edge_src = np.asarray(src, dtype=np.int64)
+        self._edge_dst = np.asarray(dst, dtype=np.int64)
+        self._edge_w = np.asarray(w, dtype=float)
+
+        self._features = np.zeros((n, 4), dtype=float)
+        self._has_features = np.zeros(n, dtype=bool)
+        if self._v is not None and len(self._v) == n:
+            self._features[:, 3] = self._v * n
+            self._has_features[:] = True
+
+    def _ensure_id_table(self) -> None:
+        """메모리 맵으로 연 노드 id 배열을 list / dict 매핑으로 변환.
+
+        mmap 로드는 Top-k 조회만으로는 전체 id 테이블을 만들지 않으므로,
+        id → 인덱스 매핑이 필요한 연산 직전에 한 번만 변환한다.
+        """
+        if isinstance(self._index_to_id, np.ndarray):
+            self._index_to_id = self._index_to_id.tolist()
+            self._id_to_index = {nid: i for i, nid in enumerate(self._index_to_id)}
+
+    def _reset_incremental_state(self) -> None:
+        """증분 상태 폐기 (영속성 레이어에서 그래프를 직접 로드한 뒤 호출)."""
+        self._edge_src = None
+        self._edge_dst = None
+        self._edge_w = None
+        self._col_sums = None
+        self._features = None
+        self._has_features = None
+        self._r_warm = None
+
+    def _set_features(self, node_attributes: Dict[str, MemoryNodeAttributes]) -> None:
+        """노드 속성을 feature 열에 기록 (그래프에 없는 노드는 무시)."""
+        for nid, attrs in node_attributes.items():
+            idx = self._id_to_index.get(nid)
+            if idx is None or attrs is None:
+                continue
+            self._features[idx] = (
+                attrs.recency,
+                attrs.emotion,
+                attrs.frequency,
+                attrs.base_importance,
+            )
+            self._has_features[idx] = True
+
+    def _edge_arrays(
+        self,
+        edges: List[Tuple[str, str, float]],
+        node_attributes: Optional[Dict[str, MemoryNodeAttributes]],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """엣지 리스트 → (src_idx, dst_idx, weight) 배열 (weight <= 0 제외)."""
+        id_to_index = self._id_to_index
+
+        src_idx: List[int] = []
+        dst_idx: List[int] = []
+        weights: List[float] = []
         for src, dst, w in edges:
             if w <= 0:
                 continue
-            if src not in self._id_to_index or dst not in self._id_to_index:
+            if src not in id_to_index or dst not in id_to_index:
                 continue
-            i = self._id_to_index[dst]
-            j = self._id_to_index[src]
-            
-            base_weight = float(w)
-            
-            # 로컬 연결 강화 (local_weight_boost)
-            if self.config.local_weight_boost > 1.0:
-                if self._is_local_connection(src, dst, node_attributes):
-                    base_weight *= self.config.local_weight_boost
-            
-            W[i, j] += base_weight
+            src_idx.append(id_to_index[src])
+            dst_idx.append(id_to_index[dst])
+            weights.append(self._edge_weight(src, dst, w, node_attributes))
+
+        return (
+            np.array(src_idx, dtype=np.int64),
+            np.array(dst_idx, dtype=np.int64),
+            np.array(weights, dtype=float),
+        )
+
+    def _edge_weight(
+        self,
+        src: str,
+        dst: str,
+        w: float,
+        node_attributes: Optional[Dict[str, MemoryNodeAttributes]],
+    ) -> float:
+        """엣지 가중치 (로컬 연결 부스트 적용)."""
+        base_weight = float(w)
+
+        # 로컬 연결 강화 (local_weight_boost)
+        if self.config.local_weight_boost > 1.0:
+            if self._is_local_connection(src, dst, node_attributes):
+                base_weight *= self.config.local_weight_boost
+
+        return base_weight
+
+    def _add_edge_arrays(self, src: np.ndarray, dst: np.ndarray, w: np.ndarray) -> None:
+        """원 가중치 엣지 (인덱스 배열) 누적 + 전이 행렬 제자리 갱신.
+
+        노드가 늘었으면 행렬을 키우고 (새 열은 dangling),
+        새 엣지가 닿은 src 열만 old_sum / new_sum 으로 재정규화한다.
+        전체 엣지 재정렬이나 N² 재계산은 하지 않는다.
+        """
+        n = len(self._index_to_id)
+        col_sums = self._column_sums(n)
+        self._edge_src = np.concatenate([self._edge_src, src])
+        self._edge_dst = np.concatenate([self._edge_dst, dst])
+        self._edge_w = np.concatenate([self._edge_w, w])
+
+        if n == 0 or not self.has_graph():
+            self._rebuild_transition()
+        elif self._M_sparse is not None:
+            self._M_sparse.grow(n)
+            self._col_sums = self._M_sparse.add_edges(src, dst, w, col_sums)
+        else:
+            self._col_sums = self._dense_add_edges(src, dst, w, col_sums)
+
+    def _column_sums(self, n: int) -> np.ndarray:
+        """열별 원 가중치 합 (길이 n, 새 노드는 0)."""
+        sums = self._col_sums
+        if sums is None:
+            sums = np.bincount(self._edge_src, weights=self._edge_w, minlength=n).astype(float)
+        elif len(sums) < n:
+            sums = np.concatenate([sums, np.zeros(n - len(sums), dtype=float)])
+        return sums
+
+    def _dense_add_edges(
+        self,
+        src: np.ndarray,
+        dst: np.ndarray,
+        w: np.ndarray,
+        col_sums: np.ndarray,
+    ) -> np.ndarray:
+        """밀집 전이 행렬 제자리 갱신 (닿은 열만), 추가 후 열 합 반환."""
+        n = len(self._index_to_id)
+        M = self._M
+        n_old = M.shape[0]
+        if n > n_old:
+            grown = np.zeros((n, n), dtype=float)
+            grown[:n_old, :n_old] = M
+            # dangling 열 (새 노드 포함) 은 1/n 균등 분포
+            grown[:, np.flatnonzero(col_sums <= 0.0)] = 1.0 / n
+            M = self._M = grown
+        elif not M.flags.writeable:
+            M = self._M = M.copy()  # 메모리 맵 (읽기 전용)
+
+        new_sums = col_sums.copy()
+        np.add.at(new_sums, src, w)
+        if len(src):
+            touched = np.unique(src)
+            old = col_sums[touched]
+            raw = M[:, touched] * np.where(old > 0.0, old, 0.0)
+            np.add.at(raw, (dst, np.searchsorted(touched, src)), w)
+            M[:, touched] = raw / new_sums[touched]
+        return new_sums
+
+    def _rebuild_transition(self) -> None:
+        """누적된 원 가중치 엣지에서 전이 행렬을 (다시) 만든다."""
+        n = len(self._index_to_id)
+        self._M = None
+        self._M_sparse = None
+        self._col_sums = None
+        if n == 0:
+            return
+        self._col_sums = np.bincount(self._edge_src, weights=self._edge_w, minlength=n).astype(float)
+
+        if self.config.sparse:
+            # dangling 열은 채우지 않고 SparseTransitionMatrix 가 rank-1 보정으로 처리
+            self._M_sparse = SparseTransitionMatrix.from_edges(
+                self._edge_src, self._edge_dst, self._edge_w, n,
+            )
+            return
+
+        # 가중치 행렬 W[i, j] = j -> i 로의 weight
+        W = np.zeros((n, n), dtype=float)
+        np.add.at(W, (self._edge_dst, self._edge_src), self._edge_w)
 
         # 열 정규화 → 전이 행렬 M
+        # out-degree 0이면 모든 노드로 균등 분포
         col_sums = W.sum(axis=0)
-        M = np.zeros_like(W)
-        for j in range(n):
-            if col_sums[j] > 0:
-                M[:, j] = W[:, j] / col_sums[j]
-            else:
-                # out-degree 0이면 모든 노드로 균등 분포
-                M[:, j] = 1.0 / n
+        has_out = col_sums > 0
+        M = np.full((n, n), 1.0 / n)
+        M[:, has_out] = W[:, has_out] / col_sums[has_out]
         self._M = M
-
-        # personalization vector v 생성
-        self._v = self._build_personalization_vector(node_attributes)
-
-        # 기존 rank는 무효화
-        self._r = None
     
     def _is_local_connection(
         self,
@@ -151,59 +527,78 @@ class MemoryRankEngine:
 
     def _build_personalization_vector(
         self,
-        node_attributes: Optional[Dict[str, MemoryNodeAttributes]],
+        node_attributes: Optional[Dict[str, MemoryNodeAttributes]] = None,
     ) -> np.ndarray:
-        """노드 속성을 이용해 personalization vector v 를 만든다."""
+        """노드 속성을 이용해 personalization vector v 를 만든다.
+
+        node_attributes 가 주어지면 feature 열에 먼저 기록한다.
+        속성이 없는 노드는 raw score 1.0 (균등) 으로 취급.
+        """
         n = len(self._index_to_id)
         if n == 0:
             return np.zeros(0, dtype=float)
 
-        if node_attributes is None:
-            return np.ones(n, dtype=float) / float(n)
+        if node_attributes is not None:
+            self._set_features(node_attributes)
 
         cfg = self.config
-        raw = np.zeros(n, dtype=float)
-
-        for idx, nid in enumerate(self._index_to_id):
-            attrs = node_attributes.get(nid)
-            if attrs is None:
-                raw[idx] = 1.0
-                continue
-
-            score = (
-                cfg.recency_weight * max(attrs.recency, 0.0)
-                + cfg.emotion_weight * max(attrs.emotion, 0.0)
-                + cfg.frequency_weight * max(attrs.frequency, 0.0)
-                + max(attrs.base_importance, 0.0)
-            )
-            raw[idx] = score if score > 0.0 else 1.0
+        weights = np.array([
+            cfg.recency_weight,
+            cfg.emotion_weight,
+            cfg.frequency_weight,
+            1.0,
+        ])
+        score = np.maximum(self._features, 0.0) @ weights
+        raw = np.where(self._has_features & (score > 0.0), score, 1.0)
 
         total = float(raw.sum())
         if total == 0.0:
             return np.ones(n, dtype=float) / float(n)
         return raw / total
 
+    def has_graph(self) -> bool:
+        """전이 행렬(밀집 또는 희소)이 구성되어 있는지 여부."""
+        return self._M is not None or self._M_sparse is not None
+
     # ------------------------------------------------------------------
     # 랭크 계산
     # ------------------------------------------------------------------
-    def calculate_importance(self) -> Dict[str, float]:
+    def calculate_importance(self, warm_start: bool = True) -> Dict[str, float]:
         """PageRank 반복을 통해 메모리 중요도 점수를 계산한다.
 
+        warm_start:
+            True면 증분 업데이트 이전의 랭크 벡터에서 반복을 시작한다
+            (build_graph 직후에는 균등 벡터에서 시작)
+
         반환:
             {node_id: rank_score} (합 ≈ 1.0)
         """
-        if self._M is None or self._v is None:
+        r = self.compute_rank_vector(warm_start)
+        self._ensure_id_table()
+        return {nid: float(score) for nid, score in zip(self._index_to_id, r)}
+
+    def compute_rank_vector(self, warm_start: bool = True) -> np.ndarray:
+        """calculate_importance() 와 같지만 딕셔너리 없이 랭크 배열만 반환.
+
+        대규모 그래프에서 Top-k 만 필요할 때 사용 (인덱스 순서 = get_node_ids()).
+        """
+        if not self.has_graph() or self._v is None:
             raise RuntimeError("Graph is not built. call build_graph() first.")
 
-        n = self._M.shape[0]
+        M = self._M_sparse if self._M_sparse is not None else self._M
+        n = M.shape[0]
         if n == 0:
-            return {}
+            return np.zeros(0, dtype=float)
 
         r = np.ones(n, dtype=float) / float(n)
+        if warm_start and self._r_warm is not None and len(self._r_warm) == n:
+            warm_sum = float(self._r_warm.sum())
+            if warm_sum > 0.0:
+                r = self._r_warm / warm_sum
         alpha = float(self.config.damping)
 
         for _ in range(self.config.max_iter):
-            r_next = alpha * (self._M @ r) + (1.0 - alpha) * self._v
+            r_next = alpha * (M @ r) + (1.0 - alpha) * self._v
             if np.linalg.norm(r_next - r, 1) < self.config.tol:
                 r = r_next
                 break
@@ -214,31 +609,65 @@ class MemoryRankEngine:
             r = r / r_sum
 
         self._r = r
-        return {nid: float(score) for nid, score in zip(self._index_to_id, r)}
+        self._r_warm = None
+        return r
 
     def get_top_memories(self, k: int = 10) -> List[Tuple[str, float]]:
         """중요도 상위 k개의 (node_id, score) 리스트를 내림차순으로 반환."""
         if self._r is None:
-            self.calculate_importance()
+            self.compute_rank_vector()
 
         assert self._r is not None
-        n = len(self._r)
-        k = max(0, min(k, n))
-        if k == 0:
-            return []
-
-        idx_sorted = np.argsort(-self._r)[:k]
+        r = self._r
         return [
-            (self._index_to_id[i], float(self._r[i]))
-            for i in idx_sorted
+            (str(self._index_to_id[i]), float(r[i]))
+            for i in self._top_indices(k).tolist()
         ]
 
+    def get_top_memories_batch(self, ks: Iterable[int]) -> Dict[int, List[Tuple[str, float]]]:
+        """여러 k 에 대한 Top-k 를 한 번의 부분 정렬로 반환.
+
+        Returns:
+            {k: [(node_id, score), ...]} (각 리스트는 내림차순)
+        """
+        ks = list(ks)
+        if not ks:
+            return {}
+        top = self.get_top_memories(max(ks))
+        return {k: top[:max(0, k)] for k in ks}
+
+    def _top_indices(self, k: int) -> np.ndarray:
+        """랭크 내림차순 상위 k개 인덱스.
+
+        전체 argsort 대신 argpartition 으로 k개만 고른 뒤 그 안에서만 정렬한다.
+        결과는 랭크 벡터별로 캐시되며, 더 작은 k 는 캐시의 앞부분을 그대로 쓴다.
+        """
+        r = self._r
+        n = len(r)
+        k = max(0, min(int(k), n))
+
+        if self._top_r is not r:
+            self._top_r = r
+            self._top_idx = np.zeros(0, dtype=np.int64)
+
+        if k > len(self._top_idx):
+            neg = -np.asarray(r)
+            if k == n:
+                idx = np.argsort(neg, kind="stable")
+            else:
+                part = np.argpartition(neg, k - 1)[:k]
+                idx = part[np.argsort(neg[part], kind="stable")]
+            self._top_idx = idx
+
+        return self._top_idx[:k]
+
     def get_rank_vector(self) -> Dict[str, float]:
         """마지막으로 계산된 랭크 벡터를 그대로 반환."""
         if self._r is None:
-            self.calculate_importance()
+            self.compute_rank_vector()
 
         assert self._r is not None
+        self._ensure_id_table()
         return {nid: float(score) for nid, score in zip(self._index_to_id, self._r)}
 
     # ------------------------------------------------------------------
@@ -294,3 +723,33 @@ class MemoryRankEngine:
         """
         from .persistence import load_from_npz as _load
         return _load(self, path)
+    
+    def save_to_npy(self, path: str) -> Dict[str, int]:
+        """그래프와 랭크 벡터를 비압축 .npy 디렉터리로 저장
+        
+        load_from_npy(mmap=True) 로 메모리 맵 로드가 가능한 포맷.
+        
+        Args:
+            path: 저장 디렉터리
+            
+        Returns:
+            {"nodes": 노드 수}
+        """
+        from .persistence import save_to_npy as _save
+        return _save(self, path)
+    
+    def load_from_npy(self, path: str, mmap: bool = True) -> Dict[str, int]:
+        """.npy 디렉터리에서 그래프와 랭크 벡터 로드
+        
+        mmap=True 면 배열을 복사하지 않고 읽기 전용 메모리 맵으로 연다
+        (같은 파일을 여러 프로세스가 페이지 캐시로 공유).
+        
+        Args:
+            path: 저장 디렉터리
+            mmap: 메모리 맵 사용 여부
+            
+        Returns:
+            {"nodes": 노드 수}
+        """
+        from .persistence import load_from_npy as _load
+        return _load(self, path, mmap)
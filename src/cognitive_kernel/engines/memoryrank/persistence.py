@@ -1,7 +1,8 @@
 """MemoryRank Persistence Layer v1.0
 
 영속성 레이어 - 기억 그래프와 랭크 벡터를 영구 저장합니다.
-지원 포맷: JSON, NumPy (.npz)
+지원 포맷: JSON, NumPy (.npz), 메모리 맵 가능한 .npy 디렉터리
+밀집(M) / 희소(CSR) 전이 행렬 모두 지원합니다.
 
 이 레이어가 있어야 "장기 기억"이라는 표현이 정확해집니다.
 - 학습된 기억 중요도가 영구 보존됨
@@ -11,11 +12,16 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
+import uuid
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Tuple, Optional, Any
 
 import numpy as np
 
+from .sparse import SparseTransitionMatrix
+
 if TYPE_CHECKING:
     from .memoryrank_engine import MemoryRankEngine, MemoryNodeAttributes
 
@@ -57,37 +63,38 @@ class MemoryRankPersistence:
         engine = self.engine
         
         # 노드 목록
-        nodes = list(engine._index_to_id)
+        nodes = engine.get_node_ids()
         
         # 전이 행렬에서 엣지 추출
         edges = []
-        if engine._M is not None:
-            n = engine._M.shape[0]
-            for j in range(n):  # src
-                for i in range(n):  # dst
-                    weight = engine._M[i, j]
-                    if weight > 0:
-                        edges.append({
-                            "src": engine._index_to_id[j],
-                            "dst": engine._index_to_id[i],
-                            "weight": float(weight),
-                        })
+        if engine._M_sparse is not None:
+            # 희소 행렬: 저장된 항목만 (dangling 열은 로드 시 복원)
+            for j, i, weight in engine._M_sparse.iter_entries():
+                edges.append({
+                    "src": nodes[j],
+                    "dst": nodes[i],
+                    "weight": weight,
+                })
+        elif engine._M is not None:
+            # 밀집 행렬: 0이 아닌 항목만 (src 우선 순서)
+            src_idx, dst_idx = np.nonzero(engine._M.T > 0)
+            weights = engine._M[dst_idx, src_idx]
+            for j, i, weight in zip(src_idx.tolist(), dst_idx.tolist(), weights.tolist()):
+                edges.append({
+                    "src": nodes[j],
+                    "dst": nodes[i],
+                    "weight": weight,
+                })
         
         # personalization vector
         personalization = None
         if engine._v is not None:
-            personalization = {
-                nid: float(engine._v[i])
-                for i, nid in enumerate(engine._index_to_id)
-            }
+            personalization = dict(zip(nodes, engine._v.tolist()))
         
         # rank vector
         ranks = None
         if engine._r is not None:
-            ranks = {
-                nid: float(engine._r[i])
-                for i, nid in enumerate(engine._index_to_id)
-            }
+            ranks = dict(zip(nodes, engine._r.tolist()))
         
         data = {
             "version": "1.0.0",
@@ -127,16 +134,32 @@ class MemoryRankPersistence:
         engine._id_to_index = {nid: i for i, nid in enumerate(nodes)}
         
         # 전이 행렬 복원
+        engine._M = None
+        engine._M_sparse = None
         if n > 0:
-            engine._M = np.zeros((n, n), dtype=float)
+            rows: List[int] = []
+            cols: List[int] = []
+            vals: List[float] = []
             for edge in edges_data:
                 src, dst, w = edge["src"], edge["dst"], edge["weight"]
                 if src in engine._id_to_index and dst in engine._id_to_index:
-                    j = engine._id_to_index[src]
-                    i = engine._id_to_index[dst]
-                    engine._M[i, j] = w
-        else:
-            engine._M = None
+                    cols.append(engine._id_to_index[src])
+                    rows.append(engine._id_to_index[dst])
+                    vals.append(w)
+
+            if engine.config.sparse:
+                engine._M_sparse = SparseTransitionMatrix.from_normalized(
+                    np.array(rows, dtype=np.int64),
+                    np.array(cols, dtype=np.int64),
+                    np.array(vals, dtype=float),
+                    n,
+                )
+            else:
+                engine._M = np.zeros((n, n), dtype=float)
+                engine._M[rows, cols] = vals
+                # 항목이 없는 열 (희소 포맷으로 저장된 dangling 열) → 균등 분포
+                empty_cols = ~engine._M.any(axis=0)
+                engine._M[:, empty_cols] = 1.0 / n
         
         # personalization vector 복원
         if personalization and n > 0:
@@ -156,6 +179,9 @@ class MemoryRankPersistence:
         else:
             engine._r = None
         
+        # 증분 상태는 다음 증분 업데이트 때 로드된 행렬에서 복원
+        engine._reset_incremental_state()
+
         return {"nodes": n, "edges": len(edges_data)}
     
     # ------------------------------------------------------------------
@@ -172,49 +198,221 @@ class MemoryRankPersistence:
         Returns:
             {"nodes": 노드 수}
         """
+        save_dict = self.to_arrays()
+        np.savez_compressed(path, **save_dict)
+        return {"nodes": len(self.engine._index_to_id)}
+    
+    def load_npz(self, path: str) -> Dict[str, int]:
+        """NumPy 압축 파일에서 그래프와 랭크 벡터 로드
+        
+        Args:
+            path: 파일 경로 (.npz)
+            
+        Returns:
+            {"nodes": 노드 수}
+        """
+        with np.load(path, allow_pickle=False) as data:
+            return self.from_arrays({key: data[key] for key in data.files})
+    
+    # ------------------------------------------------------------------
+    # .npy 디렉터리 저장/로드 (메모리 맵, 프로세스 간 공유)
+    # ------------------------------------------------------------------
+    def save_npy(self, path: str) -> Dict[str, int]:
+        """그래프와 랭크 벡터를 비압축 .npy 파일 디렉터리로 저장
+        
+        배열마다 .npy 파일 하나 (CSR indptr/indices/data/dangling 또는 M,
+        v, r, 노드 id 고정폭 문자열 배열) 를 새 세대 디렉터리(gen-<id>)에
+        모두 쓴 뒤, manifest.json 을 os.replace 로 교체해 그 세대를 가리키게
+        한다. 읽는 쪽은 manifest 가 가리키는 한 세대만 열기 때문에, 저장 도중에
+        로드해도 옛 배열과 새 배열이 섞이지 않는다. 직전 세대는 남겨 두고
+        (옛 manifest 를 막 읽은 프로세스용) 그보다 오래된 세대만 지운다.
+        
+        Args:
+            path: 저장 디렉터리 (없으면 생성)
+            
+        Returns:
+            {"nodes": 노드 수}
+        """
+        engine = self.engine
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        
+        nodes = engine.get_node_ids()
+        arrays = {k: v for k, v in self.to_arrays().items() if k != "nodes_json"}
+        # 고정폭 유니코드 배열: pickle 없이 메모리 맵 가능
+        arrays["nodes"] = np.array(nodes, dtype=f"<U{max(1, max(map(len, nodes), default=1))}")
+        
+        generation = f"gen-{uuid.uuid4().hex}"
+        tmp_dir = directory / f"{generation}.tmp"
+        tmp_dir.mkdir()
+        for name, array in arrays.items():
+            with open(tmp_dir / f"{name}.npy", "wb") as f:
+                np.save(f, np.ascontiguousarray(array))
+        os.replace(tmp_dir, directory / generation)
+        
+        previous = self._read_manifest(directory).get("generation")
+        manifest = {
+            "version": "1.1.0",
+            "engine": "MemoryRankEngine",
+            "generation": generation,
+            "node_count": len(nodes),
+            "arrays": {name: list(np.shape(array)) for name, array in sorted(arrays.items())},
+        }
+        tmp_path = directory / f"manifest.json.{generation}.tmp"
+        tmp_path.write_text(json.dumps(manifest, indent=2))
+        os.replace(tmp_path, directory / "manifest.json")
+        
+        # 현재/직전 세대를 제외한 세대와 중단된 저장의 잔여물 정리
+        for entry in directory.glob("gen-*"):
+            if entry.name not in (generation, previous) and entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+        return {"nodes": len(nodes)}
+    
+    def load_npy(self, path: str, mmap: bool = True) -> Dict[str, int]:
+        """.npy 디렉터리에서 그래프와 랭크 벡터 로드
+        
+        manifest.json 이 가리키는 세대의 배열만 읽고, 배열 모양이 manifest
+        및 노드 수와 맞지 않으면 ValueError 를 낸다.
+        mmap=True 면 np.load(mmap_mode="r") 로 읽기 전용 메모리 맵을 연다.
+        이 상태에서 get_top_memories 는 랭크 벡터와 상위 k개 노드 id 만
+        읽으며, 노드 id 테이블(list/dict)은 증분 업데이트 등 매핑이 필요한
+        연산에서 처음 만들어진다.
+        
+        Args:
+            path: 저장 디렉터리
+            mmap: 메모리 맵 사용 여부 (False면 메모리로 복사)
+            
+        Returns:
+            {"nodes": 노드 수}
+        """
+        engine = self.engine
+        directory = Path(path)
+        manifest = json.loads((directory / "manifest.json").read_text())
+        # 1.0.0 포맷 (세대 없이 디렉터리에 바로 저장) 도 읽는다
+        generation_dir = directory / manifest["generation"] if "generation" in manifest else directory
+        shapes = manifest["arrays"]
+        mmap_mode = "r" if mmap else None
+        data = {
+            name: np.load(generation_dir / f"{name}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+            for name in shapes
+        }
+        self._check_shapes(data, shapes, manifest["node_count"])
+        
+        nodes = data.pop("nodes")
+        n = len(nodes)
+        engine._index_to_id = nodes if mmap else nodes.tolist()
+        engine._id_to_index = {} if mmap else {nid: i for i, nid in enumerate(engine._index_to_id)}
+        
+        engine._M = data.get("M")
+        engine._M_sparse = None
+        if "M_indptr" in data:
+            engine._M_sparse = SparseTransitionMatrix(
+                n=n,
+                indptr=data["M_indptr"],
+                indices=data["M_indices"],
+                data=data["M_data"],
+                dangling=data["M_dangling"],
+            )
+        engine._v = data.get("v")
+        engine._r = data.get("r")
+        
+        engine._reset_incremental_state()
+        
+        return {"nodes": n}
+    
+    @staticmethod
+    def _read_manifest(directory: Path) -> Dict[str, Any]:
+        try:
+            return json.loads((directory / "manifest.json").read_text())
+        except (OSError, ValueError):
+            return {}
+    
+    @staticmethod
+    def _check_shapes(data: Dict[str, np.ndarray], shapes: Any, node_count: int) -> None:
+        """배열 모양이 manifest 기록 및 노드 수와 일치하는지 확인"""
+        n = int(node_count)
+        expected: Dict[str, Tuple[int, ...]] = {
+            "nodes": (n,),
+            "M": (n, n),
+            "M_indptr": (n + 1,),
+            "M_dangling": (n,),
+            "v": (n,),
+            "r": (n,),
+        }
+        if "M_indices" in data and "M_indptr" in data and len(data["M_indptr"]):
+            nnz = int(data["M_indptr"][-1])
+            expected["M_indices"] = expected["M_data"] = (nnz,)
+        recorded = shapes if isinstance(shapes, dict) else {}  # 1.0.0 manifest 는 이름 목록만 가진다
+        for name, array in data.items():
+            shape = tuple(array.shape)
+            for want in (expected.get(name), recorded.get(name)):
+                if want is not None and shape != tuple(want):
+                    raise ValueError(
+                        f"npy graph array {name!r} has shape {shape}, "
+                        f"expected {tuple(want)} (mixed or partial save?)"
+                    )
+    
+    # ------------------------------------------------------------------
+    # 배열 직렬화 (npz / 세션 저장소 공용)
+    # ------------------------------------------------------------------
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """엔진 상태를 이름 → 배열 사전으로 변환
+        
+        save_npz 와 세션 저장소(StorageBackend)가 공유하는 포맷.
+        """
         engine = self.engine
         
         # 노드 목록을 JSON 문자열로
-        nodes_json = json.dumps(engine._index_to_id, ensure_ascii=False)
+        nodes_json = json.dumps(engine.get_node_ids(), ensure_ascii=False)
         
-        save_dict = {
+        arrays = {
             "nodes_json": np.array([nodes_json]),
         }
         
-        if engine._M is not None:
-            save_dict["M"] = engine._M
+        if engine._M_sparse is not None:
+            arrays["M_indptr"] = engine._M_sparse.indptr
+            arrays["M_indices"] = engine._M_sparse.indices
+            arrays["M_data"] = engine._M_sparse.data
+            arrays["M_dangling"] = engine._M_sparse.dangling
+        elif engine._M is not None:
+            arrays["M"] = engine._M
         if engine._v is not None:
-            save_dict["v"] = engine._v
+            arrays["v"] = engine._v
         if engine._r is not None:
-            save_dict["r"] = engine._r
-        
-        np.savez_compressed(path, **save_dict)
-        return {"nodes": len(engine._index_to_id)}
+            arrays["r"] = engine._r
+        return arrays
     
-    def load_npz(self, path: str) -> Dict[str, int]:
-        """NumPy 압축 파일에서 그래프와 랭크 벡터 로드
+    def from_arrays(self, data: Dict[str, np.ndarray]) -> Dict[str, int]:
+        """to_arrays 형식의 사전에서 엔진 상태 복원
         
-        Args:
-            path: 파일 경로 (.npz)
-            
         Returns:
             {"nodes": 노드 수}
         """
         engine = self.engine
-        data = np.load(path, allow_pickle=False)
         
         # 노드 목록 복원
-        nodes_json = str(data["nodes_json"][0])
-        nodes = json.loads(nodes_json)
+        nodes = json.loads(str(data["nodes_json"][0]))
         
         engine._index_to_id = nodes
         engine._id_to_index = {nid: i for i, nid in enumerate(nodes)}
         
         # 행렬/벡터 복원
-        engine._M = data["M"] if "M" in data else None
-        engine._v = data["v"] if "v" in data else None
-        engine._r = data["r"] if "r" in data else None
+        engine._M = data.get("M")
+        engine._M_sparse = None
+        if "M_indptr" in data:
+            engine._M_sparse = SparseTransitionMatrix(
+                n=len(nodes),
+                indptr=data["M_indptr"],
+                indices=data["M_indices"],
+                data=data["M_data"],
+                dangling=data["M_dangling"],
+            )
+        engine._v = data.get("v")
+        engine._r = data.get("r")
         
+        # 증분 상태는 다음 증분 업데이트 때 로드된 행렬에서 복원
+        engine._reset_incremental_state()
+
         return {"nodes": len(nodes)}
 
 
@@ -239,3 +437,13 @@ def save_to_npz(engine: "MemoryRankEngine", path: str) -> Dict[str, int]:
 def load_from_npz(engine: "MemoryRankEngine", path: str) -> Dict[str, int]:
     """MemoryRankEngine의 편의 메서드"""
     return MemoryRankPersistence(engine).load_npz(path)
+
+
+def save_to_npy(engine: "MemoryRankEngine", path: str) -> Dict[str, int]:
+    """MemoryRankEngine의 편의 메서드"""
+    return MemoryRankPersistence(engine).save_npy(path)
+
+
+def load_from_npy(engine: "MemoryRankEngine", path: str, mmap: bool = True) -> Dict[str, int]:
+    """MemoryRankEngine의 편의 메서드"""
+    return MemoryRankPersistence(engine).load_npy(path, mmap)
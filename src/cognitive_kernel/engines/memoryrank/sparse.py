@@ -0,0 +1,232 @@
+"""Sparse Transition Matrix (CSR)
+
+MemoryRank 전이 행렬의 희소 표현.
+- 엣지 리스트에서 바로 CSR 배열(indptr / indices / data)을 만든다
+- 메모리는 노드 수²가 아니라 엣지 수에 비례
+- out-degree 0 (dangling) 열은 1/n 로 채우지 않고 rank-1 보정으로 처리
+- 증분 엣지 추가는 제자리 삽입 + 닿은 열만 재정규화
+
+SciPy 없이 NumPy만 사용한다 (Edge AI First).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass
+class SparseTransitionMatrix:
+    """열 정규화된 전이 행렬 M (N x N)의 CSR 표현.
+
+    M[i, j] = j -> i 전이 확률
+
+    - indptr  : 행(dst) 포인터, 길이 N+1
+    - indices : 각 항목의 열(src) 인덱스
+    - data    : 정규화된 전이 확률
+    - dangling: out-degree 0 인 열 (bool, 길이 N)
+
+    dangling 열은 암묵적으로 1/n 균등 분포를 가진다:
+        M @ r = M_sparse @ r + (Σ r[dangling]) / n
+    """
+
+    n: int
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    dangling: np.ndarray
+    _rows: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_edges(
+        cls,
+        src: np.ndarray,
+        dst: np.ndarray,
+        weights: np.ndarray,
+        n: int,
+    ) -> "SparseTransitionMatrix":
+        """(src, dst, weight) 인덱스 배열로부터 CSR 행렬을 만든다.
+
+        중복 엣지는 가중치를 합산하고, 열(src) 합으로 정규화한다.
+        """
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weights = np.asarray(weights, dtype=float)
+
+        # 행 우선(dst, src) 순서로 정렬 + 중복 병합
+        keys = dst * n + src
+        uniq, inverse = np.unique(keys, return_inverse=True)
+        data = np.bincount(inverse, weights=weights, minlength=len(uniq))
+        rows = uniq // n
+        cols = uniq % n
+
+        # 열 정규화
+        col_sums = np.bincount(cols, weights=data, minlength=n)
+        data = data / col_sums[cols] if len(data) else data
+
+        # keys 가 이미 (row, col) 순으로 정렬되어 있으므로 바로 CSR 구성
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+        return cls(
+            n=n,
+            indptr=indptr,
+            indices=cols,
+            data=data,
+            dangling=col_sums <= 0.0,
+        )
+
+    @classmethod
+    def from_normalized(
+        cls,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        data: np.ndarray,
+        n: int,
+        dangling: Optional[np.ndarray] = None,
+    ) -> "SparseTransitionMatrix":
+        """이미 정규화된 (row, col, value) 항목으로 CSR 행렬을 만든다.
+
+        dangling 이 없으면 항목이 하나도 없는 열을 dangling 으로 간주한다.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        data = np.asarray(data, dtype=float)
+
+        order = np.lexsort((cols, rows))
+        rows, cols, data = rows[order], cols[order], data[order]
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+        if dangling is None:
+            dangling = np.bincount(cols, minlength=n) == 0
+
+        return cls(
+            n=n,
+            indptr=indptr,
+            indices=cols,
+            data=data,
+            dangling=np.asarray(dangling, dtype=bool),
+        )
+
+    def grow(self, n: int) -> None:
+        """노드 수를 n 으로 늘린다 (새 행은 비어 있고, 새 열은 dangling)."""
+        k = n - self.n
+        if k <= 0:
+            return
+        self.indptr = np.concatenate([self.indptr, np.full(k, self.indptr[-1], dtype=np.int64)])
+        self.dangling = np.concatenate([self.dangling, np.ones(k, dtype=bool)])
+        self.n = n
+
+    def add_edges(
+        self,
+        src: np.ndarray,
+        dst: np.ndarray,
+        weights: np.ndarray,
+        col_sums: np.ndarray,
+    ) -> np.ndarray:
+        """원 가중치 엣지를 제자리에서 추가한다 (전체 재정렬/재정규화 없음).
+
+        새 항목은 해당 행 끝에 삽입하거나 기존 항목에 합산하고,
+        엣지가 닿은 열(src)만 old_sum / new_sum 비율로 다시 정규화한다.
+        나머지 열의 값은 바뀌지 않는다.
+
+        col_sums:
+            추가 전 열(src)별 원 가중치 합 (길이 n)
+
+        Returns:
+            추가 후 열별 원 가중치 합
+        """
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weights = np.asarray(weights, dtype=float)
+        n = self.n
+
+        new_sums = np.asarray(col_sums, dtype=float).copy()
+        np.add.at(new_sums, src, weights)
+        if len(src) == 0:
+            return new_sums
+
+        # 메모리 맵으로 연 배열 (읽기 전용) 은 처음 수정할 때 복사
+        for name in ("indptr", "indices", "data", "dangling"):
+            array = getattr(self, name)
+            if not array.flags.writeable:
+                setattr(self, name, array.copy())
+
+        # 닿은 열의 기존 항목: old_sum / new_sum 비율로 재정규화
+        touched = np.unique(src)
+        factor = np.ones(n, dtype=float)
+        factor[touched] = col_sums[touched] / new_sums[touched]
+        mask = np.isin(self.indices, touched)
+        self.data[mask] *= factor[self.indices[mask]]
+
+        # 새 항목 (delta 안의 중복은 먼저 합산)
+        uniq, inverse = np.unique(dst * n + src, return_inverse=True)
+        values = np.bincount(inverse, weights=weights, minlength=len(uniq))
+        rows = uniq // n
+        cols = uniq % n
+        values = values / new_sums[cols]
+
+        insert = np.ones(len(uniq), dtype=bool)
+        for k, (i, j) in enumerate(zip(rows.tolist(), cols.tolist())):
+            lo, hi = self.indptr[i], self.indptr[i + 1]
+            hit = np.flatnonzero(self.indices[lo:hi] == j)
+            if len(hit):
+                self.data[lo + hit[0]] += values[k]
+                insert[k] = False
+
+        if insert.any():
+            rows, cols, values = rows[insert], cols[insert], values[insert]
+            positions = self.indptr[rows + 1]
+            self.indices = np.insert(self.indices, positions, cols)
+            self.data = np.insert(self.data, positions, values)
+            self.indptr[1:] += np.cumsum(np.bincount(rows, minlength=n))
+            self._rows = None
+
+        self.dangling[touched] = new_sums[touched] <= 0.0
+        return new_sums
+
+    @property
+    def nnz(self) -> int:
+        """저장된 (0이 아닌) 항목 수."""
+        return int(len(self.data))
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.n, self.n)
+
+    def row_ids(self) -> np.ndarray:
+        """각 항목의 행(dst) 인덱스 (COO 형태, 캐시됨)."""
+        if self._rows is None:
+            self._rows = np.repeat(np.arange(self.n, dtype=np.int64), np.diff(self.indptr))
+        return self._rows
+
+    def matvec(self, r: np.ndarray) -> np.ndarray:
+        """M @ r (dangling rank-1 보정 포함)."""
+        y = np.bincount(
+            self.row_ids(),
+            weights=self.data * r[self.indices],
+            minlength=self.n,
+        )
+        if self.n > 0:
+            y += float(r[self.dangling].sum()) / float(self.n)
+        return y
+
+    def __matmul__(self, r: np.ndarray) -> np.ndarray:
+        return self.matvec(r)
+
+    def to_dense(self) -> np.ndarray:
+        """밀집 행렬로 변환 (dangling 열은 1/n 로 채움). 테스트/디버깅용."""
+        M = np.zeros((self.n, self.n), dtype=float)
+        M[self.row_ids(), self.indices] = self.data
+        if self.n > 0:
+            M[:, self.dangling] = 1.0 / float(self.n)
+        return M
+
+    def iter_entries(self) -> Iterator[Tuple[int, int, float]]:
+        """(src_index, dst_index, value) 항목 순회 (dangling 보정 제외)."""
+        for i, j, w in zip(self.row_ids(), self.indices, self.data):
+            yield int(j), int(i), float(w)
@@ -4,6 +4,8 @@
 - 이벤트 기록 및 시간 구간 쿼리
 - 에피소드 자동 분할
 - 지수 감쇠 기반 중요도 계산
+- 청크 분할 타임라인 (O(1) 시간 순 append / 오래된 이벤트 제거)
+- 키워드 역색인 (내용 토큰 → 이벤트 ID)
 - 영속성 레이어 (JSON, SQLite)
 
 🔗 장기 기억 지원:
@@ -14,6 +16,8 @@
 from .config import PanoramaConfig
 from .panorama_engine import PanoramaMemoryEngine, Event, Episode
 from .persistence import PanoramaPersistence
+from .timeline import EventTimeline
+from .keyword_index import KeywordIndex
 
 __all__ = [
     "PanoramaConfig",
@@ -21,6 +25,8 @@ __all__ = [
     "Event",
     "Episode",
     "PanoramaPersistence",
+    "EventTimeline",
+    "KeywordIndex",
 ]
 
 __version__ = "1.1.0"
@@ -8,8 +8,10 @@ class PanoramaConfig:
     - time_gap_threshold: 에피소드 분할 시간 간격 임계값 (초)
     - recency_half_life: 중요도 지수 감쇠 반감기 (초)
     - max_events: 최대 이벤트 수 (메모리 관리용)
+    - keyword_index: 내용 토큰 역색인 유지 여부 (키워드 관련성 계산용)
     """
 
     time_gap_threshold: float = 1800.0   # 30분
     recency_half_life: float = 86400.0   # 24시간
     max_events: int = 100000
+    keyword_index: bool = True
@@ -0,0 +1,140 @@
+"""Keyword Index (Inverted Index)
+
+Panorama 이벤트 내용의 토큰 → 이벤트 ID 역색인.
+- 이벤트 내용 텍스트 = payload 값들을 공백으로 이어 붙여 소문자화한 문자열
+- 토큰 = 그 텍스트를 공백 기준으로 나눈 조각
+- 키워드 검색은 "키워드가 내용 텍스트의 부분 문자열인가" 와 같은 의미:
+  공백이 없는 키워드는 어떤 토큰의 부분 문자열일 때만 텍스트에 포함된다
+- 키워드 → 일치 토큰 집합은 캐시되며, 새 토큰이 생기면 새 토큰만 추가로 검사
+- 이벤트가 제거되어 빈 토큰은 postings 에서 지우고, vocab 의 죽은 토큰이
+  쌓이면 압축한다 (색인 크기가 살아 있는 이벤트 수에 비례)
+
+이벤트마다 내용 문자열을 다시 만들고 모든 키워드를 스캔하던 비용을
+사전 조회 + 집합 연산으로 바꾼다.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, List, Set, Tuple
+
+
+def content_text(payload: Any) -> str:
+    """키워드 매칭용 내용 텍스트 (소문자)."""
+    if isinstance(payload, dict):
+        # 딕셔너리면 모든 값들을 문자열로 합침
+        return " ".join(str(v) for v in payload.values()).lower()
+    return str(payload).lower()
+
+
+def is_indexable_keyword(keyword: str) -> bool:
+    """색인으로 검색 가능한 키워드인지 (비어 있지 않고 공백 없음)."""
+    return keyword.split() == [keyword]
+
+
+class KeywordIndex:
+    """토큰 → 이벤트 ID 역색인."""
+
+    COMPACT_MIN_DEAD = 1024  # vocab 압축을 시작하는 최소 죽은 토큰 수
+
+    def __init__(self, max_cached_keywords: int = 4096):
+        self._postings: Dict[str, Set[str]] = {}           # token → {event_id} (비어 있지 않음)
+        self._event_tokens: Dict[str, FrozenSet[str]] = {}  # event_id → tokens
+        self._vocab: List[str] = []                        # 등장 순서 (압축 전까지 append-only)
+        self._dead_vocab = 0                               # vocab 안의 죽은 (posting 없는) 항목 수
+        # keyword → (검사한 vocab 수, 일치 토큰 집합)
+        self._keyword_cache: Dict[str, Tuple[int, Set[str]]] = {}
+        self._max_cached_keywords = max_cached_keywords
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def add(self, event_id: str, payload: Any) -> None:
+        """이벤트 내용을 색인에 추가 (같은 ID 는 교체)."""
+        if event_id in self._event_tokens:
+            self.remove(event_id)
+
+        tokens = frozenset(content_text(payload).split())
+        self._event_tokens[event_id] = tokens
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = set()
+                self._vocab.append(token)
+            posting.add(event_id)
+
+    def remove(self, event_id: str) -> None:
+        """이벤트를 색인에서 제거 (빈 토큰은 postings 에서 삭제, vocab 은 지연 압축)."""
+        tokens = self._event_tokens.pop(event_id, None)
+        if not tokens:
+            return
+        postings = self._postings
+        for token in tokens:
+            posting = postings[token]
+            posting.discard(event_id)
+            if not posting:
+                del postings[token]
+                self._dead_vocab += 1
+        if self._dead_vocab > max(self.COMPACT_MIN_DEAD, len(postings)):
+            self._compact_vocab()
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._event_tokens.clear()
+        self._vocab.clear()
+        self._dead_vocab = 0
+        self._keyword_cache.clear()
+
+    def _compact_vocab(self) -> None:
+        """vocab 에서 죽은 토큰 제거 (검사 위치가 바뀌므로 키워드 캐시도 비움)."""
+        postings = self._postings
+        # 제거 후 다시 등장한 토큰은 vocab 에 두 번 있으므로 중복도 제거
+        self._vocab = [t for t in dict.fromkeys(self._vocab) if t in postings]
+        self._dead_vocab = 0
+        self._keyword_cache.clear()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def matching_tokens(self, keyword: str) -> Set[str]:
+        """keyword 를 부분 문자열로 포함하는 토큰 집합 (캐시).
+
+        keyword 는 is_indexable_keyword() 를 만족해야 한다.
+        """
+        cached = self._keyword_cache.get(keyword)
+        if cached is None:
+            if len(self._keyword_cache) >= self._max_cached_keywords:
+                self._keyword_cache.clear()
+            scanned, tokens = 0, set()
+        else:
+            scanned, tokens = cached
+
+        vocab = self._vocab
+        if scanned < len(vocab):
+            tokens.update(t for t in vocab[scanned:] if keyword in t)
+            self._keyword_cache[keyword] = (len(vocab), tokens)
+        elif cached is None:
+            self._keyword_cache[keyword] = (scanned, tokens)
+        return tokens
+
+    def lookup(self, keyword: str) -> Set[str]:
+        """keyword 가 내용에 포함된 모든 이벤트 ID (전체 기억 대상)."""
+        result: Set[str] = set()
+        postings = self._postings
+        for token in self.matching_tokens(keyword):
+            posting = postings.get(token)  # 캐시에는 제거된 토큰이 남아 있을 수 있음
+            if posting:
+                result |= posting
+        return result
+
+    def contains(self, event_id: str, keyword: str) -> bool:
+        """event_id 의 내용에 keyword 가 포함되는지."""
+        tokens = self._event_tokens.get(event_id)
+        if not tokens:
+            return False
+        return not self.matching_tokens(keyword).isdisjoint(tokens)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._event_tokens
+
+    def __len__(self) -> int:
+        return len(self._event_tokens)
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import bisect
 import math
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Set, Tuple, Iterable
 
+import numpy as np
 
 from .config import PanoramaConfig
+from .keyword_index import KeywordIndex, content_text, is_indexable_keyword
+from .timeline import EventTimeline
 
 
 @dataclass(frozen=True)
@@ -55,14 +57,29 @@ class PanoramaMemoryEngine:
     - 시간 구간 쿼리 (Range Query)
     - 에피소드 자동 분할
     - 지수 감쇠 기반 중요도 계산 (MemoryRank 연동용)
+    - 열 저장소 (timestamp / importance / emotion NumPy 배열, 벡터화 계산용)
+    - 키워드 역색인 (내용 토큰 → 이벤트 ID, 키워드 관련성 계산용)
     """
 
     def __init__(self, config: Optional[PanoramaConfig] = None):
         self.config = config or PanoramaConfig()
-        self._events: List[Event] = []              # 시간 순 정렬
-        self._timestamps: List[float] = []          # 이진 검색용 타임스탬프 리스트
+        self._events = EventTimeline()              # 시간 순 정렬 (청크 분할)
         self._event_map: Dict[str, Event] = {}      # id → Event
         self._episode_index: Dict[str, List[str]] = {}  # episode_id → [event_ids]
+        self._reset_columns()
+        self._keywords: Optional[KeywordIndex] = (
+            KeywordIndex() if self.config.keyword_index else None
+        )
+
+        # 변경 저널 (증분 저장용): 마지막 저장 이후 추가/제거된 이벤트 추적
+        self._journal_id = str(uuid.uuid4())
+        self._change_seq = 0                        # 지금까지 기록된 변경 수
+        self._changes: List[Tuple[str, Any]] = []   # ("add", Event) / ("del", event_id)
+        self._changes_base = 0                      # _changes[0] 의 seq
+        self._track_changes = False                 # 증분 저장소가 기준점을 남긴 뒤에만 기록
+
+        # 최대 이벤트 수 초과로 제거된 이벤트 ID 를 받는 콜백 (엣지 정리 등)
+        self.evict_listeners: List[Callable[[List[str]], None]] = []
 
     # ------------------------------------------------------------------
     # 이벤트 추가
@@ -101,11 +118,13 @@ class PanoramaMemoryEngine:
             importance=max(0.0, min(1.0, float(importance))),
         )
 
-        # 이진 삽입으로 정렬 유지
-        idx = bisect.bisect_right(self._timestamps, event.timestamp)
-        self._events.insert(idx, event)
-        self._timestamps.insert(idx, event.timestamp)
+        # 정렬 유지 (시간 순 append 는 O(1) fast path)
+        self._events.append(event)
         self._event_map[event.id] = event
+        self._column_append(event)
+        if self._keywords is not None:
+            self._keywords.add(event.id, event.payload)
+        self._record_change("add", event)
 
         # 에피소드 인덱스 업데이트
         if episode_id:
@@ -114,16 +133,144 @@ class PanoramaMemoryEngine:
             self._episode_index[episode_id].append(event.id)
 
         # 최대 이벤트 수 초과 시 가장 오래된 이벤트 제거
+        self._evict_overflow()
+
+        return event.id
+
+    def append_events(self, records: Iterable[Dict[str, Any]]) -> List[str]:
+        """이벤트 여러 개를 한 번에 추가 (벌크 append).
+
+        각 레코드는 append_event 의 키워드 인자와 같은 키를 가진 딕셔너리
+        (timestamp, event_type 필수 / payload, episode_id, importance, event_id 선택).
+        append_event 를 반복한 것과 같은 이벤트가 남는다. 타임라인은 정렬 후
+        한 번에 병합하고, 열 저장소는 한 번에 채우고, 최대 이벤트 수 초과분은
+        마지막에 한 번에 제거한다.
+
+        Returns:
+            생성된 이벤트 ID 리스트 (레코드 순서)
+        """
+        events = [
+            Event(
+                id=_record_event_id(record),
+                timestamp=float(record["timestamp"]),
+                event_type=record["event_type"],
+                payload=record.get("payload") or {},
+                episode_id=record.get("episode_id"),
+                importance=max(0.0, min(1.0, float(record.get("importance", 0.5)))),
+            )
+            for record in records
+        ]
+        if not events:
+            return []
+
+        ids = [event.id for event in events]
+        bulk_columns = len(set(ids)) == len(ids) and self._slot_of.keys().isdisjoint(ids)
+
+        # 타임라인: 정렬 후 한 번에 병합 (과거 시점 백필도 이벤트별 삽입 없음)
+        self._events.extend(events)
+        for event in events:
+            self._event_map[event.id] = event
+            if not bulk_columns:
+                self._column_append(event)
+            if self._keywords is not None:
+                self._keywords.add(event.id, event.payload)
+            self._record_change("add", event)
+            if event.episode_id:
+                self._episode_index.setdefault(event.episode_id, []).append(event.id)
+
+        if bulk_columns:
+            n = len(events)
+            start = self._col_size
+            if start + n > len(self._col_timestamp):
+                self._grow_columns(max(2 * len(self._col_timestamp), start + n))
+            end = start + n
+            self._col_timestamp[start:end] = [e.timestamp for e in events]
+            self._col_importance[start:end] = [e.importance for e in events]
+            self._col_emotion[start:end] = [_payload_emotion(e.payload) for e in events]
+            self._col_alive[start:end] = True
+            self._col_ids.extend(ids)
+            self._slot_of.update(zip(ids, range(start, end)))
+            self._col_size = end
+
+        self._evict_overflow()
+        return ids
+
+    def _evict_overflow(self) -> None:
+        """최대 이벤트 수를 넘는 만큼 가장 오래된 이벤트부터 제거 (evict_listeners 에 ID 통지)."""
+        evicted: List[str] = []
         while len(self._events) > self.config.max_events:
-            oldest = self._events.pop(0)
-            self._timestamps.pop(0)
+            oldest = self._events.popleft()
+            evicted.append(oldest.id)
             del self._event_map[oldest.id]
+            self._column_remove(oldest.id)
+            if self._keywords is not None:
+                self._keywords.remove(oldest.id)
+            self._record_change("del", oldest.id)
             if oldest.episode_id and oldest.episode_id in self._episode_index:
                 self._episode_index[oldest.episode_id].remove(oldest.id)
                 if not self._episode_index[oldest.episode_id]:
                     del self._episode_index[oldest.episode_id]
+        if evicted:
+            for listener in self.evict_listeners:
+                listener(evicted)
 
-        return event.id
+    def load_events(self, events: Iterable[Event]) -> int:
+        """저장된 이벤트로 엔진 내용을 교체 (벌크 로드).
+
+        clear() 후 append_event 를 반복한 것과 같은 결과를 한 번에 만든다.
+        영속화된 이벤트는 보통 이미 시간 순이므로 정렬 여부만 O(n) 으로
+        확인하고 (어긋나 있으면 안정 정렬), 타임라인 청크 / ID 맵 / 열 배열 /
+        에피소드 인덱스를 한 번에 구성한다. 이벤트 ID 는 중복되지 않아야 한다.
+
+        Args:
+            events: Event 객체들 (보통 시간 순)
+
+        Returns:
+            로드된 이벤트 수
+        """
+        self.clear()
+        events = list(events)
+
+        timestamps = np.fromiter((e.timestamp for e in events), dtype=float, count=len(events))
+        if len(events) > 1 and np.any(timestamps[1:] < timestamps[:-1]):
+            order = np.argsort(timestamps, kind="stable")
+            events = [events[i] for i in order.tolist()]
+            timestamps = timestamps[order]
+
+        # 최대 이벤트 수 초과분은 가장 오래된 것부터 버림
+        if len(events) > self.config.max_events:
+            events = events[len(events) - self.config.max_events:]
+            timestamps = timestamps[-self.config.max_events:]
+
+        n = len(events)
+        ids = [e.id for e in events]
+        self._events.load_sorted(events)
+        self._event_map = dict(zip(ids, events))
+
+        for event in events:
+            if event.episode_id:
+                self._episode_index.setdefault(event.episode_id, []).append(event.id)
+        if self._keywords is not None:
+            for event in events:
+                self._keywords.add(event.id, event.payload)
+
+        # 열 저장소 한 번에 채우기
+        self._reset_columns(max(1024, 2 * n))
+        self._col_timestamp[:n] = timestamps
+        self._col_importance[:n] = np.fromiter((e.importance for e in events), dtype=float, count=n)
+        self._col_emotion[:n] = np.fromiter(
+            (_payload_emotion(e.payload) for e in events), dtype=float, count=n,
+        )
+        self._col_alive[:n] = True
+        self._col_ids = ids
+        self._slot_of = dict(zip(ids, range(n)))
+        self._col_size = n
+
+        # 저널: 로드 이전 시점으로는 증분 저장 불가 (다음 저장은 전체 재기록)
+        self._change_seq = n
+        self._changes_base = n
+
+        return n
 
     # ------------------------------------------------------------------
     # 시간 구간 쿼리
@@ -138,9 +285,7 @@ class PanoramaMemoryEngine:
         Returns:
             시간 순 정렬된 이벤트 리스트
         """
-        i_start = bisect.bisect_left(self._timestamps, t_start)
-        i_end = bisect.bisect_right(self._timestamps, t_end)
-        return self._events[i_start:i_end]
+        return self._events.range(t_start, t_end)
 
     # ------------------------------------------------------------------
     # 에피소드 조회
@@ -174,7 +319,7 @@ class PanoramaMemoryEngine:
         Returns:
             최근 이벤트 리스트 (가장 오래된 것부터)
         """
-        return self._events[-n:] if n > 0 else []
+        return self._events.recent(n)
 
     # ------------------------------------------------------------------
     # 에피소드 자동 분할
@@ -209,16 +354,17 @@ class PanoramaMemoryEngine:
         """시간 갭 기반 에피소드 분할."""
         tau = threshold if threshold is not None else self.config.time_gap_threshold
         episodes: List[Episode] = []
-        current_ids: List[str] = [self._events[0].id]
+        current_ids: List[str] = []
+        prev_ts: Optional[float] = None
 
-        for i in range(1, len(self._events)):
-            gap = self._events[i].timestamp - self._events[i - 1].timestamp
-            if gap > tau:
+        for event in self._events:
+            if prev_ts is not None and event.timestamp - prev_ts > tau:
                 # 현재 에피소드 완료
                 episode = self._create_episode(current_ids)
                 episodes.append(episode)
                 current_ids = []
-            current_ids.append(self._events[i].id)
+            current_ids.append(event.id)
+            prev_ts = event.timestamp
 
         # 마지막 에피소드
         if current_ids:
@@ -271,38 +417,242 @@ class PanoramaMemoryEngine:
         Returns:
             {event_id: importance_score} 딕셔너리
         """
-        if t_now is None:
-            t_now = time.time()
-
-        # λ = ln(2) / half_life
-        half_life = self.config.recency_half_life
-        lambda_decay = math.log(2) / half_life if half_life > 0 else 0.0
-
-        scores: Dict[str, float] = {}
-        for event in self._events:
-            delta_t = max(0.0, t_now - event.timestamp)
-            decay = math.exp(-lambda_decay * delta_t)
-            scores[event.id] = event.importance * decay
-
-        return scores
+        slots = self._live_slots()
+        scores = self._col_importance[slots] * self.recency_array(t_now, slots)
+        return dict(zip(self._slot_ids(slots), scores.tolist()))
 
     def get_recency_scores(self, t_now: Optional[float] = None) -> Dict[str, float]:
         """최근성 점수만 반환 (0~1, 지수 감쇠).
 
         MemoryRank의 recency 속성으로 바로 사용 가능.
         """
+        slots = self._live_slots()
+        scores = self.recency_array(t_now, slots)
+        return dict(zip(self._slot_ids(slots), scores.tolist()))
+
+    def recency_array(
+        self,
+        t_now: Optional[float] = None,
+        indices: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """최근성 점수를 열 인덱스 순서의 배열로 반환 (벡터화).
+
+        recency = exp(-λ × max(0, t_now - timestamp)),  λ = ln(2) / half_life
+
+        Args:
+            t_now: 현재 시간 (기본값: time.time())
+            indices: 열 인덱스 배열 (기본값: 전체 열)
+
+        Returns:
+            최근성 배열 (0~1)
+        """
         if t_now is None:
             t_now = time.time()
 
         half_life = self.config.recency_half_life
         lambda_decay = math.log(2) / half_life if half_life > 0 else 0.0
 
-        scores: Dict[str, float] = {}
-        for event in self._events:
-            delta_t = max(0.0, t_now - event.timestamp)
-            scores[event.id] = math.exp(-lambda_decay * delta_t)
+        ts = self._col_timestamp[:self._col_size]
+        if indices is not None:
+            ts = ts[indices]
+        delta_t = np.maximum(0.0, t_now - ts)
+        return np.exp(-lambda_decay * delta_t)
+
+    # ------------------------------------------------------------------
+    # 열 저장소 (Columnar Storage)
+    # ------------------------------------------------------------------
+    # 이벤트마다 안정적인 열 인덱스(slot)를 부여하고 timestamp / importance /
+    # emotion 을 NumPy 배열에 저장한다. 제거된 이벤트의 slot 은 비워 두었다가
+    # 절반 이상이 비면 압축한다 (이때 column_epoch 가 증가하므로 slot 을
+    # 캐시한 쪽은 get_event_indices() 로 다시 조회해야 한다).
 
-        return scores
+    @property
+    def column_epoch(self) -> int:
+        """열 인덱스 세대 번호 (압축/clear 시 증가)."""
+        return self._column_epoch
+
+    def get_event_index(self, event_id: str) -> Optional[int]:
+        """이벤트의 열 인덱스 (없으면 None)."""
+        return self._slot_of.get(event_id)
+
+    def get_event_indices(self, event_ids: Iterable[str]) -> np.ndarray:
+        """이벤트 ID 들의 열 인덱스 배열 (없는 ID 는 -1)."""
+        slot_of = self._slot_of
+        return np.array([slot_of.get(eid, -1) for eid in event_ids], dtype=np.int64)
+
+    def get_columns(self) -> Dict[str, np.ndarray]:
+        """열 배열 뷰 반환 (인덱스 = 열 인덱스, 빈 slot 포함).
+
+        Returns:
+            {"timestamp", "importance", "emotion", "alive"} 배열
+        """
+        n = self._col_size
+        return {
+            "timestamp": self._col_timestamp[:n],
+            "importance": self._col_importance[:n],
+            "emotion": self._col_emotion[:n],
+            "alive": self._col_alive[:n],
+        }
+
+    def _reset_columns(self, capacity: int = 1024) -> None:
+        """열 저장소 초기화."""
+        self._col_timestamp = np.zeros(capacity, dtype=float)
+        self._col_importance = np.zeros(capacity, dtype=float)
+        self._col_emotion = np.zeros(capacity, dtype=float)
+        self._col_alive = np.zeros(capacity, dtype=bool)
+        self._col_ids: List[Optional[str]] = []
+        self._col_size = 0
+        self._col_dead = 0
+        self._slot_of: Dict[str, int] = {}
+        self._column_epoch = getattr(self, "_column_epoch", -1) + 1
+
+    def _column_append(self, event: Event) -> None:
+        """이벤트를 열 저장소 끝에 추가."""
+        if event.id in self._slot_of:
+            self._column_remove(event.id)
+
+        if self._col_size == len(self._col_timestamp):
+            self._grow_columns(2 * len(self._col_timestamp))
+
+        slot = self._col_size
+        self._col_timestamp[slot] = event.timestamp
+        self._col_importance[slot] = event.importance
+        self._col_emotion[slot] = _payload_emotion(event.payload)
+        self._col_alive[slot] = True
+        self._col_ids.append(event.id)
+        self._slot_of[event.id] = slot
+        self._col_size += 1
+
+    def _column_remove(self, event_id: str) -> None:
+        """열 저장소에서 이벤트 제거 (slot 은 비워 둠, 필요 시 압축)."""
+        slot = self._slot_of.pop(event_id, None)
+        if slot is None:
+            return
+        self._col_alive[slot] = False
+        self._col_ids[slot] = None
+        self._col_dead += 1
+
+        if self._col_dead > 1024 and self._col_dead * 2 > self._col_size:
+            self._compact_columns()
+
+    def _grow_columns(self, capacity: int) -> None:
+        for name in ("_col_timestamp", "_col_importance", "_col_emotion", "_col_alive"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self._col_size] = old[:self._col_size]
+            setattr(self, name, new)
+
+    def _compact_columns(self) -> None:
+        """빈 slot 을 제거하고 열 인덱스를 다시 매긴다."""
+        slots = self._live_slots()
+        n = len(slots)
+        capacity = max(1024, 2 * n)
+        for name in ("_col_timestamp", "_col_importance", "_col_emotion", "_col_alive"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:n] = old[slots]
+            setattr(self, name, new)
+        self._col_ids = self._slot_ids(slots)
+        self._slot_of = {eid: i for i, eid in enumerate(self._col_ids)}
+        self._col_size = n
+        self._col_dead = 0
+        self._column_epoch += 1
+
+    def _live_slots(self) -> np.ndarray:
+        return np.flatnonzero(self._col_alive[:self._col_size])
+
+    def _slot_ids(self, slots: np.ndarray) -> List[str]:
+        col_ids = self._col_ids
+        return [col_ids[i] for i in slots.tolist()]
+
+    # ------------------------------------------------------------------
+    # 키워드 역색인
+    # ------------------------------------------------------------------
+    @property
+    def keyword_index(self) -> Optional[KeywordIndex]:
+        """내용 토큰 역색인 (config.keyword_index=False 면 None)."""
+        return self._keywords
+
+    def keyword_matches(self, keyword: str) -> Set[str]:
+        """내용에 keyword 가 (부분 문자열로) 포함된 모든 이벤트 ID.
+
+        색인이 없거나 공백이 든 키워드는 전체 이벤트를 스캔한다.
+        """
+        keyword = keyword.lower()
+        if self._keywords is not None and is_indexable_keyword(keyword):
+            return self._keywords.lookup(keyword)
+        return {e.id for e in self._events if keyword in content_text(e.payload)}
+
+    # ------------------------------------------------------------------
+    # 변경 저널 (증분 영속성)
+    # ------------------------------------------------------------------
+    # 저장소는 (journal_id, change_seq) 를 high-water mark 로 기록해 두고,
+    # 다음 저장 때 changes_since() 로 그 사이의 추가/제거분만 쓴다.
+    # journal_id 가 다르거나 (다른 엔진/clear 이후) 저널이 잘려 나갔으면
+    # 전체 재기록이 필요하다 (None 반환).
+    # 저널 항목은 저장소가 처음 trim_changes 를 호출한 뒤부터 쌓인다
+    # (JSON 저장만 쓰면 seq 만 증가하고 Event 참조는 남지 않는다).
+
+    @property
+    def journal_id(self) -> str:
+        """변경 저널 식별자 (엔진 생성/clear 시 새로 발급)."""
+        return self._journal_id
+
+    @property
+    def change_seq(self) -> int:
+        """지금까지 기록된 변경 수 (high-water mark)."""
+        return self._change_seq
+
+    def changes_since(self, seq: int) -> Optional[Tuple[List[Event], List[str]]]:
+        """seq 이후의 변경분 (추가된 이벤트, 제거된 이벤트 ID).
+
+        같은 구간에서 추가 후 제거된 이벤트는 removed 에만 남는다
+        (저장소에 없는 ID 를 지워도 무해). 저장소는 제거 → 추가 순으로 적용한다.
+
+        Returns:
+            (added_events, removed_ids), 저널로 재구성할 수 없으면 None
+        """
+        if seq < self._changes_base or seq > self._change_seq:
+            return None
+
+        added: Dict[str, Event] = {}
+        removed: Dict[str, None] = {}
+        for op, value in self._changes[seq - self._changes_base:]:
+            if op == "add":
+                added[value.id] = value
+                removed.pop(value.id, None)
+            else:
+                added.pop(value, None)
+                removed[value] = None
+        return list(added.values()), list(removed.keys())
+
+    def trim_changes(self, seq: int) -> None:
+        """seq 까지의 저널 항목 폐기 (저장 완료 후 호출).
+
+        증분 저장소가 기준점을 기록했다는 뜻이므로 이후 변경 기록을 켠다.
+        """
+        self._track_changes = True
+        n = min(seq, self._change_seq) - self._changes_base
+        if n > 0:
+            del self._changes[:n]
+            self._changes_base += n
+
+    def _record_change(self, op: str, value: Any) -> None:
+        self._change_seq += 1
+        if not self._track_changes:
+            self._changes_base = self._change_seq
+            return
+        self._changes.append((op, value))
+        # 아무도 저장하지 않아 저널이 너무 커지면 버린다 (다음 저장은 전체 재기록)
+        if len(self._changes) > 2 * self.config.max_events:
+            self._changes_base = self._change_seq
+            self._changes.clear()
+
+    def _reset_journal(self) -> None:
+        self._journal_id = str(uuid.uuid4())
+        self._change_seq = 0
+        self._changes.clear()
+        self._changes_base = 0
 
     # ------------------------------------------------------------------
     # 유틸리티
@@ -313,7 +663,7 @@ class PanoramaMemoryEngine:
 
     def get_all_events(self) -> List[Event]:
         """모든 이벤트 반환 (시간 순)."""
-        return list(self._events)
+        return self._events.to_list()
 
     def __len__(self) -> int:
         """저장된 이벤트 수."""
@@ -322,9 +672,12 @@ class PanoramaMemoryEngine:
     def clear(self) -> None:
         """모든 이벤트 삭제."""
         self._events.clear()
-        self._timestamps.clear()
         self._event_map.clear()
         self._episode_index.clear()
+        self._reset_columns()
+        if self._keywords is not None:
+            self._keywords.clear()
+        self._reset_journal()
 
     # ------------------------------------------------------------------
     # 영속성 (Persistence) - 장기 기억의 핵심
@@ -355,19 +708,20 @@ class PanoramaMemoryEngine:
         from .persistence import load_from_json as _load
         return _load(self, path, clear_existing)
     
-    def save_to_sqlite(self, path: str) -> int:
+    def save_to_sqlite(self, path: str, incremental: bool = False) -> int:
         """이벤트를 SQLite DB로 저장 (장기 기억)
         
         대용량 이벤트에 적합.
         
         Args:
             path: SQLite 파일 경로
+            incremental: True면 마지막 저장 이후 추가/제거분만 기록
             
         Returns:
             저장된 이벤트 수
         """
         from .persistence import save_to_sqlite as _save
-        return _save(self, path)
+        return _save(self, path, incremental)
     
     def load_from_sqlite(self, path: str, clear_existing: bool = True) -> int:
         """SQLite DB에서 이벤트 로드
@@ -381,3 +735,18 @@ class PanoramaMemoryEngine:
         """
         from .persistence import load_from_sqlite as _load
         return _load(self, path, clear_existing)
+
+
+def _record_event_id(record: Dict[str, Any]) -> str:
+    event_id = record.get("event_id")
+    return str(uuid.uuid4()) if event_id is None else event_id
+
+
+def _payload_emotion(payload: Optional[Dict[str, Any]]) -> float:
+    """payload 의 "emotion" 값을 float 로 (없거나 숫자가 아니면 0.0)."""
+    if not payload:
+        return 0.0
+    try:
+        return float(payload.get("emotion", 0.0))
+    except (TypeError, ValueError):
+        return 0.0
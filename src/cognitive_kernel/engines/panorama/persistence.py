@@ -1,7 +1,7 @@
 """Panorama Persistence Layer v1.0
 
 영속성 레이어 - 이벤트와 에피소드를 영구 저장합니다.
-지원 포맷: JSON, SQLite
+지원 포맷: JSON, SQLite (WAL + 증분 저장)
 
 이 레이어가 있어야 "장기 기억"이라는 표현이 정확해집니다.
 - 프로세스가 종료되어도 기억이 유지됨
@@ -14,7 +14,7 @@ import json
 import sqlite3
 from dataclasses import asdict
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Dict, Any, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Dict, Any, Optional
 
 if TYPE_CHECKING:
     from .panorama_engine import PanoramaMemoryEngine, Event
@@ -84,12 +84,25 @@ class PanoramaPersistence:
         Returns:
             로드된 이벤트 수
         """
-        data = json.loads(Path(path).read_text())
+        from .panorama_engine import Event
+        
+        data = json.loads(Path(path).read_bytes())
+        events = data.get("events", [])
         
         if clear_existing:
-            self.engine.clear()
+            # 벌크 로드: 저장된 (시간 순) 이벤트로 한 번에 구성
+            return self.engine.load_events(
+                Event(
+                    id=event_data["id"],
+                    timestamp=float(event_data["timestamp"]),
+                    event_type=event_data["event_type"],
+                    payload=event_data.get("payload") or {},
+                    episode_id=event_data.get("episode_id"),
+                    importance=event_data.get("importance", 0.5),
+                )
+                for event_data in events
+            )
         
-        events = data.get("events", [])
         for event_data in events:
             self.engine.append_event(
                 timestamp=event_data["timestamp"],
@@ -105,99 +118,269 @@ class PanoramaPersistence:
     # ------------------------------------------------------------------
     # SQLite 저장/로드
     # ------------------------------------------------------------------
-    def save_sqlite(self, db_path: str) -> int:
+    def save_sqlite(self, db_path: str, incremental: bool = False, batch_size: int = 1000) -> int:
         """모든 이벤트를 SQLite DB로 저장
         
         Args:
             db_path: SQLite 파일 경로
+            incremental: True면 마지막 저장 이후 변경분만 기록
+                (save_sqlite_incremental 참조)
+            batch_size: executemany 배치 크기
             
         Returns:
             저장된 이벤트 수
         """
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        if incremental:
+            return self.save_sqlite_incremental(db_path, batch_size)["events"]
         
-        # 테이블 생성
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS panorama_events (
-                id TEXT PRIMARY KEY,
-                timestamp REAL NOT NULL,
-                event_type TEXT NOT NULL,
-                payload TEXT,
-                episode_id TEXT,
-                importance REAL DEFAULT 0.5
-            )
-        """)
+        seq = self.engine.change_seq
+        conn = self._connect(db_path)
+        try:
+            with conn:
+                # 기존 데이터 삭제 후 삽입 (하나의 트랜잭션)
+                count = self.write_sqlite(conn, incremental=False, batch_size=batch_size)["inserted"]
+        finally:
+            conn.close()
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_timestamp ON panorama_events(timestamp)
-        """)
+        self.engine.trim_changes(seq)
+        return count
+    
+    def save_sqlite_incremental(self, db_path: str, batch_size: int = 1000) -> Dict[str, int]:
+        """마지막 저장 이후 추가/제거된 이벤트만 SQLite DB에 반영
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_episode ON panorama_events(episode_id)
-        """)
+        DB의 panorama_meta 테이블에 (journal_id, change_seq) 고수위 표시를
+        기록해 두고, 엔진의 변경 저널에서 그 이후 변경분만 꺼내 쓴다.
+        저장 비용은 전체 이벤트 수가 아니라 새 변경 수에 비례한다.
         
-        # 기존 데이터 삭제 후 삽입
-        cursor.execute("DELETE FROM panorama_events")
+        다른 엔진이 쓴 DB이거나 저널이 이미 잘려 나간 경우에는
+        전체 재작성으로 자동 전환한다.
         
-        count = 0
-        for event in self.engine._events:
-            cursor.execute("""
-                INSERT INTO panorama_events (id, timestamp, event_type, payload, episode_id, importance)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                event.id,
-                event.timestamp,
-                event.event_type,
-                json.dumps(event.payload, ensure_ascii=False),
-                event.episode_id,
-                event.importance,
-            ))
-            count += 1
+        Args:
+            db_path: SQLite 파일 경로
+            batch_size: executemany 배치 크기
+            
+        Returns:
+            {"events": 전체 이벤트 수, "inserted": 기록 행 수,
+             "deleted": 삭제 행 수, "full_rewrite": 0/1}
+        """
+        seq = self.engine.change_seq
+        conn = self._connect(db_path)
+        try:
+            with conn:
+                stats = self.write_sqlite(conn, incremental=True, batch_size=batch_size)
+        finally:
+            conn.close()
         
-        conn.commit()
-        conn.close()
-        return count
+        self.engine.trim_changes(seq)
+        return stats
+    
+    def write_sqlite(
+        self,
+        conn: sqlite3.Connection,
+        incremental: bool = True,
+        batch_size: int = 1000,
+    ) -> Dict[str, int]:
+        """열린 연결에 이벤트를 반영 (커밋하지 않음)
+        
+        다른 상태와 한 트랜잭션으로 묶어 저장할 때 사용한다.
+        스키마는 create_schema 로 미리 만들어 두어야 하며,
+        커밋이 끝나면 호출자가 engine.trim_changes(호출 전 change_seq) 로
+        저널을 정리한다.
+        
+        Returns:
+            save_sqlite_incremental 과 같은 통계
+        """
+        engine = self.engine
+        seq = engine.change_seq
+        
+        changes = None
+        if incremental:
+            meta = self._read_meta(conn)
+            if meta.get("journal_id") == engine.journal_id:
+                changes = engine.changes_since(int(meta.get("change_seq", -1)))
+        
+        if changes is None:
+            conn.execute("DELETE FROM panorama_events")
+            added, removed = engine._events, []
+        else:
+            added, removed = changes
+        # 제거 → 추가 순서 (같은 ID 재추가는 INSERT OR REPLACE 로 덮어씀)
+        for start in range(0, len(removed), batch_size):
+            conn.executemany(
+                "DELETE FROM panorama_events WHERE id = ?",
+                [(event_id,) for event_id in removed[start:start + batch_size]],
+            )
+        inserted = self._insert_events(conn, added, batch_size)
+        self._write_meta(conn, seq)
+        
+        return {
+            "events": len(engine),
+            "inserted": inserted,
+            "deleted": len(removed),
+            "full_rewrite": int(changes is None),
+        }
     
-    def load_sqlite(self, db_path: str, clear_existing: bool = True) -> int:
+    def load_sqlite(self, db_path: str, clear_existing: bool = True, batch_size: int = 1000) -> int:
         """SQLite DB에서 이벤트 로드
         
+        행은 iter_sqlite 로 batch_size 단위로 스트리밍된다.
+        clear_existing=True 이면 engine.load_events 로 한 번에 구성하고,
+        로드 후 DB에 엔진의 고수위 표시를 기록하므로
+        이어지는 save_sqlite_incremental 은 변경분만 쓴다.
+        (max_events 초과로 일부 행을 버렸으면 다음 저장은 전체 재기록)
+        
         Args:
             db_path: SQLite 파일 경로
             clear_existing: True면 기존 이벤트 삭제 후 로드
+            batch_size: fetchmany 배치 크기
             
         Returns:
             로드된 이벤트 수
         """
         if clear_existing:
-            self.engine.clear()
-        
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT id, timestamp, event_type, payload, episode_id, importance
-            FROM panorama_events
-            ORDER BY timestamp ASC
-        """)
+            read = 0
+            
+            def rows() -> Iterator["Event"]:
+                nonlocal read
+                for event in self.iter_sqlite(db_path, batch_size):
+                    read += 1
+                    yield event
+            
+            # 벌크 로드 (ORDER BY timestamp 로 이미 정렬됨)
+            count = self.engine.load_events(rows())
+            # max_events 로 잘려 나간 행은 DB 에 남아 있으므로 동기화 표시를 하지 않는다
+            # (새 journal_id 와 어긋나 다음 저장은 전체 재기록)
+            if count == read:
+                self._mark_synced(db_path)
+            return count
         
         count = 0
-        for row in cursor.fetchall():
-            event_id, timestamp, event_type, payload_str, episode_id, importance = row
-            payload = json.loads(payload_str) if payload_str else {}
-            
+        for event in self.iter_sqlite(db_path, batch_size):
             self.engine.append_event(
-                timestamp=timestamp,
-                event_type=event_type,
-                payload=payload,
-                episode_id=episode_id,
-                importance=importance or 0.5,
-                event_id=event_id,
+                timestamp=event.timestamp,
+                event_type=event.event_type,
+                payload=event.payload,
+                episode_id=event.episode_id,
+                importance=event.importance,
+                event_id=event.id,
             )
             count += 1
+        return count
+    
+    def iter_sqlite(self, db_path: str, batch_size: int = 1000) -> Iterator["Event"]:
+        """SQLite DB의 이벤트를 시간 순으로 지연 순회
         
-        conn.close()
+        전체 결과를 한 번에 메모리에 올리지 않고 fetchmany 로 나눠 읽는다.
+        엔진 상태는 바꾸지 않는다.
+        """
+        from .panorama_engine import Event
+        
+        conn = sqlite3.connect(db_path)
+        try:
+            cursor = conn.execute("""
+                SELECT id, timestamp, event_type, payload, episode_id, importance
+                FROM panorama_events
+                ORDER BY timestamp ASC
+            """)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for event_id, timestamp, event_type, payload_str, episode_id, importance in rows:
+                    yield Event(
+                        id=event_id,
+                        timestamp=timestamp,
+                        event_type=event_type,
+                        payload=json.loads(payload_str) if payload_str else {},
+                        episode_id=episode_id,
+                        importance=importance or 0.5,
+                    )
+        finally:
+            conn.close()
+    
+    # ------------------------------------------------------------------
+    # SQLite 내부 헬퍼
+    # ------------------------------------------------------------------
+    @classmethod
+    def _connect(cls, db_path: str) -> sqlite3.Connection:
+        """WAL 모드로 연결하고 스키마를 준비"""
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        cls.create_schema(conn)
+        return conn
+    
+    @staticmethod
+    def create_schema(conn: sqlite3.Connection) -> None:
+        """panorama_events / panorama_meta 테이블 생성 (없을 때만)"""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS panorama_events (
+                id TEXT PRIMARY KEY,
+                timestamp REAL NOT NULL,
+                event_type TEXT NOT NULL,
+                payload TEXT,
+                episode_id TEXT,
+                importance REAL DEFAULT 0.5
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON panorama_events(timestamp)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_episode ON panorama_events(episode_id)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS panorama_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """)
+        conn.commit()
+    
+    @staticmethod
+    def _insert_events(conn: sqlite3.Connection, events: Iterable["Event"], batch_size: int) -> int:
+        """이벤트를 executemany 배치로 기록 (INSERT OR REPLACE)"""
+        sql = """
+            INSERT OR REPLACE INTO panorama_events
+                (id, timestamp, event_type, payload, episode_id, importance)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """
+        count = 0
+        batch: List[tuple] = []
+        for event in events:
+            batch.append((
+                event.id,
+                event.timestamp,
+                event.event_type,
+                json.dumps(event.payload, ensure_ascii=False),
+                event.episode_id,
+                event.importance,
+            ))
+            if len(batch) >= batch_size:
+                conn.executemany(sql, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            conn.executemany(sql, batch)
+            count += len(batch)
         return count
+    
+    @staticmethod
+    def _read_meta(conn: sqlite3.Connection) -> Dict[str, str]:
+        return dict(conn.execute("SELECT key, value FROM panorama_meta").fetchall())
+    
+    def _write_meta(self, conn: sqlite3.Connection, seq: int) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO panorama_meta (key, value) VALUES (?, ?)",
+            [("journal_id", self.engine.journal_id), ("change_seq", str(seq))],
+        )
+    
+    def _mark_synced(self, db_path: str) -> None:
+        """엔진 내용이 DB와 같음을 기록 (다음 증분 저장의 기준점)"""
+        seq = self.engine.change_seq
+        conn = self._connect(db_path)
+        try:
+            with conn:
+                self._write_meta(conn, seq)
+        finally:
+            conn.close()
+        self.engine.trim_changes(seq)
 
 
 # ------------------------------------------------------------------
@@ -213,9 +396,9 @@ def load_from_json(engine: "PanoramaMemoryEngine", path: str, clear_existing: bo
     return PanoramaPersistence(engine).load_json(path, clear_existing)
 
 
-def save_to_sqlite(engine: "PanoramaMemoryEngine", path: str) -> int:
+def save_to_sqlite(engine: "PanoramaMemoryEngine", path: str, incremental: bool = False) -> int:
     """PanoramaMemoryEngine의 편의 메서드"""
-    return PanoramaPersistence(engine).save_sqlite(path)
+    return PanoramaPersistence(engine).save_sqlite(path, incremental=incremental)
 
 
 def load_from_sqlite(engine: "PanoramaMemoryEngine", path: str, clear_existing: bool = True) -> int:
@@ -0,0 +1,187 @@
+"""Event Timeline (Chunked Sorted Array)
+
+Panorama 의 시간 순 이벤트 저장소.
+- 이벤트를 고정 크기 청크(chunk) 리스트에 시간 순으로 보관
+- 순서대로 들어오는 append 는 마지막 청크 끝에 붙이는 O(1) fast path
+- 순서가 어긋난 이벤트는 청크 단위 이진 탐색 후 해당 청크에만 삽입
+- 가장 오래된 이벤트 제거(popleft)는 첫 청크에서만 일어나므로 O(청크 크기)
+
+list.insert / list.pop(0) 이 전체 타임라인을 밀어내던 O(n) 비용을 없앤다.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Union
+
+if TYPE_CHECKING:
+    from .panorama_engine import Event
+
+
+def _timestamp(event: "Event") -> float:
+    return event.timestamp
+
+
+class EventTimeline:
+    """시간 순 정렬 이벤트 저장소.
+
+    같은 timestamp 의 이벤트는 들어온 순서를 유지한다 (bisect_right 의미).
+    """
+
+    def __init__(self, chunk_size: int = 1024):
+        self._chunk_size = max(1, int(chunk_size))
+        self._chunks: List[List["Event"]] = []
+        self._chunk_ts: List[List[float]] = []   # 청크별 타임스탬프 (이진 탐색용)
+        self._maxes: List[float] = []            # 청크별 마지막 타임스탬프
+        self._len = 0
+
+    # ------------------------------------------------------------------
+    # 추가 / 제거
+    # ------------------------------------------------------------------
+    def append(self, event: "Event") -> None:
+        """이벤트 추가 (정렬 유지)."""
+        ts = event.timestamp
+        if self._chunks and ts < self._maxes[-1]:
+            self._insert(event)
+        else:
+            # fast path: 시간 순 append
+            if not self._chunks or len(self._chunks[-1]) >= self._chunk_size:
+                self._chunks.append([])
+                self._chunk_ts.append([])
+                self._maxes.append(ts)
+            self._chunks[-1].append(event)
+            self._chunk_ts[-1].append(ts)
+            self._maxes[-1] = ts
+        self._len += 1
+
+    def extend(self, events: Iterable["Event"]) -> None:
+        """여러 이벤트 추가 (append 반복과 같은 순서).
+
+        새 이벤트를 안정 정렬한 뒤, 기존 마지막 시각 이후면 fast path 로 이어 붙이고,
+        과거 시점 이벤트가 많으면 (삽입 비용 > 전체 재구성 비용) 기존 내용과
+        한 번에 병합해 청크를 다시 만든다. 같은 timestamp 는 기존 → 새 이벤트
+        (들어온 순서) 순으로 놓인다.
+        """
+        ordered = sorted(events, key=_timestamp)
+        if not ordered:
+            return
+
+        if self._chunks:
+            last = self._maxes[-1]
+            late = bisect.bisect_left([e.timestamp for e in ordered], last)
+            if late * self._chunk_size > self._len:
+                merged = list(heapq.merge(chain.from_iterable(self._chunks), ordered, key=_timestamp))
+                self.load_sorted(merged)
+                return
+
+        for event in ordered:
+            self.append(event)
+
+    def _insert(self, event: "Event") -> None:
+        """순서가 어긋난 이벤트를 해당 청크에 삽입."""
+        ts = event.timestamp
+        # ts 보다 큰 원소를 가진 첫 청크 (ts < maxes[-1] 이므로 항상 존재)
+        ci = bisect.bisect_right(self._maxes, ts)
+        chunk_ts = self._chunk_ts[ci]
+        pos = bisect.bisect_right(chunk_ts, ts)
+        self._chunks[ci].insert(pos, event)
+        chunk_ts.insert(pos, ts)
+
+        # 청크가 너무 커지면 반으로 분할
+        if len(chunk_ts) > 2 * self._chunk_size:
+            half = len(chunk_ts) // 2
+            chunk = self._chunks[ci]
+            self._chunks[ci:ci + 1] = [chunk[:half], chunk[half:]]
+            self._chunk_ts[ci:ci + 1] = [chunk_ts[:half], chunk_ts[half:]]
+            self._maxes[ci:ci + 1] = [chunk_ts[half - 1], chunk_ts[-1]]
+
+    def popleft(self) -> "Event":
+        """가장 오래된 이벤트 제거 후 반환."""
+        if not self._chunks:
+            raise IndexError("pop from empty timeline")
+        event = self._chunks[0].pop(0)
+        self._chunk_ts[0].pop(0)
+        if not self._chunks[0]:
+            del self._chunks[0]
+            del self._chunk_ts[0]
+            del self._maxes[0]
+        self._len -= 1
+        return event
+
+    def load_sorted(self, events: List["Event"]) -> None:
+        """시간 순으로 정렬된 이벤트로 전체 내용을 교체 (벌크 로드).
+
+        정렬 여부는 검사하지 않는다 (호출자가 보장).
+        """
+        size = self._chunk_size
+        self._chunks = [events[i:i + size] for i in range(0, len(events), size)]
+        self._chunk_ts = [[e.timestamp for e in chunk] for chunk in self._chunks]
+        self._maxes = [chunk_ts[-1] for chunk_ts in self._chunk_ts]
+        self._len = len(events)
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._chunk_ts.clear()
+        self._maxes.clear()
+        self._len = 0
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def range(self, t_start: float, t_end: float) -> List["Event"]:
+        """timestamp ∈ [t_start, t_end] 인 이벤트 (시간 순)."""
+        ci = bisect.bisect_left(self._maxes, t_start)
+        if ci == len(self._chunks):
+            return []
+
+        pos = bisect.bisect_left(self._chunk_ts[ci], t_start)
+        result: List["Event"] = []
+        while ci < len(self._chunks):
+            chunk_ts = self._chunk_ts[ci]
+            if chunk_ts[-1] <= t_end:
+                result.extend(self._chunks[ci][pos:])
+            else:
+                end = bisect.bisect_right(chunk_ts, t_end, pos)
+                result.extend(self._chunks[ci][pos:end])
+                break
+            ci += 1
+            pos = 0
+        return result
+
+    def recent(self, n: int) -> List["Event"]:
+        """가장 최근 n개 이벤트 (가장 오래된 것부터)."""
+        if n <= 0:
+            return []
+        parts: List[List["Event"]] = []
+        remaining = n
+        for chunk in reversed(self._chunks):
+            if remaining <= 0:
+                break
+            parts.append(chunk[-remaining:] if remaining < len(chunk) else chunk)
+            remaining -= len(chunk)
+        return list(chain.from_iterable(reversed(parts)))
+
+    def to_list(self) -> List["Event"]:
+        """모든 이벤트 (시간 순)."""
+        return list(chain.from_iterable(self._chunks))
+
+    def __iter__(self) -> Iterator["Event"]:
+        return chain.from_iterable(self._chunks)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("timeline index out of range")
+        for chunk in self._chunks:
+            if index < len(chunk):
+                return chunk[index]
+            index -= len(chunk)
+        raise IndexError("timeline index out of range")
@@ -1,12 +1,25 @@
 from .config import PFCConfig
-from .models import WorkingMemorySlot, Action, ActionResult, ActionStatus
+from .models import (
+    WorkingMemorySlot,
+    Action,
+    ActionResult,
+    ActionStatus,
+    ArraySelectionResult,
+    ACTION_DTYPE,
+    actions_to_array,
+)
+from .working_memory import WorkingMemoryStore
 from .pfc_engine import PFCEngine
 
 __all__ = [
     "PFCConfig",
     "PFCEngine",
     "WorkingMemorySlot",
+    "WorkingMemoryStore",
     "Action",
     "ActionResult",
     "ActionStatus",
+    "ArraySelectionResult",
+    "ACTION_DTYPE",
+    "actions_to_array",
 ]
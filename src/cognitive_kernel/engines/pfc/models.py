@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
-from typing import Any, Optional, List
+from typing import Any, Optional, List, Sequence
 from enum import Enum
 import uuid
 
+import numpy as np
+
 
 class ActionStatus(Enum):
     """행동 상태."""
@@ -85,3 +87,41 @@ class ActionResult:
     inhibited: bool
     conflict_signal: float
     selection_probability: float
+
+
+# 행동 후보의 배열 표현 (구조화 배열 필드)
+ACTION_DTYPE = np.dtype([
+    ("expected_reward", np.float64),
+    ("effort_cost", np.float64),
+    ("risk", np.float64),
+])
+
+
+def actions_to_array(actions: Sequence[Action]) -> np.ndarray:
+    """Action 리스트 → ACTION_DTYPE 구조화 배열."""
+    return np.array(
+        [(a.expected_reward, a.effort_cost, a.risk) for a in actions],
+        dtype=ACTION_DTYPE,
+    )
+
+
+@dataclass
+class ArraySelectionResult:
+    """배열 경로 행동 선택 결과.
+
+    - index: 선택된 후보 인덱스 (후보가 없으면 -1, 억제돼도 인덱스는 유지)
+    - utility: 선택된 후보의 효용
+    - inhibited: 억제 여부
+    - conflict_signal: 갈등 신호 강도
+    - selection_probability: 선택 확률 (softmax)
+    - utilities: 전체 효용 배열
+    - probabilities: 전체 확률 배열
+    """
+
+    index: int
+    utility: float
+    inhibited: bool
+    conflict_signal: float
+    selection_probability: float
+    utilities: np.ndarray
+    probabilities: np.ndarray
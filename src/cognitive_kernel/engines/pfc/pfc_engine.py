@@ -13,11 +13,13 @@ from __future__ import annotations
 
 import math
 import time
-import uuid
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
+
+import numpy as np
 
 from .config import PFCConfig
-from .models import WorkingMemorySlot, Action, ActionResult
+from .models import WorkingMemorySlot, Action, ActionResult, ArraySelectionResult
+from .working_memory import WorkingMemoryStore
 
 
 class PFCEngine:
@@ -25,7 +27,7 @@ class PFCEngine:
 
     def __init__(self, config: Optional[PFCConfig] = None):
         self.config = config or PFCConfig()
-        self._working_memory: List[WorkingMemorySlot] = []
+        self._working_memory = WorkingMemoryStore(min_relevance=0.01)
         self._current_goal: Optional[str] = None
         self._current_goal_priority: float = 0.5
         self._last_update_time: float = time.time()
@@ -43,31 +45,18 @@ class PFCEngine:
 
         용량 초과 시 가장 낮은 relevance 항목 제거 (Miller's Law).
         """
-        slot_id = str(uuid.uuid4())
-        slot = WorkingMemorySlot(
-            id=slot_id,
-            content=content,
-            relevance=relevance,
-            timestamp=time.time(),
-            source=source,
+        return self._working_memory.add(
+            content,
+            relevance,
+            source,
+            capacity=self.config.working_memory_capacity,
         )
 
-        self._working_memory.append(slot)
-
-        # 용량 초과 시 eviction
-        while len(self._working_memory) > self.config.working_memory_capacity:
-            # 가장 낮은 relevance 항목 제거
-            min_idx = min(range(len(self._working_memory)),
-                          key=lambda i: self._working_memory[i].relevance)
-            self._working_memory.pop(min_idx)
-
-        return slot_id
-
     def load_from_memoryrank(
         self,
         top_memories: List[Tuple[str, float]],
     ) -> List[str]:
-        """MemoryRank 결과를 작업 기억에 로드.
+        """MemoryRank 결과를 작업 기억에 로드 (벌크).
 
         Args:
             top_memories: [(memory_id, rank_score), ...] from MemoryRank
@@ -75,21 +64,20 @@ class PFCEngine:
         Returns:
             생성된 슬롯 ID 리스트
         """
-        slot_ids = []
-        for memory_id, score in top_memories:
-            # rank score를 relevance로 변환 (정규화)
-            relevance = min(1.0, score * 2.0)  # score는 보통 0~0.5 범위
-            sid = self.load_to_working_memory(
-                content={"memory_id": memory_id, "rank_score": score},
-                relevance=relevance,
-                source="memoryrank",
-            )
-            slot_ids.append(sid)
-        return slot_ids
+        # rank score를 relevance로 변환 (정규화, score는 보통 0~0.5 범위)
+        items = [
+            ({"memory_id": memory_id, "rank_score": score}, min(1.0, score * 2.0))
+            for memory_id, score in top_memories
+        ]
+        return self._working_memory.add_many(
+            items,
+            source="memoryrank",
+            capacity=self.config.working_memory_capacity,
+        )
 
     def get_working_memory(self) -> List[WorkingMemorySlot]:
         """현재 작업 기억 내용 반환."""
-        return list(self._working_memory)
+        return self._working_memory.slots()
 
     def clear_working_memory(self) -> None:
         """작업 기억 초기화."""
@@ -99,20 +87,14 @@ class PFCEngine:
         """시간 경과에 따른 작업 기억 감쇠 적용.
 
         relevance(t) = relevance_0 × exp(-λ × Δt)
+        (전역 배율만 갱신, relevance 가 0.01 미만인 항목은 제거)
         """
         now = time.time()
         if dt is None:
             dt = now - self._last_update_time
         self._last_update_time = now
 
-        decay_factor = math.exp(-self.config.decay_rate * dt)
-
-        for slot in self._working_memory:
-            # frozen이 아니므로 직접 수정
-            object.__setattr__(slot, 'relevance', slot.relevance * decay_factor)
-
-        # relevance가 너무 낮은 항목 제거 (0.01 미만)
-        self._working_memory = [s for s in self._working_memory if s.relevance >= 0.01]
+        self._working_memory.decay(math.exp(-self.config.decay_rate * dt))
 
     # ------------------------------------------------------------------
     # Goal Management (v1.0: 단일 목표만)
@@ -212,12 +194,16 @@ class PFCEngine:
         self,
         actions: List[Action],
         deterministic: bool = False,
+        utilities: Optional[List[float]] = None,
+        probabilities: Optional[List[float]] = None,
     ) -> ActionResult:
         """행동 선택 (Softmax 또는 argmax).
 
         Args:
             actions: 후보 행동 리스트
             deterministic: True면 argmax, False면 softmax 샘플링
+            utilities: 이미 계산한 효용 (없으면 evaluate_action 으로 계산)
+            probabilities: 이미 계산한 softmax 확률 (없으면 계산)
 
         Returns:
             ActionResult (선택된 행동, 효용, 억제 여부 등)
@@ -231,9 +217,11 @@ class PFCEngine:
                 selection_probability=0.0,
             )
 
-        # 효용 계산
-        utilities = [self.evaluate_action(a) for a in actions]
-        probabilities = self.softmax_probabilities(utilities)
+        # 효용 계산 (호출자가 이미 계산했으면 재사용)
+        if utilities is None:
+            utilities = [self.evaluate_action(a) for a in actions]
+        if probabilities is None:
+            probabilities = self.softmax_probabilities(utilities)
 
         # 선택
         if deterministic:
@@ -275,6 +263,149 @@ class PFCEngine:
             selection_probability=selected_prob,
         )
 
+    # ------------------------------------------------------------------
+    # Array Path (대규모 후보 집합용)
+    # ------------------------------------------------------------------
+    def evaluate_array(
+        self,
+        rewards: np.ndarray,
+        costs: Union[np.ndarray, float] = 0.0,
+        risks: Union[np.ndarray, float] = 0.0,
+    ) -> np.ndarray:
+        """효용 배열 계산 (evaluate_action 의 벡터 버전).
+
+        rewards 가 ACTION_DTYPE 구조화 배열이면 costs/risks 는 무시하고
+        배열의 필드를 사용한다. 값은 Action 과 같이 [0, 1] 로 클리핑된다.
+
+        U = clip(reward) - clip(cost) - clip(risk) × risk_aversion
+        """
+        rewards, costs, risks = self._action_columns(rewards, costs, risks)
+        return rewards - costs - risks * self.config.risk_aversion
+
+    def softmax_array(self, utilities: np.ndarray) -> np.ndarray:
+        """Softmax 확률 배열 (softmax_probabilities 의 벡터 버전)."""
+        utilities = np.asarray(utilities, dtype=float)
+        if utilities.size == 0:
+            return np.zeros(0, dtype=float)
+        exp_values = np.exp(self.config.decision_temperature * (utilities - utilities.max()))
+        total = exp_values.sum()
+        if total == 0:
+            return np.full(utilities.shape, 1.0 / utilities.size)
+        return exp_values / total
+
+    def conflict_signal_array(
+        self,
+        utilities: np.ndarray,
+        index: int,
+        risks: Optional[np.ndarray] = None,
+    ) -> float:
+        """index 후보의 갈등 신호 (calculate_conflict_signal 의 벡터 버전).
+
+        경쟁 후보 최대 효용은 상위 2개만 보고 구한다 (후보당 재평가 없음).
+        """
+        utilities = np.asarray(utilities, dtype=float)
+        current = float(utilities[index])
+        risk_conflict = float(risks[index]) if risks is not None else 0.0
+
+        competition_conflict = 0.0
+        n = utilities.size
+        if n > 1:
+            top = int(np.argmax(utilities))
+            if top != index:
+                max_competing = float(utilities[top])
+            else:
+                max_competing = float(np.partition(utilities, n - 2)[n - 2])
+            if max_competing > current:
+                competition_conflict = max_competing - current
+
+        return min(1.0, max(risk_conflict, competition_conflict))
+
+    def select_array(
+        self,
+        values: np.ndarray,
+        deterministic: bool = False,
+        probabilities: Optional[np.ndarray] = None,
+        rng: Optional[np.random.Generator] = None,
+    ) -> ArraySelectionResult:
+        """배열 기반 행동 선택 (select_action 의 벡터 버전).
+
+        Args:
+            values: 효용 배열, 또는 ACTION_DTYPE 구조화 배열 (효용은 evaluate_array)
+            deterministic: True면 argmax, False면 softmax 샘플링
+            probabilities: 이미 계산한 softmax 확률 (없으면 계산)
+            rng: 샘플링용 numpy Generator (None이면 random.random() 사용 →
+                 select_action 과 같은 난수 흐름)
+
+        Returns:
+            ArraySelectionResult
+        """
+        values = np.asarray(values)
+        risks = None
+        if values.dtype.names:
+            rewards, costs, risks = self._action_columns(values, 0.0, 0.0)
+            utilities = rewards - costs - risks * self.config.risk_aversion
+        else:
+            utilities = values.astype(float, copy=False)
+
+        if utilities.size == 0:
+            return ArraySelectionResult(
+                index=-1,
+                utility=0.0,
+                inhibited=False,
+                conflict_signal=0.0,
+                selection_probability=0.0,
+                utilities=utilities,
+                probabilities=np.zeros(0, dtype=float),
+            )
+
+        if probabilities is None:
+            probabilities = self.softmax_array(utilities)
+        else:
+            probabilities = np.asarray(probabilities, dtype=float)
+
+        # 선택
+        if deterministic:
+            index = int(np.argmax(utilities))
+        else:
+            if rng is None:
+                import random
+                r = random.random()
+            else:
+                r = float(rng.random())
+            # 누적합이 r 을 처음 넘는 후보 (없으면 마지막)
+            index = int(np.searchsorted(np.cumsum(probabilities), r, side="right"))
+            index = min(index, utilities.size - 1)
+
+        # 억제 체크
+        conflict_signal = self.conflict_signal_array(utilities, index, risks)
+        return ArraySelectionResult(
+            index=index,
+            utility=float(utilities[index]),
+            inhibited=conflict_signal > self.config.inhibition_threshold,
+            conflict_signal=conflict_signal,
+            selection_probability=float(probabilities[index]),
+            utilities=utilities,
+            probabilities=probabilities,
+        )
+
+    @staticmethod
+    def _action_columns(
+        rewards: np.ndarray,
+        costs: Union[np.ndarray, float],
+        risks: Union[np.ndarray, float],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(reward, cost, risk) 열을 [0, 1] 로 클리핑해 반환."""
+        rewards = np.asarray(rewards)
+        if rewards.dtype.names:
+            costs = rewards["effort_cost"]
+            risks = rewards["risk"]
+            rewards = rewards["expected_reward"]
+        return (
+            np.clip(np.asarray(rewards, dtype=float), 0.0, 1.0),
+            np.clip(np.asarray(costs, dtype=float), 0.0, 1.0),
+            np.clip(np.asarray(risks, dtype=float), 0.0, 1.0),
+        )
+
     # ------------------------------------------------------------------
     # Integrated Pipeline
     # ------------------------------------------------------------------
@@ -285,6 +416,8 @@ class PFCEngine:
         goal: Optional[str] = None,
         goal_priority: float = 0.5,
         deterministic: bool = False,
+        utilities: Optional[List[float]] = None,
+        probabilities: Optional[List[float]] = None,
     ) -> ActionResult:
         """통합 처리 파이프라인.
 
@@ -299,6 +432,8 @@ class PFCEngine:
             goal: 현재 목표 (optional)
             goal_priority: 목표 우선순위
             deterministic: argmax 선택 여부
+            utilities: 이미 계산한 효용 (select_action 참조)
+            probabilities: 이미 계산한 softmax 확률
 
         Returns:
             ActionResult
@@ -315,7 +450,7 @@ class PFCEngine:
         self.update_decay()
 
         # 4. 행동 선택
-        return self.select_action(candidate_actions, deterministic)
+        return self.select_action(candidate_actions, deterministic, utilities, probabilities)
 
     # ------------------------------------------------------------------
     # Utility
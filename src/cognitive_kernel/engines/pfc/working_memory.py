@@ -0,0 +1,178 @@
+"""Working Memory Store (Parallel Arrays + Min-Heap)
+
+PFC 작업 기억 저장소.
+- 슬롯 필드(id / content / relevance / timestamp / source)를 병렬 리스트에 보관
+- relevance 기준 최소 힙으로 용량 초과 시 가장 약한 슬롯을 O(log n) 에 제거
+- 감쇠는 전역 배율(scale) 하나만 갱신하는 지연(lazy) 방식:
+    실제 relevance = 저장값 × scale
+  모든 슬롯에 같은 배율이 곱해지므로 힙 순서는 바뀌지 않는다
+- 슬롯 ID 는 저장소마다 한 번 만든 접두어 + 일련번호 (슬롯마다 uuid4 를 만들지 않음)
+
+슬롯마다 object.__setattr__ 로 감쇠를 적용하고 리스트를 다시 만들던 비용을 없앤다.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+import uuid
+from typing import Any, List, Optional, Sequence, Tuple
+
+from .models import WorkingMemorySlot
+
+
+class WorkingMemoryStore:
+    """relevance 최소 힙 기반 작업 기억 저장소.
+
+    같은 relevance 끼리는 먼저 들어온 슬롯이 먼저 제거된다.
+    """
+
+    # scale 이 이 값보다 작아지면 저장값을 다시 정규화 (언더플로 방지)
+    _RENORMALIZE_BELOW = 1e-150
+
+    def __init__(self, min_relevance: float = 0.01):
+        self.min_relevance = min_relevance
+        self._prefix = uuid.uuid4().hex[:12]
+        self._next_seq = 0
+        self._scale = 1.0
+
+        # 병렬 배열 (위치 = 슬롯 번호, 빈 칸은 _free 로 재사용)
+        self._ids: List[Optional[str]] = []
+        self._contents: List[Any] = []
+        self._stored: List[float] = []        # relevance / scale
+        self._timestamps: List[float] = []
+        self._sources: List[str] = []
+        self._seqs: List[int] = []
+        self._free: List[int] = []
+
+        # (저장 relevance, seq, 위치)
+        self._heap: List[Tuple[float, int, int]] = []
+
+    # ------------------------------------------------------------------
+    # 추가 / 제거
+    # ------------------------------------------------------------------
+    def add(
+        self,
+        content: Any,
+        relevance: float,
+        source: str = "external",
+        capacity: Optional[int] = None,
+    ) -> str:
+        """슬롯 하나 추가 후 용량 초과분 제거. 슬롯 ID 반환."""
+        return self.add_many([(content, relevance)], source, capacity)[0]
+
+    def add_many(
+        self,
+        items: Sequence[Tuple[Any, float]],
+        source: str = "external",
+        capacity: Optional[int] = None,
+    ) -> List[str]:
+        """(content, relevance) 여러 개를 한 번에 추가 (벌크 로드).
+
+        모두 넣은 뒤 한 번에 용량을 맞추므로, 하나씩 add() 한 것과
+        같은 슬롯이 남는다 (가장 relevance 가 높은 capacity 개).
+        """
+        if not items:
+            return []
+
+        now = time.time()
+        scale = self._scale
+        slot_ids: List[str] = []
+        entries: List[Tuple[float, int, int]] = []
+        for content, relevance in items:
+            relevance = max(0.0, min(1.0, float(relevance)))
+            seq = self._next_seq
+            self._next_seq += 1
+            slot_id = f"{self._prefix}-{seq}"
+            stored = relevance / scale
+
+            if self._free:
+                pos = self._free.pop()
+                self._ids[pos] = slot_id
+                self._contents[pos] = content
+                self._stored[pos] = stored
+                self._timestamps[pos] = now
+                self._sources[pos] = source
+                self._seqs[pos] = seq
+            else:
+                pos = len(self._ids)
+                self._ids.append(slot_id)
+                self._contents.append(content)
+                self._stored.append(stored)
+                self._timestamps.append(now)
+                self._sources.append(source)
+                self._seqs.append(seq)
+
+            slot_ids.append(slot_id)
+            entries.append((stored, seq, pos))
+
+        if len(entries) == 1:
+            heapq.heappush(self._heap, entries[0])
+        else:
+            self._heap.extend(entries)
+            heapq.heapify(self._heap)
+
+        if capacity is not None:
+            while len(self._heap) > capacity:
+                self._pop_weakest()
+        return slot_ids
+
+    def decay(self, factor: float) -> None:
+        """모든 슬롯의 relevance 에 factor 를 곱하고 min_relevance 미만을 제거."""
+        self._scale *= factor
+        threshold = self.min_relevance
+        while self._heap and self._heap[0][0] * self._scale < threshold:
+            self._pop_weakest()
+
+        if not self._heap:
+            self._scale = 1.0
+        elif self._scale < self._RENORMALIZE_BELOW:
+            self._renormalize()
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._contents.clear()
+        self._stored.clear()
+        self._timestamps.clear()
+        self._sources.clear()
+        self._seqs.clear()
+        self._free.clear()
+        self._heap.clear()
+        self._scale = 1.0
+
+    def _pop_weakest(self) -> None:
+        _, _, pos = heapq.heappop(self._heap)
+        self._ids[pos] = None
+        self._contents[pos] = None
+        self._free.append(pos)
+
+    def _renormalize(self) -> None:
+        """저장값에 scale 을 반영하고 scale 을 1 로 되돌림 (순서 불변)."""
+        scale = self._scale
+        stored = self._stored
+        self._heap = [(stored[pos] * scale, seq, pos) for _, seq, pos in self._heap]
+        for _, _, pos in self._heap:
+            stored[pos] *= scale
+        heapq.heapify(self._heap)
+        self._scale = 1.0
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def slots(self) -> List[WorkingMemorySlot]:
+        """현재 슬롯들 (들어온 순서, relevance 는 감쇠 반영값)."""
+        positions = sorted((pos for _, _, pos in self._heap), key=self._seqs.__getitem__)
+        scale = self._scale
+        return [
+            WorkingMemorySlot(
+                id=self._ids[pos],
+                content=self._contents[pos],
+                relevance=self._stored[pos] * scale,
+                timestamp=self._timestamps[pos],
+                source=self._sources[pos],
+            )
+            for pos in positions
+        ]
+
+    def __len__(self) -> int:
+        return len(self._heap)
@@ -31,6 +31,7 @@ Blockchain: PHAM v4 (Signed)
 from .thalamus_engine import ThalamusEngine
 from .config import ThalamusConfig
 from .data_types import SensoryInput, FilteredOutput, ModalityType
+from .salience import SalienceMatcher, NoveltyWindow
 
 __all__ = [
     'ThalamusEngine',
@@ -38,6 +39,8 @@ __all__ = [
     'SensoryInput',
     'FilteredOutput',
     'ModalityType',
+    'SalienceMatcher',
+    'NoveltyWindow',
 ]
 
 __version__ = "1.0.0"
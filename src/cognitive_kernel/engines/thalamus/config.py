@@ -37,6 +37,9 @@ class ThalamusConfig:
     # 채널 제한
     max_channels: int = 3  # 최대 통과 채널 수
     
+    # 배열 게이팅 (입력이 이 수 이상이면 NumPy 경로 사용)
+    array_gate_min_inputs: int = 64
+    
     # 입력 기록
     recent_inputs_maxlen: int = 50  # 최근 입력 기록 최대 길이
     
@@ -71,6 +74,7 @@ class ThalamusConfig:
         assert self.focus_boost > 0, "focus_boost must be positive"
         assert self.max_channels > 0, "max_channels must be positive"
         assert self.recent_inputs_maxlen > 0, "recent_inputs_maxlen must be positive"
+        assert self.array_gate_min_inputs >= 0, "array_gate_min_inputs must be non-negative"
         assert 0.0 <= self.energy_deficit_threshold <= 1.0, "energy_deficit_threshold must be in [0, 1]"
         assert self.energy_deficit_boost >= 0, "energy_deficit_boost must be non-negative"
 
@@ -0,0 +1,102 @@
+"""
+Thalamus Salience Matcher / Novelty Window
+시상 현저성 패턴 매처 + 신규성 창
+
+- SalienceMatcher: salient_patterns 카테고리마다 패턴을 정규식 하나로 미리 컴파일
+  (카테고리당 C 수준 검색 1회, 패턴마다 `in` 검사를 하지 않음)
+- NoveltyWindow: 최근 N개 입력의 정규화(소문자) 내용과 등장 횟수를 해시 테이블로 유지
+  (입력마다 최근 기록을 복사/소문자화하지 않고 O(1) 조회)
+
+Author: GNJz (Qquarts)
+Version: 1.0.0
+License: MIT License
+"""
+
+import re
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def content_key(content: Any) -> Optional[str]:
+    """신규성 비교용 정규화 내용 (텍스트가 아니면 None → 어떤 입력과도 같지 않음)"""
+    return content.lower() if isinstance(content, str) else None
+
+
+class SalienceMatcher:
+    """
+    현저성 패턴 매처
+
+    카테고리 순서대로, 패턴 중 하나라도 포함되면 그 카테고리의 부스트를 한 번 곱한다:
+        S = min(1, S × boost)   (threat 카테고리는 boost × 2)
+
+    Args:
+        salient_patterns: ThalamusConfig.salient_patterns
+        salience_boost: ThalamusConfig.salience_boost
+    """
+
+    def __init__(self, salient_patterns: Dict[str, List[str]], salience_boost: float):
+        self._entries: List[Tuple[Any, float]] = []
+        for category, patterns in salient_patterns.items():
+            if not patterns:
+                continue
+            boost = salience_boost
+            if category == 'threat':
+                boost *= 2  # 위협은 2배 부스트
+            # 긴 패턴을 앞에 두어도 "하나라도 포함" 판정은 같다
+            alternation = '|'.join(re.escape(p) for p in sorted(set(patterns), key=len, reverse=True))
+            self._entries.append((re.compile(alternation).search, boost))
+
+    def apply(self, salience: float, content_lower: str) -> float:
+        """매칭된 카테고리의 부스트를 순서대로 적용"""
+        for search, boost in self._entries:
+            if search(content_lower) is not None:
+                salience = min(1.0, salience * boost)
+        return salience
+
+
+class NoveltyWindow:
+    """
+    최근 입력 신규성 창
+
+    novelty = 1 - (창 안의 같은 내용 수 / 창 크기)
+
+    Args:
+        size: 창 크기 (최근 몇 개 입력과 비교할지)
+    """
+
+    def __init__(self, size: int):
+        self._keys: deque = deque(maxlen=size)
+        self._counts: Dict[str, int] = {}
+
+    def novelty(self, key: Optional[str]) -> float:
+        """0.0 (익숙함) ~ 1.0 (완전히 새로운), 창이 비어 있으면 1.0"""
+        if not self._keys:
+            return 1.0
+        similar_count = self._counts.get(key, 0) if key is not None else 0
+        novelty = 1.0 - (similar_count / len(self._keys))
+        return max(0.0, min(1.0, novelty))
+
+    def push(self, key: Optional[str]) -> None:
+        keys = self._keys
+        if len(keys) == keys.maxlen:
+            old = keys[0]
+            if old is not None:
+                remaining = self._counts[old] - 1
+                if remaining:
+                    self._counts[old] = remaining
+                else:
+                    del self._counts[old]
+        keys.append(key)
+        if key is not None:
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def extend(self, keys: Iterable[Optional[str]]) -> None:
+        for key in keys:
+            self.push(key)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._counts.clear()
+
+    def __len__(self) -> int:
+        return len(self._keys)
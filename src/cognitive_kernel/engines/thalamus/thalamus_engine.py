@@ -63,8 +63,15 @@ from typing import Dict, List, Tuple, Optional, Any
 from collections import defaultdict, deque
 from copy import deepcopy
 
+import numpy as np
+
 from .config import ThalamusConfig
 from .data_types import SensoryInput, FilteredOutput, ModalityType
+from .salience import SalienceMatcher, NoveltyWindow, content_key
+
+
+# 신규성 비교 대상 최근 입력 수
+NOVELTY_WINDOW = 10
 
 
 class ThalamusEngine:
@@ -136,6 +143,12 @@ class ThalamusEngine:
         # 최근 입력 기록
         self.recent_inputs: deque = deque(maxlen=self.config.recent_inputs_maxlen)
         
+        # 최근 입력의 정규화 내용 창 (recent_inputs 와 함께 갱신)
+        self._novelty = NoveltyWindow(min(NOVELTY_WINDOW, self.config.recent_inputs_maxlen))
+        
+        # 현저성 패턴 매처
+        self.compile_patterns()
+        
         # 통계
         self.stats = {
             'total_inputs': 0,
@@ -145,6 +158,17 @@ class ThalamusEngine:
             'energy_based_gating': 0,
         }
     
+    def compile_patterns(self):
+        """
+        salient_patterns 를 매처로 컴파일
+        
+        초기화 때 한 번 호출된다. 실행 중 config 의 패턴/부스트를 바꿨다면 다시 호출한다.
+        """
+        self._salience_matcher = SalienceMatcher(
+            self.config.salient_patterns,
+            self.config.salience_boost,
+        )
+    
     # ============================================
     # 핵심 기능: 필터링
     # ============================================
@@ -170,10 +194,20 @@ class ThalamusEngine:
         # 동적 게이트 임계값 계산 (에너지 기반)
         dynamic_threshold = self._compute_dynamic_threshold()
         
+        keys = [content_key(inp.content) for inp in inputs]
+        
+        if len(inputs) >= self.config.array_gate_min_inputs:
+            # 대량 입력: 배열 경로 (통과한 입력만 출력 객체 생성)
+            salience, weight, passed = self._gate_arrays(inputs, keys, dynamic_threshold)
+            outputs = self._select_channels(inputs, salience, weight, passed)
+            self.recent_inputs.extend(inputs)
+            self._novelty.extend(keys)
+            return outputs
+        
         # 입력 처리 (불변성 보장)
         processed_inputs = []
-        for inp in inputs:
-            computed_salience = self._calculate_salience(inp)
+        for inp, key in zip(inputs, keys):
+            computed_salience = self._calculate_salience(inp, key)
             processed_inputs.append((inp, computed_salience))
         
         # 주의 가중치 적용
@@ -190,9 +224,40 @@ class ThalamusEngine:
         
         # 기록
         self.recent_inputs.extend(inputs)
+        self._novelty.extend(keys)
         
         return outputs
     
+    def gate(self, inputs: List[SensoryInput]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        채널 제한 없는 게이팅 (수집 경로용)
+        
+        filter() 와 같은 현저성 / 주의 가중치 / 동적 임계값 계산과 통계·기록 갱신을
+        하되, 상위 max_channels 선택과 출력 객체 생성은 하지 않는다.
+        
+        Args:
+            inputs: 감각 입력 목록
+            
+        Returns:
+            (입력별 통과 여부 bool 배열, 입력별 계산된 현저성 배열) - 입력 순서
+        """
+        n = len(inputs)
+        if not self.consciousness_gate or n == 0:
+            return np.zeros(n, dtype=bool), np.zeros(n, dtype=np.float64)
+        
+        self.stats['total_inputs'] += n
+        self._auto_decay_attention()
+        dynamic_threshold = self._compute_dynamic_threshold()
+        
+        keys = [content_key(inp.content) for inp in inputs]
+        salience, _, passed = self._gate_arrays(inputs, keys, dynamic_threshold)
+        self.recent_inputs.extend(inputs)
+        self._novelty.extend(keys)
+        
+        mask = np.zeros(n, dtype=bool)
+        mask[passed] = True
+        return mask, salience
+    
     def filter_single(
         self,
         content: Any,
@@ -259,30 +324,27 @@ class ThalamusEngine:
         
         return base_threshold
     
-    def _calculate_salience(self, inp: SensoryInput) -> float:
+    def _calculate_salience(self, inp: SensoryInput, key: Optional[str] = None) -> float:
         """
         현저성 계산
         
         수식:
             S = base_salience × boost × intensity × arousal
         
+        Args:
+            inp: 감각 입력
+            key: 정규화(소문자) 내용 (None이면 여기서 계산)
+        
         Returns:
             계산된 현저성 (0~1)
         """
         base_salience = inp.salience  # prior
+        if key is None:
+            key = content_key(inp.content)
         
         # 텍스트인 경우 패턴 매칭
-        if isinstance(inp.content, str):
-            content_lower = inp.content.lower()
-            
-            for category, patterns in self.config.salient_patterns.items():
-                for pattern in patterns:
-                    if pattern in content_lower:
-                        boost = self.config.salience_boost
-                        if category == 'threat':
-                            boost *= 2  # 위협은 2배 부스트
-                        base_salience = min(1.0, base_salience * boost)
-                        break
+        if key is not None:
+            base_salience = self._salience_matcher.apply(base_salience, key)
         
         # 강도 반영
         base_salience *= inp.intensity
@@ -292,7 +354,7 @@ class ThalamusEngine:
         
         # 신규성 보너스
         if self.config.novelty_bonus > 0:
-            novelty = self._compute_novelty(inp)
+            novelty = self._novelty.novelty(key)
             base_salience += novelty * self.config.novelty_bonus
         
         return min(1.0, base_salience)
@@ -304,19 +366,105 @@ class ThalamusEngine:
         Returns:
             0.0 (익숙함) ~ 1.0 (완전히 새로운)
         """
-        if not self.recent_inputs:
-            return 1.0
+        return self._novelty.novelty(content_key(inp.content))
+    
+    def _gate_arrays(
+        self,
+        inputs: List[SensoryInput],
+        keys: List[Optional[str]],
+        threshold: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        배열 기반 현저성 → 주의 가중치 → 게이팅
+        
+        튜플 경로(_calculate_salience → _apply_attention → _gate)와 같은 값.
+        - 패턴 부스트 / 신규성 조회만 입력별로 하고, 나머지 연산은 배열로
+        - 차단된 입력은 카운터만 갱신
+        
+        Returns:
+            (현저성 배열, 주의 가중치 배열, 통과한 입력 인덱스)
+        """
+        n = len(inputs)
+        config = self.config
+        matcher = self._salience_matcher
+        
+        # 현저성: S = min(1, boosted_prior × intensity × arousal + novelty × bonus)
+        salience = np.fromiter(
+            (
+                matcher.apply(inp.salience, key) if key is not None else inp.salience
+                for inp, key in zip(inputs, keys)
+            ),
+            dtype=np.float64,
+            count=n,
+        )
+        salience *= np.fromiter((inp.intensity for inp in inputs), dtype=np.float64, count=n)
+        salience *= self.arousal_level
+        if config.novelty_bonus > 0:
+            novelty = np.fromiter(
+                (self._novelty.novelty(key) for key in keys), dtype=np.float64, count=n
+            )
+            salience += novelty * config.novelty_bonus
+        np.minimum(salience, 1.0, out=salience)
+        
+        # 주의 가중치: W = min(1, attention_weight[modality] × focus_boost × (1 + S))
+        attention_weights = self.attention_weights
+        weight = np.fromiter(
+            (attention_weights.get(inp.modality, 0.5) for inp in inputs),
+            dtype=np.float64,
+            count=n,
+        )
+        if self.attention_focus is not None:
+            focused = np.fromiter(
+                (inp.modality == self.attention_focus for inp in inputs), dtype=bool, count=n
+            )
+            weight[focused] *= config.focus_boost
+        weight *= 1 + salience
+        np.minimum(weight, 1.0, out=weight)
+        
+        # 게이팅
+        passed = np.flatnonzero(weight >= threshold)
+        self.stats['passed_gate'] += len(passed)
+        self.stats['blocked'] += n - len(passed)
+        return salience, weight, passed
+    
+    def _select_channels(
+        self,
+        inputs: List[SensoryInput],
+        salience: np.ndarray,
+        weight: np.ndarray,
+        passed: np.ndarray
+    ) -> List[FilteredOutput]:
+        """
+        채널 제한: 통과한 입력을 priority 로 안정 정렬한 뒤 앞 max_channels 개와 같은 선택
         
-        # 최근 입력과 유사도 계산
-        similar_count = 0
-        for recent in list(self.recent_inputs)[-10:]:  # 최근 10개만
-            if isinstance(inp.content, str) and isinstance(recent.content, str):
-                if inp.content.lower() == recent.content.lower():
-                    similar_count += 1
+        (priority, 입력 순서) 키의 부분 선택 후 선택된 k개만 정렬하고 출력 객체를 만든다.
+        """
+        if len(passed) == 0:
+            return []
+        
+        n = len(inputs)
+        priority = ((1 - weight[passed]) * 10).astype(np.int64)
+        order_key = priority * n + passed
+        k = self.config.max_channels
+        if len(passed) > k:
+            top = np.argpartition(order_key, k - 1)[:k]
+        else:
+            top = np.arange(len(passed))
+        top = top[np.argsort(order_key[top])]
         
-        # 유사도가 높을수록 novelty 낮음
-        novelty = 1.0 - (similar_count / min(10, len(self.recent_inputs)))
-        return max(0.0, min(1.0, novelty))
+        outputs = []
+        for j in top.tolist():
+            i = int(passed[j])
+            inp = inputs[i]
+            outputs.append(FilteredOutput(
+                content=inp.content,
+                modality=inp.modality,
+                attention_weight=float(weight[i]),
+                passed_gate=True,
+                priority=int(priority[j]),
+                computed_salience=float(salience[i])
+            ))
+        return outputs
     
     def _apply_attention(
         self,
@@ -481,6 +629,7 @@ class ThalamusEngine:
         self.arousal_level = 1.0
         self.consciousness_gate = True
         self.recent_inputs.clear()
+        self._novelty.clear()
         self.stats = {
             'total_inputs': 0,
             'passed_gate': 0,
@@ -0,0 +1,240 @@
+"""
+📥 Streaming Ingestion Service
+
+감각 입력 스트림을 비동기로 받아 장기 기억에 쌓는 수집 서비스.
+
+    AsyncIterator[SensoryInput]
+        → 입력 큐 (용량 제한 = 백프레셔)
+        → 마이크로 배치 (batch_size 개 또는 max_latency 초 중 먼저 도달)
+        → Thalamus 게이팅 (채널 제한 없음, 배열 경로)
+        → Amygdala 기억 강화 (배치 위협/감정 분석)
+        → Panorama 벌크 추가
+
+이벤트마다 filter / enhance_memory / remember 를 동기로 호출하던 통합 코드를
+대체한다. 같은 이벤트 루프에서 의사결정(decide)과 함께 돌릴 수 있도록
+배치 하나를 처리할 때마다 루프에 제어를 돌려준다. 엔진들은 스레드 안전하지
+않으므로 배치 처리는 루프 스레드에서 한다.
+
+사용 예시:
+    kernel = CognitiveKernel("my_brain")
+    service = IngestionService(kernel, IngestionConfig(batch_size=128))
+    stats = await service.run(sensor_stream())
+
+Author: GNJz (Qquarts)
+Version: 2.0.2
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional
+
+from .engines.thalamus import SensoryInput
+
+if TYPE_CHECKING:
+    from .core import CognitiveKernel
+
+
+# 입력 큐 종료 표시
+_STOP = object()
+
+
+@dataclass
+class IngestionConfig:
+    """수집 서비스 설정"""
+    batch_size: int = 256          # 마이크로 배치 최대 입력 수
+    max_latency: float = 0.05      # 배치 첫 입력 후 최대 대기 시간 (초)
+    queue_size: int = 4096         # 입력 큐 용량 (가득 차면 생산자 대기)
+    event_type: str = "sensory"    # Panorama 이벤트 종류
+    use_thalamus: bool = True      # Thalamus 게이팅 사용
+    use_amygdala: bool = True      # Amygdala 기억 강화 사용 (텍스트 입력만)
+
+    def validate(self) -> None:
+        assert self.batch_size > 0, "batch_size must be positive"
+        assert self.max_latency >= 0, "max_latency must be non-negative"
+        assert self.queue_size > 0, "queue_size must be positive"
+
+
+@dataclass
+class IngestionStats:
+    """수집 통계"""
+    received: int = 0     # 받은 입력 수
+    passed: int = 0       # 게이트 통과 수
+    stored: int = 0       # Panorama 에 저장된 기억 수
+    batches: int = 0      # 처리한 배치 수
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class IngestionService:
+    """
+    Thalamus → Amygdala → Panorama 비동기 수집 서비스
+
+    Args:
+        kernel: 기억을 쌓을 CognitiveKernel (thalamus / amygdala / panorama 사용)
+        config: 수집 설정
+    """
+
+    def __init__(self, kernel: "CognitiveKernel", config: Optional[IngestionConfig] = None):
+        self.kernel = kernel
+        self.config = config or IngestionConfig()
+        self.config.validate()
+        self.stats = IngestionStats()
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # 스트림 수집
+    # ------------------------------------------------------------------
+    async def run(self, source: AsyncIterable[SensoryInput]) -> IngestionStats:
+        """source 가 끝날 때까지 수집하고, 남은 배치까지 저장한 뒤 통계 반환"""
+        await self.start()
+        try:
+            async for inp in source:
+                await self.submit(inp)
+        finally:
+            await self.stop()
+        return self.stats
+
+    async def start(self) -> None:
+        """소비자 태스크 시작 (이후 submit 으로 입력 전달)"""
+        if self._consumer is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.config.queue_size)
+        self._consumer = asyncio.ensure_future(self._consume())
+
+    async def submit(self, inp: SensoryInput) -> None:
+        """입력 하나 전달 (큐가 가득 차면 빌 때까지 대기 = 백프레셔)
+
+        배치 처리가 실패해 소비자가 멈췄으면 그 예외를 다시 올린다.
+        """
+        if self._queue is None:
+            raise RuntimeError("IngestionService is not started")
+        await self._put(inp)
+
+    async def stop(self) -> None:
+        """큐에 남은 입력을 모두 처리한 뒤 소비자 종료 (소비자 예외는 다시 올림)"""
+        if self._consumer is None:
+            return
+        try:
+            await self._put(_STOP)
+            await self._consumer
+        finally:
+            self._consumer = None
+            self._queue = None
+
+    async def _put(self, item: Any) -> None:
+        """큐에 넣되, 기다리는 동안 소비자가 죽으면 대기를 풀고 그 예외를 올린다"""
+        consumer = self._consumer
+        if consumer.done():
+            consumer.result()
+            raise RuntimeError("IngestionService consumer has stopped")
+        if not self._queue.full():
+            self._queue.put_nowait(item)
+            return
+
+        put = asyncio.ensure_future(self._queue.put(item))
+        await asyncio.wait({put, consumer}, return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            consumer.result()
+            raise RuntimeError("IngestionService consumer has stopped")
+
+    async def _consume(self) -> None:
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        batch_size = self.config.batch_size
+        stopping = False
+
+        while not stopping:
+            item = await queue.get()
+            if item is _STOP:
+                break
+
+            # 마이크로 배치: batch_size 개 또는 max_latency 초
+            batch = [item]
+            deadline = loop.time() + self.config.max_latency
+            while len(batch) < batch_size:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self.process_batch(batch)
+            # 같은 루프의 다른 작업(의사결정 등)에 제어 양보
+            await asyncio.sleep(0)
+
+    # ------------------------------------------------------------------
+    # 배치 처리 (동기)
+    # ------------------------------------------------------------------
+    def process_batch(self, inputs: List[SensoryInput]) -> List[str]:
+        """
+        입력 배치 하나를 게이팅 → 강화 → 저장
+
+        Returns:
+            저장된 기억 ID 리스트 (입력 순서)
+        """
+        kernel = self.kernel
+        config = self.config
+        self.stats.received += len(inputs)
+        self.stats.batches += 1
+
+        # Thalamus 게이팅: 통과한 입력과 계산된 현저성
+        if config.use_thalamus:
+            passed, salience = kernel.thalamus.gate(inputs)
+            survivors = [
+                (inp, float(s))
+                for inp, ok, s in zip(inputs, passed.tolist(), salience.tolist())
+                if ok
+            ]
+        else:
+            survivors = [(inp, inp.salience) for inp in inputs]
+        self.stats.passed += len(survivors)
+        if not survivors:
+            return []
+
+        payloads: List[Dict[str, Any]] = [
+            {"content": inp.content, "modality": inp.modality.value, **inp.metadata}
+            for inp, _ in survivors
+        ]
+        importances = [s for _, s in survivors]
+
+        # Amygdala 기억 강화 (텍스트 입력만)
+        if config.use_amygdala:
+            text_positions = [
+                i for i, (inp, _) in enumerate(survivors) if isinstance(inp.content, str)
+            ]
+            if text_positions:
+                enhanced = kernel.amygdala.enhance_memory_many(
+                    [survivors[i][0].content for i in text_positions],
+                    [importances[i] for i in text_positions],
+                )
+                for i, info in zip(text_positions, enhanced):
+                    importances[i] = info['enhanced_importance']
+                    payloads[i]["emotion"] = info['emotion']['intensity']
+                    payloads[i]["threat"] = info['threat']['level']
+
+        event_ids = kernel.remember_many([
+            {
+                "timestamp": inp.timestamp,
+                "event_type": config.event_type,
+                "content": payload,
+                "importance": importance,
+            }
+            for (inp, _), payload, importance in zip(survivors, payloads, importances)
+        ])
+        self.stats.stored += len(event_ids)
+        return event_ids
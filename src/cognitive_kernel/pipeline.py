@@ -12,6 +12,8 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, field
 
+import numpy as np
+
 
 @dataclass
 class PipelineContext:
@@ -250,6 +252,248 @@ class UtilityRecalculationStep(PipelineStep):
         return context
 
 
+class FusedDecisionStep(PipelineStep):
+    """통합 의사결정 단계 (ActionCreation ~ UtilityRecalculation 을 한 번에)
+
+    기존 2-pass 경로(Action 생성 → PFC 결정 → 엔트로피/코어/토크 → Action 재생성 →
+    PFC 재결정)와 같은 결과를 내면서 중복 계산을 없앤다.
+    - 키워드/기억 관련성은 옵션당 한 번만 계산해 기본 보상 벡터로 보관
+    - 1차 확률은 엔트로피 계산에만 필요하므로 선택(샘플링) 없이 softmax 만 계산
+    - 토크는 벡터로 더하고, 최종 Action 생성과 PFC 선택은 한 번만 수행
+
+    1차 PFC 선택을 하지 않으므로 난수는 결정당 한 번만 소비된다.
+    """
+    
+    def __init__(
+        self,
+        pfc_engine,
+        dynamics_engine,
+        kernel,
+        mode,
+        calculate_relevance: Callable,
+        extract_keywords: Callable,
+        alpha: float = 0.5,
+        effort_cost: float = 0.2,
+        risk: float = 0.1,
+    ):
+        """
+        Args:
+            pfc_engine: PFCEngine 인스턴스
+            dynamics_engine: DynamicsEngine 인스턴스
+            kernel: CognitiveKernel 인스턴스 (mode_config 접근)
+            mode: 인지 모드 (CognitiveMode)
+        """
+        self.pfc_engine = pfc_engine
+        self.dynamics_engine = dynamics_engine
+        self.kernel = kernel
+        self.mode = mode
+        self.calculate_relevance = calculate_relevance
+        self.extract_keywords = extract_keywords
+        self.alpha = alpha
+        self.effort_cost = effort_cost
+        self.risk = risk
+    
+    def process(self, context: PipelineContext) -> PipelineContext:
+        """통합 결정"""
+        from .engines.pfc import Action
+        
+        options = context.options
+        
+        # 기본 보상 벡터: U_base = 0.5 + α · relevance (옵션당 한 번)
+        relevance = np.array(
+            [
+                self.calculate_relevance(self.extract_keywords(opt), context.memories)
+                for opt in options
+            ],
+            dtype=float,
+        )
+        base_reward = 0.5 + self.alpha * relevance
+        
+        # 1차 분포 (토크 없음) → 엔트로피
+        context.utilities = self._utilities(base_reward).tolist()
+        context.probabilities = self.pfc_engine.softmax_probabilities(context.utilities)
+        context.entropy = self.dynamics_engine.calculate_entropy(context.probabilities)
+        
+        # 코어 강도 + 인지적 절규
+        context.core_strength = self.dynamics_engine.calculate_core_strength(
+            context.memories,
+            memory_update_failure=self.kernel.mode_config.memory_update_failure,
+            alpha=self.dynamics_engine.config.memory_alpha,
+        )
+        distress, message = self.dynamics_engine.check_cognitive_distress(
+            context.entropy,
+            context.core_strength,
+            len(options),
+        )
+        context.metadata["cognitive_distress"] = distress
+        context.metadata["distress_message"] = message
+        
+        # 회전 토크 (벡터로 가산)
+        context.auto_torque = self.dynamics_engine.generate_torque(
+            options,
+            context.entropy,
+            self.mode,
+        )
+        context.metadata["precession_phi"] = self.dynamics_engine.state.precession_phi
+        
+        reward = base_reward
+        if context.auto_torque:
+            torque = np.array([context.auto_torque.get(opt, 0.0) for opt in options], dtype=float)
+            reward = base_reward + torque
+            context.utilities = self._utilities(reward).tolist()
+            context.probabilities = self.pfc_engine.softmax_probabilities(context.utilities)
+        
+        # 최종 Action 생성 + PFC 선택 (한 번)
+        context.actions = [
+            Action(
+                id=f"action_{i}",
+                name=opt,
+                expected_reward=r,
+                effort_cost=self.effort_cost,
+                risk=self.risk,
+            )
+            for i, (opt, r) in enumerate(zip(options, reward.tolist()))
+        ]
+        context.metadata["pfc_result"] = self.pfc_engine.process(
+            context.actions,
+            utilities=context.utilities,
+            probabilities=context.probabilities,
+        )
+        return context
+    
+    def prepare_many(
+        self,
+        option_lists: List[List[str]],
+        memories: List[Dict[str, Any]],
+    ) -> List[PipelineContext]:
+        """여러 옵션 집합의 최종 분포를 한 번에 계산 (같은 기억 스냅샷 공유)
+        
+        효용/softmax/엔트로피는 (B, L) 패딩 배열로 한꺼번에 계산한다.
+        상태가 있는 동역학 단계(코어 강도 → 절규 → 토크, 위상 φ 진행)는
+        option_lists 순서대로 하나씩 수행된다. PFC 선택은 하지 않으므로
+        호출자가 순서대로 select() 를 불러야 한다.
+        
+        Args:
+            option_lists: 옵션 리스트들
+            memories: 공유할 기억 리스트 (recall 결과)
+            
+        Returns:
+            option_lists 순서의 PipelineContext 리스트
+        """
+        batch = len(option_lists)
+        lengths = np.array([len(opts) for opts in option_lists], dtype=np.int64)
+        width = int(lengths.max()) if batch else 0
+        mask = np.arange(width)[None, :] < lengths[:, None]
+        
+        # 기본 보상 행렬 (관련성은 서로 다른 옵션 문자열당 한 번만 계산)
+        relevance_cache: Dict[str, float] = {}
+        relevance = np.zeros((batch, width), dtype=float)
+        for b, options in enumerate(option_lists):
+            for i, opt in enumerate(options):
+                score = relevance_cache.get(opt)
+                if score is None:
+                    score = relevance_cache[opt] = self.calculate_relevance(
+                        self.extract_keywords(opt), memories
+                    )
+                relevance[b, i] = score
+        base_reward = 0.5 + self.alpha * relevance
+        
+        # 1차 분포 (토크 없음) → 엔트로피
+        utilities = self._utilities(base_reward)
+        probabilities = _masked_softmax(
+            utilities, mask, self.pfc_engine.config.decision_temperature
+        )
+        entropies = self.dynamics_engine.calculate_entropy_many(probabilities)
+        
+        # 코어 강도 / 절규 / 토크 (순서대로, 위상 φ 가 결정마다 진행)
+        contexts: List[PipelineContext] = []
+        torque = np.zeros((batch, width), dtype=float)
+        for b, options in enumerate(option_lists):
+            context = PipelineContext(options=options, memories=memories)
+            context.entropy = float(entropies[b])
+            context.core_strength = self.dynamics_engine.calculate_core_strength(
+                memories,
+                memory_update_failure=self.kernel.mode_config.memory_update_failure,
+                alpha=self.dynamics_engine.config.memory_alpha,
+            )
+            distress, message = self.dynamics_engine.check_cognitive_distress(
+                context.entropy,
+                context.core_strength,
+                len(options),
+            )
+            context.metadata["cognitive_distress"] = distress
+            context.metadata["distress_message"] = message
+            context.auto_torque = self.dynamics_engine.generate_torque(
+                options,
+                context.entropy,
+                self.mode,
+            )
+            context.metadata["precession_phi"] = self.dynamics_engine.state.precession_phi
+            if context.auto_torque:
+                torque[b, :len(options)] = [context.auto_torque.get(opt, 0.0) for opt in options]
+            contexts.append(context)
+        
+        # 토크 반영 후 최종 분포 (토크가 있는 행만 교체)
+        has_torque = np.array([bool(c.auto_torque) for c in contexts], dtype=bool)
+        reward = base_reward + torque
+        if has_torque.any():
+            final_utilities = self._utilities(reward)
+            final_probabilities = _masked_softmax(
+                final_utilities, mask, self.pfc_engine.config.decision_temperature
+            )
+            utilities = np.where(has_torque[:, None], final_utilities, utilities)
+            probabilities = np.where(has_torque[:, None], final_probabilities, probabilities)
+        
+        for b, context in enumerate(contexts):
+            n = len(context.options)
+            context.utilities = utilities[b, :n].tolist()
+            context.probabilities = probabilities[b, :n].tolist()
+            context.metadata["expected_rewards"] = reward[b, :n].tolist()
+        return contexts
+    
+    def select(self, context: PipelineContext) -> PipelineContext:
+        """prepare_many() 결과 하나에 대해 Action 생성 + PFC 선택"""
+        from .engines.pfc import Action
+        
+        context.actions = [
+            Action(
+                id=f"action_{i}",
+                name=opt,
+                expected_reward=r,
+                effort_cost=self.effort_cost,
+                risk=self.risk,
+            )
+            for i, (opt, r) in enumerate(
+                zip(context.options, context.metadata.pop("expected_rewards"))
+            )
+        ]
+        context.metadata["pfc_result"] = self.pfc_engine.select_action(
+            context.actions,
+            utilities=context.utilities,
+            probabilities=context.probabilities,
+        )
+        return context
+    
+    def _utilities(self, reward: np.ndarray) -> np.ndarray:
+        """U = clip(reward) - effort - risk × κ (Action 의 [0, 1] 클리핑과 같은 순서)"""
+        effort = max(0.0, min(1.0, float(self.effort_cost)))
+        risk = max(0.0, min(1.0, float(self.risk)))
+        risk_penalty = risk * self.pfc_engine.config.risk_aversion
+        return np.clip(reward, 0.0, 1.0) - effort - risk_penalty
+
+
+def _masked_softmax(utilities: np.ndarray, mask: np.ndarray, beta: float) -> np.ndarray:
+    """행 단위 softmax (mask 가 False 인 패딩 칸은 확률 0)"""
+    if utilities.size == 0:
+        return np.zeros(utilities.shape, dtype=float)
+    masked = np.where(mask, utilities, -np.inf)
+    row_max = masked.max(axis=1, keepdims=True)
+    row_max = np.where(np.isfinite(row_max), row_max, 0.0)
+    exp_values = np.where(mask, np.exp(beta * (np.where(mask, utilities, 0.0) - row_max)), 0.0)
+    total = exp_values.sum(axis=1, keepdims=True)
+    return np.divide(exp_values, total, out=np.zeros_like(exp_values), where=total > 0)
+
+
 class ResultAssemblyStep(PipelineStep):
     """결과 조립 단계"""
     
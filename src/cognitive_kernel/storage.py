@@ -0,0 +1,459 @@
+"""
+💾 Session Storage Backends for Cognitive Kernel
+
+CognitiveKernel 세션(장기 기억)을 디스크에 저장하는 교체 가능한 백엔드.
+
+지원 백엔드 (CognitiveConfig.storage_backend):
+    - "json"  : 기존 5개 파일 (panorama / memoryrank / edges / q_values / meta)
+                파일 단위 원자적 교체(임시 파일 + rename), meta.json 을 마지막에 기록
+    - "sqlite": 단일 session.db, 모든 엔진 상태를 한 트랜잭션으로 커밋
+                Panorama 이벤트는 변경분만 기록 (WAL + 증분 저장)
+    - "npz"   : 단일 session.npz (숫자 배열 + msgpack 객체 블록),
+                임시 파일에 쓴 뒤 원자적 rename
+
+사용 예시:
+    config = CognitiveConfig(storage_backend="sqlite")
+    kernel = CognitiveKernel("my_brain", config=config)
+
+Author: GNJz (Qquarts)
+Version: 2.0.2
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type, Union
+
+import numpy as np
+
+from .engines.memoryrank.persistence import MemoryRankPersistence
+from .engines.panorama import Event
+from .engines.panorama.persistence import PanoramaPersistence
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from .core import CognitiveKernel
+
+
+class StorageBackend(ABC):
+    """세션 저장소 인터페이스
+
+    save/load 는 커널의 엔진 상태 전체를 다룬다.
+    exists 가 True 인 세션만 자동 로드된다.
+    """
+
+    name = "base"
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    @abstractmethod
+    def save(self, kernel: "CognitiveKernel") -> Dict[str, int]:
+        """커널 상태 저장 → 저장 통계"""
+        pass
+
+    @abstractmethod
+    def load(self, kernel: "CognitiveKernel") -> Dict[str, int]:
+        """커널 상태 복원 → 로드 통계"""
+        pass
+
+    @abstractmethod
+    def exists(self) -> bool:
+        """저장된 세션이 있는지"""
+        pass
+
+
+# ======================================================================
+# JSON (기존 포맷)
+# ======================================================================
+
+class JSONStorageBackend(StorageBackend):
+    """5개 JSON 파일 백엔드 (기존 세션 포맷과 호환)
+
+    각 파일은 임시 파일에 쓴 뒤 os.replace 로 교체하므로 반쯤 쓰인 파일은
+    남지 않는다. 세션 존재 표시인 meta.json 은 마지막에 기록한다.
+    파일 사이의 원자성까지 필요하면 sqlite / npz 백엔드를 사용한다.
+    """
+
+    name = "json"
+
+    def __init__(self, path: Union[str, Path], panorama_format: str = "json"):
+        super().__init__(path)
+        self.panorama_format = panorama_format
+
+    def save(self, kernel: "CognitiveKernel") -> Dict[str, int]:
+        stats = {}
+
+        # Panorama 저장 (sqlite: 마지막 저장 이후 변경분만 기록)
+        if self.panorama_format == "sqlite":
+            db_path = self.path / "panorama.db"
+            stats["events"] = kernel.panorama.save_to_sqlite(str(db_path), incremental=True)
+        else:
+            panorama_path = self.path / "panorama.json"
+            tmp_path = _tmp_path(panorama_path)
+            stats["events"] = kernel.panorama.save_to_json(str(tmp_path), indent=None)
+            os.replace(tmp_path, panorama_path)
+
+        # MemoryRank 저장
+        if kernel.memoryrank.has_graph():
+            memoryrank_path = self.path / "memoryrank.json"
+            tmp_path = _tmp_path(memoryrank_path)
+            result = kernel.memoryrank.save_to_json(str(tmp_path), indent=None)
+            os.replace(tmp_path, memoryrank_path)
+            stats["nodes"] = result["nodes"]
+
+        # Edges 저장 (병합된 살아 있는 엣지)
+        _write_text_atomic(self.path / "edges.json", json.dumps(kernel._edges.to_list()))
+        stats["edges"] = len(kernel._edges)
+
+        # BasalGanglia Q-values 저장
+        _write_text_atomic(self.path / "q_values.json", json.dumps(kernel._q_table_state()))
+
+        # 메타데이터 저장 (마지막: 세션 존재 표시)
+        _write_text_atomic(
+            self.path / "meta.json",
+            json.dumps(kernel._session_meta(), indent=2),
+        )
+        return stats
+
+    def load(self, kernel: "CognitiveKernel") -> Dict[str, int]:
+        stats = {}
+
+        # Panorama 로드
+        db_path = self.path / "panorama.db"
+        panorama_path = self.path / "panorama.json"
+        if self.panorama_format == "sqlite" and db_path.exists():
+            stats["events"] = kernel.panorama.load_from_sqlite(str(db_path))
+        elif panorama_path.exists():
+            stats["events"] = kernel.panorama.load_from_json(str(panorama_path))
+
+        # MemoryRank 로드
+        memoryrank_path = self.path / "memoryrank.json"
+        if memoryrank_path.exists():
+            result = kernel.memoryrank.load_from_json(str(memoryrank_path))
+            stats["nodes"] = result["nodes"]
+
+        # Edges 로드
+        edges_path = self.path / "edges.json"
+        if edges_path.exists():
+            kernel._edges.load(json.loads(edges_path.read_text()))
+            stats["edges"] = len(kernel._edges)
+
+        # BasalGanglia Q-values 로드
+        q_path = self.path / "q_values.json"
+        if q_path.exists():
+            kernel._restore_q_table(json.loads(q_path.read_text()))
+
+        # 메타데이터 로드
+        meta_path = self.path / "meta.json"
+        if meta_path.exists():
+            kernel._restore_session_meta(json.loads(meta_path.read_text()))
+
+        return stats
+
+    def exists(self) -> bool:
+        return (self.path / "meta.json").exists()
+
+
+# ======================================================================
+# SQLite (단일 파일, 단일 트랜잭션)
+# ======================================================================
+
+class SQLiteStorageBackend(StorageBackend):
+    """단일 SQLite 파일 백엔드
+
+    테이블:
+        - panorama_events / panorama_meta : Panorama 이벤트 (증분 저장)
+        - kernel_edges                    : 기억 그래프 엣지 (슬롯 단위 upsert)
+        - kernel_state                    : MemoryRank 배열(npz 블롭), Q-values, 메타
+
+    모든 쓰기는 한 트랜잭션으로 커밋되므로 저장 도중 중단돼도
+    직전 체크포인트가 그대로 남는다.
+    엣지는 같은 엣지 저널에서 이어지는 저장이면 추가/변경된 슬롯만 쓴다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Union[str, Path], filename: str = "session.db", batch_size: int = 1000):
+        super().__init__(path)
+        self.db_path = self.path / filename
+        self.batch_size = batch_size
+
+    def save(self, kernel: "CognitiveKernel") -> Dict[str, int]:
+        panorama = PanoramaPersistence(kernel.panorama)
+        seq = kernel.panorama.change_seq
+
+        conn = self._connect()
+        try:
+            with conn:
+                result = panorama.write_sqlite(conn, incremental=True, batch_size=self.batch_size)
+                stats = {"events": result["events"]}
+
+                # Edges: 이전 저장 이후 추가/변경된 슬롯만 (저널이 바뀌었으면 전체 재기록)
+                edges = kernel._edges
+                state = self._read_state(conn, ("edges_journal",))
+                if state.get("edges_journal") == edges.journal_id:
+                    rows = edges.dirty_rows()
+                else:
+                    conn.execute("DELETE FROM kernel_edges")
+                    rows = edges.rows()
+                for i in range(0, len(rows), self.batch_size):
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO kernel_edges (seq, src, dst, weight) VALUES (?, ?, ?, ?)",
+                        rows[i:i + self.batch_size],
+                    )
+                stats["edges"] = len(edges)
+
+                values: List[Tuple[str, Any]] = [
+                    ("edges_journal", edges.journal_id),
+                    ("q_values", json.dumps(kernel._q_table_state())),
+                    ("meta", json.dumps(kernel._session_meta())),
+                ]
+                if kernel.memoryrank.has_graph():
+                    arrays = MemoryRankPersistence(kernel.memoryrank).to_arrays()
+                    values.append(("memoryrank", _arrays_to_bytes(arrays)))
+                    stats["nodes"] = len(kernel.memoryrank.get_node_ids())
+                conn.executemany(
+                    "INSERT OR REPLACE INTO kernel_state (key, value) VALUES (?, ?)",
+                    values,
+                )
+        finally:
+            conn.close()
+
+        kernel.panorama.trim_changes(seq)
+        kernel._edges.mark_clean()
+        return stats
+
+    def load(self, kernel: "CognitiveKernel") -> Dict[str, int]:
+        stats = {}
+
+        # Panorama: 행 스트리밍 + 고수위 표시 기록 (다음 저장은 증분)
+        stats["events"] = PanoramaPersistence(kernel.panorama).load_sqlite(
+            str(self.db_path), batch_size=self.batch_size,
+        )
+
+        conn = self._connect()
+        try:
+            state = self._read_state(conn, ("memoryrank", "q_values", "meta"))
+            if "memoryrank" in state:
+                result = MemoryRankPersistence(kernel.memoryrank).from_arrays(
+                    _arrays_from_bytes(state["memoryrank"])
+                )
+                stats["nodes"] = result["nodes"]
+
+            # 로드한 엣지는 슬롯이 다시 채번되므로 다음 저장은 전체 재기록
+            kernel._edges.load(
+                conn.execute("SELECT src, dst, weight FROM kernel_edges ORDER BY seq")
+            )
+            stats["edges"] = len(kernel._edges)
+
+            if "q_values" in state:
+                kernel._restore_q_table(json.loads(state["q_values"]))
+            if "meta" in state:
+                kernel._restore_session_meta(json.loads(state["meta"]))
+        finally:
+            conn.close()
+
+        return stats
+
+    def exists(self) -> bool:
+        if not self.db_path.exists():
+            return False
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            row = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'kernel_state'"
+            ).fetchone()
+            if row is None:
+                return False
+            return conn.execute(
+                "SELECT 1 FROM kernel_state WHERE key = 'meta'"
+            ).fetchone() is not None
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        PanoramaPersistence.create_schema(conn)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS kernel_edges (
+                seq INTEGER PRIMARY KEY,
+                src TEXT NOT NULL,
+                dst TEXT NOT NULL,
+                weight REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS kernel_state (
+                key TEXT PRIMARY KEY,
+                value BLOB
+            )
+        """)
+        conn.commit()
+        return conn
+
+    @staticmethod
+    def _read_state(conn: sqlite3.Connection, keys: Tuple[str, ...]) -> Dict[str, Any]:
+        placeholders = ", ".join("?" for _ in keys)
+        return dict(conn.execute(
+            f"SELECT key, value FROM kernel_state WHERE key IN ({placeholders})", keys
+        ).fetchall())
+
+
+# ======================================================================
+# NPZ + msgpack (단일 파일, 원자적 rename)
+# ======================================================================
+
+class NPZStorageBackend(StorageBackend):
+    """NumPy 배열 + msgpack 단일 파일 백엔드
+
+    숫자 데이터(타임스탬프, 중요도, 엣지 가중치, MemoryRank 배열)는
+    비압축 npz 배열로, 문자열/payload 등 객체 데이터는 msgpack 블록 하나로
+    같은 파일에 담는다. 임시 파일에 쓰고 fsync 후 os.replace 로 교체한다.
+    """
+
+    name = "npz"
+
+    def __init__(self, path: Union[str, Path], filename: str = "session.npz"):
+        if not MSGPACK_AVAILABLE:
+            raise ImportError("msgpack not installed. pip install cognitive-kernel[npz]")
+        super().__init__(path)
+        self.file_path = self.path / filename
+
+    def save(self, kernel: "CognitiveKernel") -> Dict[str, int]:
+        events = kernel.panorama._events
+        edges = kernel._edges.to_list()
+
+        objects = {
+            "event_ids": [e.id for e in events],
+            "event_types": [e.event_type for e in events],
+            "payloads": [e.payload for e in events],
+            "episode_ids": [e.episode_id for e in events],
+            "edge_src": [src for src, _, _ in edges],
+            "edge_dst": [dst for _, dst, _ in edges],
+            "q_values": kernel._q_table_state(),
+            "meta": kernel._session_meta(),
+        }
+        arrays = {
+            "event_timestamp": np.fromiter((e.timestamp for e in events), dtype=float, count=len(events)),
+            "event_importance": np.fromiter((e.importance for e in events), dtype=float, count=len(events)),
+            "edge_weight": np.fromiter((w for _, _, w in edges), dtype=float, count=len(edges)),
+            "objects": np.frombuffer(msgpack.packb(objects, use_bin_type=True), dtype=np.uint8),
+        }
+
+        stats = {"events": len(events), "edges": len(edges)}
+        if kernel.memoryrank.has_graph():
+            for key, value in MemoryRankPersistence(kernel.memoryrank).to_arrays().items():
+                arrays["memoryrank/" + key] = value
+            stats["nodes"] = len(kernel.memoryrank.get_node_ids())
+
+        tmp_path = _tmp_path(self.file_path)
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.file_path)
+        return stats
+
+    def load(self, kernel: "CognitiveKernel") -> Dict[str, int]:
+        with np.load(self.file_path, allow_pickle=False) as data:
+            arrays = {key: data[key] for key in data.files}
+        objects = msgpack.unpackb(arrays["objects"].tobytes(), raw=False)
+
+        stats = {}
+
+        stats["events"] = kernel.panorama.load_events(
+            Event(
+                id=event_id,
+                timestamp=ts,
+                event_type=event_type,
+                payload=payload or {},
+                episode_id=episode_id,
+                importance=importance,
+            )
+            for event_id, ts, event_type, payload, episode_id, importance in zip(
+                objects["event_ids"],
+                arrays["event_timestamp"].tolist(),
+                objects["event_types"],
+                objects["payloads"],
+                objects["episode_ids"],
+                arrays["event_importance"].tolist(),
+            )
+        )
+
+        memoryrank_arrays = {
+            key[len("memoryrank/"):]: value
+            for key, value in arrays.items()
+            if key.startswith("memoryrank/")
+        }
+        if memoryrank_arrays:
+            result = MemoryRankPersistence(kernel.memoryrank).from_arrays(memoryrank_arrays)
+            stats["nodes"] = result["nodes"]
+
+        kernel._edges.load(zip(
+            objects["edge_src"], objects["edge_dst"], arrays["edge_weight"].tolist(),
+        ))
+        stats["edges"] = len(kernel._edges)
+
+        kernel._restore_q_table(objects["q_values"])
+        kernel._restore_session_meta(objects["meta"])
+        return stats
+
+    def exists(self) -> bool:
+        return self.file_path.exists()
+
+
+# ======================================================================
+# 팩토리
+# ======================================================================
+
+STORAGE_BACKENDS: Dict[str, Type[StorageBackend]] = {
+    JSONStorageBackend.name: JSONStorageBackend,
+    SQLiteStorageBackend.name: SQLiteStorageBackend,
+    NPZStorageBackend.name: NPZStorageBackend,
+}
+
+
+def create_storage_backend(name: str, path: Union[str, Path], **kwargs) -> StorageBackend:
+    """이름으로 저장소 백엔드 생성 ("json" | "sqlite" | "npz")"""
+    if name not in STORAGE_BACKENDS:
+        raise ValueError(f"Unknown storage backend: {name}")
+    return STORAGE_BACKENDS[name](path, **kwargs)
+
+
+# ----------------------------------------------------------------------
+# 내부 헬퍼
+# ----------------------------------------------------------------------
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_name(path.name + ".tmp")
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """임시 파일에 쓴 뒤 rename (반쯤 쓰인 파일이 남지 않음)"""
+    tmp_path = _tmp_path(path)
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+
+
+def _arrays_to_bytes(arrays: Dict[str, np.ndarray]) -> bytes:
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def _arrays_from_bytes(blob: bytes) -> Dict[str, np.ndarray]:
+    with np.load(io.BytesIO(blob), allow_pickle=False) as data:
+        return {key: data[key] for key in data.files}
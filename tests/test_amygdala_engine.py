@@ -0,0 +1,137 @@
+"""Amygdala Engine 테스트 (다중 패턴 매처)."""
+
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cognitive_kernel.engines.amygdala import (  # noqa: E402
+    AhoCorasick,
+    AmygdalaConfig,
+    AmygdalaEngine,
+)
+from cognitive_kernel.engines.amygdala.amygdala_engine import NEGATION_PATTERNS  # noqa: E402
+
+
+def _reference_threat_hits(config, text):
+    """키워드마다 부분 문자열 검사를 하던 기존 방식 (비교 기준)."""
+    text_lower = text.lower()
+    text_ns = text_lower.replace(' ', '')
+    hits = []
+    for category, info in config.threat_keywords.items():
+        for word in info['words']:
+            word_ns = word.replace(' ', '')
+            if word not in text_lower and word_ns not in text_ns:
+                continue
+            idx = text_lower.find(word)
+            if idx == -1:
+                idx = text_ns.find(word_ns)
+                pre = text_ns[max(0, idx - 5):idx]
+                post = text_ns[idx:idx + len(word_ns) + 8]
+            else:
+                pre = text_lower[max(0, idx - 5):idx]
+                post = text_lower[idx:idx + len(word) + 8]
+            negated = any(neg in pre or neg in post for neg in NEGATION_PATTERNS)
+            hits.append((category, word, negated))
+    return hits
+
+
+def _sample_texts(config, n=400, seed=0):
+    words = [w for info in config.threat_keywords.values() for w in info['words']]
+    words += [w for info in config.emotion_map.values() for w in info['words']]
+    negations = ['안 ', '않아', '못 ', 'not ', "don't", 'never ', '없다', '하지 않']
+    filler = ['오늘', '정말', 'the', 'hello', ' ', '회의 일정']
+    rnd = random.Random(seed)
+    texts = ["죽고 싶지 않아", "I don't want to kill anyone", "위험! 조심해!", "오늘 정말 기쁘다!"]
+    for _ in range(n):
+        parts = [rnd.choice(words + negations + filler) for _ in range(rnd.randint(0, 10))]
+        text = rnd.choice(['', ' ']).join(parts)
+        texts.append(text.upper() if rnd.random() < 0.2 else text)
+    return texts
+
+
+def test_aho_corasick_finds_overlapping_matches():
+    automaton = AhoCorasick(["he", "she", "his", "hers", ""]).build()
+    matches = sorted(automaton.scan("ushers"))
+    patterns = automaton.patterns
+    assert [(start, patterns[pid]) for start, pid in matches] == [(1, "she"), (2, "he"), (2, "hers")]
+
+    first = automaton.first_starts("ahishers")
+    for pid, pattern in enumerate(patterns):
+        expected = "ahishers".find(pattern)
+        assert first.get(pid, -1) == expected
+
+
+def test_matcher_matches_reference_scan():
+    engine = AmygdalaEngine()
+    config = engine.config
+    for text in _sample_texts(config):
+        hits = [
+            (hit.category, hit.word, hit.negated)
+            for hit in engine._matcher.match_threats(text.lower())
+        ]
+        assert hits == _reference_threat_hits(config, text), text
+
+        text_lower = text.lower()
+        emotions = [hit.emotion for hit in engine._matcher.match_emotions(text_lower)]
+        expected = [
+            name
+            for name, info in config.emotion_map.items()
+            for word in info['words']
+            if word in text_lower
+        ]
+        assert emotions == expected
+
+
+def test_compile_patterns_picks_up_config_changes():
+    config = AmygdalaConfig(threat_threshold=0.1)
+    engine = AmygdalaEngine(config)
+    assert engine.detect_threat("zorblax incoming") is None
+
+    config.threat_keywords['custom'] = {'words': ['zorblax'], 'weight': 0.8, 'type': 'custom'}
+    engine.compile_patterns()
+    signal = engine.detect_threat("zorblax incoming")
+    assert signal is not None
+    assert signal.threat_type == 'custom'
+    assert signal.source == 'zorblax'
+
+
+def _signal_key(signal):
+    if signal is None:
+        return None
+    return (signal.source, signal.threat_level, signal.threat_type, signal.response)
+
+
+def test_batch_matches_sequential():
+    texts = _sample_texts(AmygdalaConfig(), n=300, seed=1)
+    sequential = AmygdalaEngine()
+    threats = [sequential.detect_threat(text) for text in texts]
+    emotions = [sequential.process_emotion(text) for text in texts]
+
+    batch = AmygdalaEngine()
+    batch_threats = batch.detect_threat_many(texts)
+    batch_emotions = batch.process_emotion_many(texts)
+
+    assert [_signal_key(s) for s in batch_threats] == [_signal_key(s) for s in threats]
+    assert [(e.valence, e.arousal) for e in batch_emotions] == [(e.valence, e.arousal) for e in emotions]
+    assert [_signal_key(s) for s in batch.recent_threats] == [_signal_key(s) for s in sequential.recent_threats]
+    assert batch.current_emotion.valence == sequential.current_emotion.valence
+    assert batch.stats == sequential.stats
+
+
+def test_batch_process_pool():
+    texts = _sample_texts(AmygdalaConfig(), n=120, seed=2)
+    local = AmygdalaEngine()
+    pooled = AmygdalaEngine()
+
+    expected = local.detect_threat_many(texts)
+    result = pooled.detect_threat_many(texts, processes=2, chunk_size=40)
+    assert [_signal_key(s) for s in result] == [_signal_key(s) for s in expected]
+
+    expected_emotions = local.process_emotion_many(texts)
+    pooled_emotions = pooled.process_emotion_many(texts, processes=2, chunk_size=40)
+    assert [(e.valence, e.arousal) for e in pooled_emotions] == [
+        (e.valence, e.arousal) for e in expected_emotions
+    ]
@@ -0,0 +1,132 @@
+"""BasalGanglia Engine 테스트 (배열 Q-테이블)."""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cognitive_kernel.engines.basal_ganglia import (  # noqa: E402
+    Action,
+    BasalGangliaConfig,
+    BasalGangliaEngine,
+)
+
+
+def test_q_table_action_view_and_vectorized_ops():
+    """q_table[context][name] 뷰, 벡터 감쇠, 습관 스캔."""
+    engine = BasalGangliaEngine(BasalGangliaConfig(decay_rate=0.1))
+    for _ in range(20):
+        engine.learn("morning", "coffee", 1.0)
+    engine.learn("morning", "tea", -0.5)
+    engine.learn("night", "sleep", 0.5)
+
+    q_table = engine.q_table
+    assert "morning" in q_table and "evening" not in q_table
+    assert list(q_table) == ["morning", "night"]
+    assert list(q_table["morning"]) == ["coffee", "tea"]
+
+    coffee = q_table["morning"]["coffee"]
+    assert coffee.name == "coffee" and coffee.context == "morning"
+    assert coffee.execution_count == 20 and coffee.success_rate == 1.0
+    assert coffee.is_habit
+    assert isinstance(coffee.to_action(), Action)
+
+    assert [(h.context, h.name) for h in engine.get_habits()] == [("morning", "coffee")]
+    assert engine.select_action("morning", ["tea", "coffee"]).is_automatic
+
+    # 벡터 감쇠: Q 는 모두, 습관은 오래된 행동만
+    q_before = engine._table.q_value.copy()
+    coffee.last_executed = time.time() - 7200
+    habit_before = coffee.habit_strength
+    engine.decay_all()
+    assert np.allclose(engine._table.q_value, q_before * 0.9)
+    assert coffee.habit_strength == habit_before * 0.99
+    assert q_table["night"]["sleep"].habit_strength > 0
+
+    engine.break_habit("morning", "coffee")
+    assert engine.get_habits() == []
+    assert engine.get_best_action("morning").name == "coffee"
+
+    # Action 값 가져오기 (기존 dict 대입 호환)
+    q_table["evening"]["read"] = Action(name="read", q_value=0.42, habit_strength=0.8)
+    assert q_table["evening"]["read"].q_value == 0.42
+    assert engine.get_state()["total_actions"] == 4
+
+
+def test_learn_batch_matches_sequential_learn():
+    """learn_batch = 같은 순서의 learn() 반복 (Q, 습관, 도파민, 기록)."""
+    import random
+
+    rnd = random.Random(5)
+    contexts = [f"ctx{i}" for i in range(6)]
+    transitions = [
+        (
+            rnd.choice(contexts),
+            f"a{rnd.randrange(4)}",
+            rnd.uniform(-1, 1),
+            rnd.choice([None, rnd.choice(contexts)]),
+        )
+        for _ in range(500)
+    ]
+
+    sequential = BasalGangliaEngine(BasalGangliaConfig(max_history=50))
+    for t in transitions:
+        sequential.learn(*t)
+    batched = BasalGangliaEngine(BasalGangliaConfig(max_history=50))
+    assert batched.learn_batch(transitions) == len(transitions)
+
+    seq_table, batch_table = sequential._table, batched._table
+    assert len(seq_table) == len(batch_table)
+    for context in seq_table.contexts():
+        for name in sequential.q_table[context]:
+            a = sequential.q_table[context][name]
+            b = batched.q_table[context][name]
+            assert abs(a.q_value - b.q_value) < 1e-12
+            assert abs(a.habit_strength - b.habit_strength) < 1e-12
+            assert (a.execution_count, a.success_count) == (b.execution_count, b.success_count)
+    assert abs(sequential.dopamine_level - batched.dopamine_level) < 1e-12
+    assert list(sequential.recent_actions) == list(batched.recent_actions)
+    assert sequential.stats["total_reward"] == batched.stats["total_reward"]
+
+
+def test_replay_buffer_ring_and_replay():
+    """링 버퍼는 최근 경험만 유지하고, replay 는 실행 기록을 바꾸지 않는다."""
+    engine = BasalGangliaEngine(BasalGangliaConfig(replay_capacity=4))
+    engine.learn("home", "rest", 0.5)
+    engine.learn_batch([("home", "work", -0.2, "office"), ("office", "work", 0.8)] * 2)
+
+    buffer = engine.replay_buffer
+    assert len(buffer) == 4
+    assert buffer.transitions()[0] == ("home", "work", -0.2, "office")
+    assert buffer.transitions()[-1] == ("office", "work", 0.8, None)
+
+    counts = engine._table.execution_count.copy()
+    q_before = engine._table.q_value.copy()
+    assert engine.replay(16, rng=np.random.default_rng(0)) == 16
+    assert np.array_equal(engine._table.execution_count, counts)
+    assert not np.array_equal(engine._table.q_value, q_before)
+
+
+def test_context_interning_lru():
+    """원문 컨텍스트 → ID 는 LRU 로 캐시되고, 정규화가 같으면 같은 ID."""
+    engine = BasalGangliaEngine(BasalGangliaConfig(context_cache_size=2))
+    engine.learn("  Tired ", "rest", 0.5)
+    engine.learn("tired", "rest", 0.5)
+    assert list(engine.q_table) == ["tired"]
+    assert engine.q_table["tired"]["rest"].execution_count == 2
+
+    engine.select_action("Hungry", ["eat"])
+    engine.select_action("Bored", ["read"])
+    assert list(engine._context_cache) == ["Hungry", "Bored"]
+    assert engine._context_id("TIRED") == engine._context_id("tired")
+    assert len(engine._context_cache) == 2
+
+    state = engine.get_q_table_state()
+    restored = BasalGangliaEngine()
+    restored.load_q_table_state(state)
+    assert restored.get_q_table_state() == state
+    assert restored.q_table["hungry"]["eat"].q_value == engine.q_table["hungry"]["eat"].q_value
@@ -0,0 +1,325 @@
+"""CognitiveKernel 통합 테스트.
+
+recall 경로 (증분 그래프 갱신 + 랭크 캐시) 와 세션 저장소 검증.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cognitive_kernel import CognitiveKernel, CognitiveConfig
+
+
+def _kernel(tmp_path, **kwargs) -> CognitiveKernel:
+    config = CognitiveConfig(storage_dir=str(tmp_path), auto_save=False, **kwargs)
+    return CognitiveKernel("test", config, auto_load=False)
+
+
+def test_recall_cache_invalidation(tmp_path):
+    """remember 전까지는 캐시, remember 후에는 재랭킹."""
+    kernel = _kernel(tmp_path)
+    ids = [kernel.remember("event", {"i": i}, importance=0.1 * i) for i in range(10)]
+
+    first = kernel.recall(k=3)
+    version = kernel._rank_cache_version
+    assert kernel.recall(k=3) == first
+    assert kernel._rank_cache_version == version
+
+    kernel.remember("hub", {"topic": "hub"}, importance=1.0, related_to=ids[:5])
+    second = kernel.recall(k=3)
+    assert kernel._rank_cache_version == kernel._memory_version != version
+    assert second != first
+
+
+def test_incremental_recall_matches_rebuild(tmp_path):
+    """증분 갱신된 랭크 = 전체 재구축 랭크."""
+    kernel = _kernel(tmp_path, recency_drift_tolerance=0.0)
+    ids = [kernel.remember("event", {"i": i}) for i in range(20)]
+    kernel.recall(k=5)
+
+    for i in range(5):
+        kernel.remember("link", {"i": i}, importance=0.9, related_to=[ids[i], ids[-i - 1]])
+    incremental = kernel.recall(k=5)
+
+    kernel._graph_edge_epoch = None
+    kernel._invalidate_rank_cache()
+    rebuilt = kernel.recall(k=5)
+
+    assert [m["id"] for m in incremental] == [m["id"] for m in rebuilt]
+    for a, b in zip(incremental, rebuilt):
+        assert abs(a["importance"] - b["importance"]) < 1e-5
+
+
+def test_sparse_and_dense_graph_recall_match(tmp_path):
+    """CognitiveConfig.sparse_graph (기본 True) 와 밀집 경로의 회상 결과가 같다."""
+    kernels = [
+        _kernel(tmp_path / str(sparse), sparse_graph=sparse, recency_drift_tolerance=0.0)
+        for sparse in (True, False)
+    ]
+    assert kernels[0].memoryrank.config.sparse and not kernels[1].memoryrank.config.sparse
+
+    records = [
+        {
+            "event_type": "event",
+            "content": {"i": i},
+            "importance": 0.2 + 0.7 * ((i * 37) % 60) / 60,  # 동점 없음
+            "timestamp": 1000.0 + i,
+            "event_id": f"e{i:03d}",
+            "related_to": [f"e{(i * 13) % i:03d}", f"e{i - 1:03d}"] if i else [],
+        }
+        for i in range(60)
+    ]
+    results = []
+    for kernel in kernels:
+        kernel.remember_many(records[:40])
+        first = kernel.recall(k=10)
+        kernel.remember_many(records[40:])  # 증분 갱신 경로
+        results.append((first, kernel.recall(k=10)))
+
+    for a, b in zip(*results):
+        assert [m["id"] for m in a] == [m["id"] for m in b]
+        for x, y in zip(a, b):
+            assert abs(x["importance"] - y["importance"]) < 1e-6
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite", "npz"])
+def test_storage_backend_roundtrip(tmp_path, backend):
+    """저장 → 새 커널 로드 후 이벤트/엣지/회상 결과가 같다."""
+    if backend == "npz":
+        pytest.importorskip("msgpack")
+    kernel = _kernel(tmp_path, storage_backend=backend)
+    for i in range(30):
+        kernel.remember("event", {"i": i}, importance=0.03 * i)
+    kernel.recall(k=5)
+    kernel.basal_ganglia.learn("Tired ", "rest", 0.8)
+    kernel.save()
+
+    # 증분 저장 (sqlite: 새 이벤트/엣지만 기록, 병합된 엣지는 가중치 갱신)
+    first, second = kernel.panorama.get_all_events()[:2]
+    kernel.remember("event", {"i": 30}, importance=0.9, related_to=[first.id])
+    kernel._edges.add(first.id, second.id, 0.25)
+    kernel.save()
+
+    restored = _kernel(tmp_path, storage_backend=backend)
+    assert restored._session_exists()
+    stats = restored.load()
+    assert stats["events"] == 31
+    assert stats["edges"] == len(kernel._edges)
+    assert [e.id for e in restored.panorama.get_all_events()] == \
+        [e.id for e in kernel.panorama.get_all_events()]
+    assert [tuple(e) for e in restored._edges] == [tuple(e) for e in kernel._edges]
+    assert restored.recall(k=5)[0]["id"] == kernel.recall(k=5)[0]["id"]
+    assert restored.basal_ganglia.get_q_table_state() == kernel.basal_ganglia.get_q_table_state()
+    assert restored.basal_ganglia.q_table["tired"]["rest"].q_value > 0
+
+
+def test_evicted_memories_drop_edges(tmp_path):
+    """Panorama 최대 이벤트 수를 넘어 밀려난 기억의 엣지는 사라지고, 엣지 수가 유계."""
+    kernel = _kernel(tmp_path, recency_drift_tolerance=0.0)
+    kernel.panorama.config.max_events = 50
+    ids = []
+    for i in range(600):
+        related = ids[-3:]
+        ids.append(kernel.remember("event", {"i": i}, importance=0.5, related_to=related))
+        if i % 100 == 99:
+            kernel.recall(k=3)
+
+    live = {e.id for e in kernel.panorama.get_all_events()}
+    assert len(live) == 50
+    assert all(src in live and dst in live for src, dst, _ in kernel._edges)
+    assert len(kernel._edges) <= 6 * 50
+    assert kernel._edges._size < 2 * kernel._edges.COMPACT_MIN_SLOTS
+    assert set(kernel.memoryrank.get_node_ids()) <= live
+
+    incremental = kernel.recall(k=5)
+    kernel._graph_edge_epoch = None
+    kernel._invalidate_rank_cache()
+    assert [m["id"] for m in kernel.recall(k=5)] == [m["id"] for m in incremental]
+
+
+def test_remember_skips_edges_to_missing_memories(tmp_path):
+    """밀려났거나 저장된 적 없는 기억과는 엣지를 만들지 않는다."""
+    kernel = _kernel(tmp_path)
+    kernel.panorama.config.max_events = 3
+    ids = [kernel.remember("event", {"i": i}) for i in range(3)]
+
+    new_id = kernel.remember("link", {}, importance=0.8, related_to=[ids[0], ids[1], "unknown"])
+    assert kernel.panorama.get_event(ids[0]) is None  # new_id 추가로 밀려남
+    assert kernel._edges.to_list() == [(ids[1], new_id, 0.8), (new_id, ids[1], 0.4)]
+
+
+def test_remember_many_skips_edges_to_evicted_backfill(tmp_path):
+    """추가되자마자 밀려난 백필 기억의 엣지는 남지 않는다."""
+    kernel = _kernel(tmp_path)
+    kernel.panorama.config.max_events = 3
+    ids = [kernel.remember("event", {"i": i}) for i in range(3)]
+
+    backfill = kernel.remember_many([
+        {"event_type": "old", "timestamp": 1.0, "related_to": [ids[2]]},
+        {"event_type": "old", "timestamp": 2.0, "related_to": [ids[1], "unknown"]},
+    ])
+    assert all(kernel.panorama.get_event(eid) is None for eid in backfill)
+    assert kernel._edges.to_list() == []
+
+    kernel.panorama.config.max_events = 10
+    linked = kernel.remember_many([
+        {"event_type": "old", "timestamp": 1.0, "event_id": "a"},
+        {"event_type": "old", "timestamp": 2.0, "event_id": "b", "related_to": ["a", ids[2]]},
+    ])
+    assert linked == ["a", "b"]
+    assert len(kernel._edges) == 4
+
+
+def test_memory_relevance_index_matches_scan(tmp_path):
+    """역색인 기반 관련성 = 기존 문자열 스캔 결과."""
+    kernel = _kernel(tmp_path)
+    for i, text in enumerate(["red apple", "work on project", "bored", "rest day", "homework"]):
+        kernel.remember("note", {"text": text, "n": i}, importance=0.2 + 0.1 * i)
+    memories = kernel.recall(k=5)
+    unindexed = [dict(m, id=None) for m in memories]
+
+    for option in ["choose_red", "work_on_project", "rest", "take", "do_home-work"]:
+        keywords = kernel._extract_keywords(option)
+        assert kernel._calculate_memory_relevance(keywords, memories) == \
+            kernel._calculate_memory_relevance(keywords, unindexed)
+    assert kernel._calculate_memory_relevance(["red"], memories) > 0.0
+
+
+def test_fused_decision_matches_two_pass(tmp_path):
+    """통합 결정 단계 = 기존 2-pass 파이프라인 (분포, 엔트로피, 선택)."""
+    import copy
+    import random
+
+    from cognitive_kernel.pipeline import (
+        DecisionPipeline, MemoryLoadStep, WorkingMemoryStep, ActionCreationStep,
+        PFCDecisionStep, EntropyCalculationStep, CoreStrengthStep,
+        TorqueGenerationStep, UtilityRecalculationStep, ResultAssemblyStep,
+    )
+
+    kernel = _kernel(tmp_path)
+    for i, text in enumerate(["work hard", "rest well", "exercise daily", "work late"]):
+        kernel.remember("note", {"text": text}, importance=0.3 + 0.15 * i)
+    options = ["work", "rest", "exercise", "read"]
+    kernel.recall(k=kernel.config.working_memory_capacity)  # 같은 랭크 캐시 공유
+
+    for trial in range(5):
+        two_pass = copy.deepcopy(kernel)
+        two_pass.set_pipeline(DecisionPipeline([
+            MemoryLoadStep(two_pass, two_pass.config.working_memory_capacity),
+            WorkingMemoryStep(two_pass.pfc),
+            ActionCreationStep(two_pass.pfc, two_pass._calculate_memory_relevance,
+                               two_pass._extract_keywords, alpha=0.5),
+            PFCDecisionStep(two_pass.pfc),
+            EntropyCalculationStep(two_pass.dynamics),
+            CoreStrengthStep(two_pass.dynamics, two_pass),
+            TorqueGenerationStep(two_pass.dynamics, two_pass.mode),
+            UtilityRecalculationStep(two_pass.pfc, two_pass._calculate_memory_relevance,
+                                     two_pass._extract_keywords, alpha=0.5),
+            ResultAssemblyStep(two_pass.pfc, two_pass.basal_ganglia),
+        ]))
+        random.seed(trial)
+        expected = two_pass.decide(options)
+
+        random.seed(trial)
+        random.random()  # 2-pass 의 1차 선택이 소비하는 난수
+        result = kernel.decide(options)
+
+        assert result == expected
+        assert kernel.dynamics.state.precession_phi == two_pass.dynamics.state.precession_phi
+
+
+def test_decide_many_matches_sequential(tmp_path):
+    """배치 결정 = 같은 순서의 decide() 반복 (분포, 선택, 동역학 상태)."""
+    import copy
+    import random
+
+    kernel = _kernel(tmp_path)
+    for i, text in enumerate(["work hard", "rest well", "exercise daily", "work late"]):
+        kernel.remember("note", {"text": text}, importance=0.3 + 0.15 * i)
+    kernel.basal_ganglia.learn("tired", "rest", 0.9)
+    kernel.recall(k=kernel.config.working_memory_capacity)  # 같은 랭크 캐시 공유
+
+    option_lists = [
+        ["work", "rest", "exercise", "read"],
+        ["rest"],
+        [],
+        ["work", "rest"],
+        ["read", "exercise", "work"],
+    ]
+    contexts = ["tired", None, None, "tired", None]
+
+    sequential = copy.deepcopy(kernel)
+    random.seed(7)
+    expected = [sequential.decide(opts, ctx) for opts, ctx in zip(option_lists, contexts)]
+
+    random.seed(7)
+    results = kernel.decide_many(option_lists, contexts=contexts)
+
+    assert len(results) == len(expected)
+    for result, exp in zip(results, expected):
+        assert result["action"] == exp["action"]
+        habit, exp_habit = result["habit_suggestion"], exp["habit_suggestion"]
+        assert (habit is None) == (exp_habit is None)
+        if habit is not None:
+            assert habit.action.name == exp_habit.action.name
+            assert habit.decision == exp_habit.decision
+        assert result["cognitive_distress"] == exp["cognitive_distress"]
+        assert result["entropy"] == pytest.approx(exp["entropy"], abs=1e-12)
+        assert result["probability_distribution"].keys() == exp["probability_distribution"].keys()
+        for opt, prob in exp["probability_distribution"].items():
+            assert result["probability_distribution"][opt] == pytest.approx(prob, abs=1e-12)
+
+    state, seq_state = kernel.dynamics.state, sequential.dynamics.state
+    assert state.precession_phi == seq_state.precession_phi
+    assert state.entropy_history == pytest.approx(seq_state.entropy_history, abs=1e-12)
+    assert kernel.decide_many([]) == []
+
+
+def test_remember_many_matches_remember(tmp_path):
+    """remember_many = remember 반복 (과거 시점 백필, 같은 배치 안 related_to 참조)."""
+    import random
+
+    rng = random.Random(5)
+    records = []
+    for i in range(300):
+        record = {
+            "event_type": "chat",
+            "content": {"text": f"message {i}"},
+            "importance": rng.random(),
+            "timestamp": 1000.0 + rng.randint(0, 200),
+            "event_id": f"m{i}",
+        }
+        if i >= 2 and rng.random() < 0.3:
+            record["related_to"] = [f"m{i - 1}", f"m{i - 2}"]
+        records.append(record)
+
+    bulk = _kernel(tmp_path / "bulk", auto_save_interval=64)
+    bulk.config.auto_save = True
+    bulk.remember("seed", {"text": "now"}, importance=0.4)
+    saves = []
+    bulk.save = lambda: saves.append(bulk._event_count)
+    ids = bulk.remember_many(records)
+    assert ids == [r["event_id"] for r in records]
+    assert saves == [301]  # 여러 배수를 지나도 저장은 한 번
+
+    replay = _kernel(tmp_path / "replay")
+    replay.remember("seed", {"text": "now"}, importance=0.4)
+    for r in records:
+        event_id = replay.panorama.append_event(
+            r["timestamp"], r["event_type"], r["content"],
+            importance=r["importance"], event_id=r["event_id"],
+        )
+        for related_id in r.get("related_to", []):
+            replay._edges.add(related_id, event_id, r["importance"])
+            replay._edges.add(event_id, related_id, r["importance"] * 0.5)
+
+    assert [e.id for e in bulk.panorama.get_all_events()][:-1] == [
+        e.id for e in replay.panorama.get_all_events()
+    ][:-1]
+    assert bulk._edges.to_list() == replay._edges.to_list()
+    assert bulk._event_count == 301
+    assert [m["id"] for m in bulk.recall(k=5)] == [m["id"] for m in replay.recall(k=5)]
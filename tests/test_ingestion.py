@@ -0,0 +1,111 @@
+"""스트리밍 수집 서비스 테스트 (Thalamus → Amygdala → Panorama)."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cognitive_kernel import CognitiveKernel, CognitiveConfig  # noqa: E402
+from cognitive_kernel import IngestionConfig, IngestionService  # noqa: E402
+from cognitive_kernel.engines.thalamus import ModalityType, SensoryInput  # noqa: E402
+
+
+def _kernel(tmp_path) -> CognitiveKernel:
+    config = CognitiveConfig(storage_dir=str(tmp_path), auto_save=False)
+    return CognitiveKernel("test", config, auto_load=False)
+
+
+def _inputs(n):
+    contents = ["위험! 조심해!", "배경 음악", "오늘 정말 기쁘다!", "hello", 7]
+    return [
+        SensoryInput(
+            contents[i % len(contents)],
+            ModalityType.SEMANTIC,
+            intensity=0.2 + 0.8 * ((i * 37) % 10) / 10,
+            timestamp=1000.0 + i,
+        )
+        for i in range(n)
+    ]
+
+
+async def _stream(inputs):
+    for inp in inputs:
+        yield inp
+
+
+def test_ingestion_stores_gated_survivors(tmp_path):
+    inputs = _inputs(500)
+
+    kernel = _kernel(tmp_path)
+    kernel.thalamus.config.gate_threshold = 0.75
+    # 큐(16) < 배치(64): 생산자가 백프레셔로 대기하며 배치는 항상 64개씩 찬다
+    service = IngestionService(
+        kernel, IngestionConfig(batch_size=64, queue_size=16, max_latency=10.0)
+    )
+    stats = asyncio.run(service.run(_stream(inputs)))
+
+    assert stats.received == 500
+    assert stats.batches == 8
+    assert 0 < stats.passed < 500
+    assert stats.stored == stats.passed == len(kernel.panorama)
+    assert kernel.thalamus.stats['total_inputs'] == 500
+
+    # 같은 배치 분할로 동기 처리한 결과와 같은 기억
+    reference = IngestionService(_kernel(tmp_path / "ref"))
+    reference.kernel.thalamus.config.gate_threshold = 0.75
+    for start in range(0, 500, 64):
+        reference.process_batch(inputs[start:start + 64])
+    stored = [(e.timestamp, e.importance) for e in kernel.panorama.get_all_events()]
+    expected = [(e.timestamp, e.importance) for e in reference.kernel.panorama.get_all_events()]
+    assert stored == expected
+
+    # 위협 텍스트는 Amygdala 강화 정보가 payload 에 남는다
+    threat_events = [
+        e for e in kernel.panorama.get_all_events() if e.payload["content"] == "위험! 조심해!"
+    ]
+    assert threat_events and all(e.payload["threat"] > 0 for e in threat_events)
+
+
+def test_ingestion_runs_alongside_decisions(tmp_path):
+    kernel = _kernel(tmp_path)
+    kernel.remember("seed", {"topic": "start"}, importance=0.5)
+    service = IngestionService(kernel, IngestionConfig(batch_size=32, max_latency=0.001))
+    decisions = []
+
+    async def decide_loop():
+        for _ in range(5):
+            decisions.append(kernel.decide(["rest", "work"]))
+            await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(service.run(_stream(_inputs(200))), decide_loop())
+
+    asyncio.run(main())
+    assert len(decisions) == 5
+    assert service.stats.received == 200
+    assert len(kernel.panorama) == service.stats.stored + 1
+
+
+def test_failed_batch_raises_instead_of_hanging(tmp_path):
+    kernel = _kernel(tmp_path)
+
+    def fail(records):
+        raise ValueError("storage down")
+
+    kernel.remember_many = fail
+    service = IngestionService(
+        kernel, IngestionConfig(batch_size=4, queue_size=2, max_latency=0.0, use_thalamus=False)
+    )
+
+    async def main():
+        await asyncio.wait_for(service.run(_stream(_inputs(50))), 3)
+
+    try:
+        asyncio.run(main())
+    except ValueError as exc:
+        assert str(exc) == "storage down"
+    else:
+        raise AssertionError("run() should re-raise the consumer error")
+    assert service._consumer is None
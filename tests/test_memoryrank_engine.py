@@ -0,0 +1,303 @@
+"""MemoryRank 엔진 테스트.
+
+- 밀집 모드와 희소(CSR) 모드가 같은 랭크를 내는지 검증
+- 증분 업데이트 결과가 전체 재구성과 같은지 검증
+- 메모리 맵(.npy 디렉터리) 로드, 세대 단위 원자적 저장
+- 부분 정렬 Top-k (전체 정렬과 같은 결과, 캐시 무효화)
+- 엣지 저장소 (중복 병합, 노드 제거/압축, 배열 경로 그래프 구성)
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cognitive_kernel.engines.memoryrank import (
+    EdgeStore,
+    MemoryRankEngine,
+    MemoryRankConfig,
+    MemoryNodeAttributes,
+)
+
+
+EDGES = [
+    ("A", "B", 1.0),
+    ("B", "C", 1.0),
+    ("C", "A", 1.0),
+    ("C", "D", 0.5),
+    ("C", "D", 0.25),  # 중복 엣지 → 합산
+    ("E", "A", 0.0),   # weight 0 → E는 dangling
+]
+
+ATTRS = {
+    "A": MemoryNodeAttributes(recency=0.2, emotion=0.5, frequency=0.3),
+    "B": MemoryNodeAttributes(recency=0.4, emotion=0.4, frequency=0.4),
+    "C": MemoryNodeAttributes(recency=0.9, emotion=0.9, frequency=0.9),
+    "D": MemoryNodeAttributes(recency=0.1, emotion=0.1, frequency=0.1),
+}
+
+
+def _build(sparse: bool) -> MemoryRankEngine:
+    engine = MemoryRankEngine(MemoryRankConfig(sparse=sparse, local_weight_boost=1.5))
+    engine.build_graph(EDGES, ATTRS)
+    return engine
+
+
+def test_sparse_matches_dense():
+    """희소 전이 행렬 = 밀집 전이 행렬, 랭크 동일."""
+    dense = _build(sparse=False)
+    sparse = _build(sparse=True)
+
+    assert sparse._M is None
+    assert np.allclose(sparse._M_sparse.to_dense(), dense._M)
+
+    r_dense = dense.calculate_importance()
+    r_sparse = sparse.calculate_importance()
+    for nid in r_dense:
+        assert abs(r_dense[nid] - r_sparse[nid]) < 1e-9
+    assert abs(sum(r_sparse.values()) - 1.0) < 1e-6
+    assert [nid for nid, _ in sparse.get_top_memories(2)] == [
+        nid for nid, _ in dense.get_top_memories(2)
+    ]
+
+
+def test_sparse_persistence_roundtrip(tmp_path):
+    """희소 그래프 JSON/NPZ 저장 → 밀집/희소 엔진 로드."""
+    engine = _build(sparse=True)
+    ranks = engine.calculate_importance()
+
+    json_path = str(tmp_path / "graph.json")
+    npz_path = str(tmp_path / "graph.npz")
+    engine.save_to_json(json_path)
+    engine.save_to_npz(npz_path)
+
+    for sparse in (True, False):
+        loaded = MemoryRankEngine(MemoryRankConfig(sparse=sparse))
+        loaded.load_from_json(json_path)
+        loaded._r = None
+        reloaded = loaded.calculate_importance()
+        for nid in ranks:
+            assert abs(ranks[nid] - reloaded[nid]) < 1e-6
+
+    loaded = MemoryRankEngine()
+    loaded.load_from_npz(npz_path)
+    assert loaded._M_sparse is not None
+    loaded._r = None
+    assert loaded.get_top_memories(1)[0][0] == engine.get_top_memories(1)[0][0]
+
+
+def test_incremental_matches_rebuild():
+    """add_edges / update_personalization = 같은 입력으로 build_graph."""
+    extra_edges = [("D", "F", 1.0), ("F", "A", 0.5), ("B", "D", 0.3)]
+    extra_attrs = {
+        "F": MemoryNodeAttributes(recency=1.0, emotion=0.2, frequency=1.0),
+        "B": MemoryNodeAttributes(recency=0.1, emotion=0.1, frequency=0.1),
+    }
+    all_attrs = dict(ATTRS, **extra_attrs)
+
+    for sparse in (True, False):
+        incremental = MemoryRankEngine(MemoryRankConfig(sparse=sparse))
+        incremental.build_graph(EDGES, ATTRS)
+        incremental.calculate_importance()
+        index_before = dict(incremental._id_to_index)
+
+        assert incremental.add_edges(extra_edges, {"F": extra_attrs["F"]}) == 3
+        incremental.update_personalization({"B": extra_attrs["B"]})
+        assert incremental._r is None and incremental._r_warm is not None
+
+        # 기존 인덱스 매핑 유지, 새 노드는 끝에 추가
+        for nid, idx in index_before.items():
+            assert incremental._id_to_index[nid] == idx
+        assert incremental._id_to_index["F"] == len(index_before)
+
+        full = MemoryRankEngine(MemoryRankConfig(sparse=sparse, tol=1e-12))
+        full.build_graph(EDGES + extra_edges, all_attrs)
+
+        r_inc = incremental.calculate_importance()
+        r_full = full.calculate_importance()
+        for nid in r_full:
+            assert abs(r_inc[nid] - r_full[nid]) < 1e-5
+
+
+def test_mmap_npy_roundtrip(tmp_path):
+    """.npy 디렉터리를 메모리 맵으로 열어 Top-k 조회, 이후 증분 업데이트."""
+    for sparse in (True, False):
+        engine = _build(sparse=sparse)
+        engine.calculate_importance()
+        path = str(tmp_path / f"graph_{sparse}")
+        engine.save_to_npy(path)
+
+        loaded = MemoryRankEngine(MemoryRankConfig(sparse=sparse))
+        assert loaded.load_from_npy(path) == {"nodes": 5}
+        assert isinstance(loaded._r, np.memmap)
+        assert loaded.get_top_memories(3) == engine.get_top_memories(3)
+        assert loaded._id_to_index == {}  # id 테이블은 아직 만들지 않음
+
+        # 읽기 전용 맵 위에서도 증분 업데이트 가능
+        loaded.add_edges([("D", "F", 1.0)])
+        ranks = loaded.calculate_importance()
+        assert set(ranks) == {"A", "B", "C", "D", "E", "F"}
+        assert abs(sum(ranks.values()) - 1.0) < 1e-9
+
+
+def test_npy_save_is_atomic_per_generation(tmp_path, monkeypatch):
+    """중단된 저장은 이전 세대를 그대로 두고, 섞인 배열은 로드 시 거부."""
+    from cognitive_kernel.engines.memoryrank import persistence
+
+    path = tmp_path / "graph"
+    small = _build(sparse=True)
+    small.calculate_importance()
+    small.save_to_npy(str(path))
+    big = MemoryRankEngine(MemoryRankConfig(sparse=True))
+    big.build_graph(EDGES + [("E", "F", 1.0), ("F", "G", 1.0), ("G", "H", 1.0)])
+    big.calculate_importance()
+
+    # manifest 교체 직전에 죽은 저장: 새 세대 배열은 다 썼지만 manifest 는 옛 것
+    real_replace = os.replace
+
+    def crash_on_manifest(src, dst):
+        if Path(dst).name == "manifest.json":
+            raise OSError("killed")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(persistence.os, "replace", crash_on_manifest)
+    with pytest.raises(OSError):
+        big.save_to_npy(str(path))
+    monkeypatch.undo()
+
+    loaded = MemoryRankEngine(MemoryRankConfig(sparse=True))
+    assert loaded.load_from_npy(str(path)) == {"nodes": 5}
+    assert loaded.get_top_memories(3) == small.get_top_memories(3)
+    loaded.calculate_importance()
+
+    # 다음 저장은 새 세대로 교체되고, 중단된 세대 잔여물은 정리됨
+    big.save_to_npy(str(path))
+    assert loaded.load_from_npy(str(path)) == {"nodes": 8}
+    assert len(list(path.glob("gen-*"))) == 2  # 현재 + 직전 세대
+
+    # 세대 안의 배열 일부가 다른 그래프 것으로 바뀌면 로드 거부
+    manifest = json.loads((path / "manifest.json").read_text())
+    current = path / manifest["generation"]
+    small.save_to_npy(str(tmp_path / "other"))
+    other = tmp_path / "other" / json.loads((tmp_path / "other" / "manifest.json").read_text())["generation"]
+    for name in ("M_indptr.npy", "M_indices.npy"):
+        (current / name).write_bytes((other / name).read_bytes())
+    with pytest.raises(ValueError, match="mixed or partial save"):
+        MemoryRankEngine(MemoryRankConfig(sparse=True)).load_from_npy(str(path))
+
+
+def test_top_k_partial_selection():
+    """argpartition Top-k = 전체 정렬 결과, 랭크 재계산 시 캐시 무효화."""
+    rng = np.random.default_rng(0)
+    n = 500
+    src = rng.integers(0, n, 3000)
+    dst = rng.integers(0, n, 3000)
+    edges = [(f"n{s}", f"n{d}", 1.0) for s, d in zip(src, dst)]
+    engine = MemoryRankEngine(MemoryRankConfig(sparse=True))
+    engine.build_graph(edges)
+    engine.calculate_importance()
+
+    r = engine._r
+    expected = [engine.get_node_ids()[i] for i in np.argsort(-r, kind="stable")]
+    for k in (1, 7, 50, 5, n, n + 10):
+        assert [nid for nid, _ in engine.get_top_memories(k)] == expected[:k]
+
+    batch = engine.get_top_memories_batch([3, 7, 0])
+    assert batch[7][:3] == batch[3] and batch[0] == []
+
+    engine.add_edges([("n1", "n2", 50.0)])
+    top = engine.get_top_memories(5)
+    r = engine._r
+    assert [s for _, s in top] == sorted(r, reverse=True)[:5]
+
+
+def test_edge_store_build_matches_edge_list():
+    """병합된 엣지 저장소 → build_graph_arrays = 원 엣지 리스트 → build_graph."""
+    rng = np.random.default_rng(1)
+    edges = [
+        (f"n{s}", f"n{d}", float(w))
+        for s, d, w in zip(rng.integers(0, 80, 600), rng.integers(0, 80, 600), rng.random(600) - 0.1)
+    ]
+    store = EdgeStore(capacity=4)
+    store.extend(edges)
+    assert len(store) == len({(s, d) for s, d, _ in edges})
+
+    for sparse in (True, False):
+        config = MemoryRankConfig(sparse=sparse, local_weight_boost=1.5, tol=1e-12)
+        expected = MemoryRankEngine(config)
+        expected.build_graph(edges)
+        actual = MemoryRankEngine(config)
+        actual.build_graph_arrays(*store.graph_arrays())
+
+        assert actual.get_node_ids() == expected.get_node_ids()
+        r_expected = expected.calculate_importance()
+        r_actual = actual.calculate_importance()
+        for nid in r_expected:
+            assert abs(r_actual[nid] - r_expected[nid]) < 1e-9
+
+
+def test_edge_store_remove_nodes_and_compact():
+    """노드 제거 → 연결 엣지 소멸, 인접 오프셋 / 압축 후에도 같은 엣지."""
+    store = EdgeStore()
+    store.COMPACT_MIN_SLOTS = 8
+    store.extend(EDGES)
+    assert store.neighbors("C") == [("A", 1.0), ("D", 0.75)]
+    assert store.neighbors("E") == [("A", 0.0)]
+
+    epoch = store.epoch
+    assert store.remove_nodes(["A", "missing"]) == 1
+    assert store.epoch > epoch
+    assert store.take_pending() is None  # 엣지 소멸 → 전체 재구축
+    assert store.to_list() == [("B", "C", 1.0), ("C", "D", 0.75)]
+    assert store.neighbors("C") == [("D", 0.75)]
+
+    for i in range(10):
+        store.add(f"x{i}", "B", 1.0)
+    store.remove_nodes([f"x{i}" for i in range(10)] + ["D"])
+    assert store._size == len(store) == 1  # 압축됨
+    assert store.to_list() == [("B", "C", 1.0)]
+    assert store.take_pending() is None
+
+    # 제거된 ID 를 다시 쓰면 새 노드 (이전 가중치와 병합되지 않음)
+    store.add("C", "D", 0.5)
+    assert store.to_list() == [("B", "C", 1.0), ("C", "D", 0.5)]
+    assert store.take_pending() == [("C", "D", 0.5)]
+
+
+def test_add_edges_renormalizes_only_touched_columns():
+    """엣지 하나 추가 → 그 src 열만 바뀌고, 결과는 전체 재구성과 같다."""
+    rng = np.random.default_rng(2)
+    edges = [
+        (f"n{s}", f"n{d}", float(w))
+        for s, d, w in zip(rng.integers(0, 40, 200), rng.integers(0, 40, 200), rng.random(200) + 0.1)
+    ]
+    for sparse in (True, False):
+        engine = MemoryRankEngine(MemoryRankConfig(sparse=sparse))
+        engine.build_graph(edges)
+        before = engine._M_sparse.to_dense() if sparse else engine._M.copy()
+        rebuilt_calls = []
+        engine._rebuild_transition = lambda: rebuilt_calls.append(1)
+
+        engine.add_edges([("n3", "n7", 2.0), ("n3", "n39", 0.5)])
+        after = engine._M_sparse.to_dense() if sparse else engine._M
+        col = engine._id_to_index["n3"]
+        others = np.arange(len(before)) != col
+        assert np.array_equal(after[:, others], before[:, others])
+        assert not np.allclose(after[:, col], before[:, col])
+
+        # 새 노드 (dangling 열 추가) 도 제자리 갱신
+        engine.add_edges([("n0", "new", 1.0)])
+        assert rebuilt_calls == []
+
+        full = MemoryRankEngine(MemoryRankConfig(sparse=sparse))
+        full.build_graph(edges + [("n3", "n7", 2.0), ("n3", "n39", 0.5), ("n0", "new", 1.0)])
+        M_inc = engine._M_sparse.to_dense() if sparse else engine._M
+        M_full = full._M_sparse.to_dense() if sparse else full._M
+        order = [engine._id_to_index[nid] for nid in full.get_node_ids()]
+        assert np.allclose(M_inc[np.ix_(order, order)], M_full)
@@ -0,0 +1,274 @@
+"""Panorama Memory Engine 테스트.
+
+- 청크 분할 타임라인 (순서 섞인 삽입, 구간 쿼리, 제거)
+- 열 저장소(columnar arrays)와 벡터화 점수 계산 검증
+- SQLite 증분 저장 (변경분만 기록, 제거 반영)
+- 벌크 로드 (load_events) = append_event 반복과 같은 상태
+- max_events 로 잘린 SQLite 로드 → 다음 저장은 전체 재기록
+"""
+
+import bisect
+import math
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cognitive_kernel.engines.panorama.persistence import PanoramaPersistence
+from cognitive_kernel.engines.panorama import (
+    PanoramaMemoryEngine,
+    PanoramaConfig,
+    EventTimeline,
+)
+
+
+def test_timeline_matches_sorted_list():
+    """청크 타임라인 = bisect 정렬 리스트 (작은 청크로 분할 경로까지 검증)."""
+    rng = random.Random(7)
+    engine = PanoramaMemoryEngine(PanoramaConfig(max_events=300))
+    engine._events = EventTimeline(chunk_size=4)
+
+    reference = []  # (timestamp, event_id)
+    for i in range(1000):
+        # 대부분 시간 순, 일부는 과거 시점 (동일 timestamp 포함)
+        ts = float(i) if rng.random() < 0.7 else float(rng.randint(0, i))
+        eid = engine.append_event(ts, "e")
+        idx = bisect.bisect_right([t for t, _ in reference], ts)
+        reference.insert(idx, (ts, eid))
+        if len(reference) > 300:
+            reference.pop(0)
+
+    assert [e.id for e in engine.get_all_events()] == [eid for _, eid in reference]
+    for t_start, t_end in [(0, 1000), (700, 750), (820.5, 821.5), (900, 100), (2000, 3000)]:
+        expected = [eid for ts, eid in reference if t_start <= ts <= t_end]
+        assert [e.id for e in engine.query_range(t_start, t_end)] == expected
+    for n in (0, 1, 5, 299, 300, 500):
+        expected = [eid for _, eid in reference[-n:]] if n > 0 else []
+        assert [e.id for e in engine.get_recent(n)] == expected
+
+
+def test_columnar_scores_match_events():
+    """열 배열 기반 recency/importance = 이벤트별 math.exp 계산."""
+    engine = PanoramaMemoryEngine(PanoramaConfig(recency_half_life=100.0))
+    for i in range(50):
+        engine.append_event(
+            timestamp=1000.0 + (i * 37) % 50,  # 순서 섞인 삽입
+            event_type="e",
+            payload={"emotion": 0.01 * i},
+            importance=0.02 * i,
+        )
+
+    t_now = 1100.0
+    lam = math.log(2) / 100.0
+    recency = engine.get_recency_scores(t_now)
+    importance = engine.get_importance_scores(t_now)
+    assert len(recency) == len(importance) == 50
+
+    columns = engine.get_columns()
+    for event in engine.get_all_events():
+        expected = math.exp(-lam * max(0.0, t_now - event.timestamp))
+        assert abs(recency[event.id] - expected) < 1e-12
+        assert abs(importance[event.id] - event.importance * expected) < 1e-12
+
+        slot = engine.get_event_index(event.id)
+        assert columns["timestamp"][slot] == event.timestamp
+        assert columns["emotion"][slot] == event.payload["emotion"]
+
+
+def test_columns_follow_eviction():
+    """max_events 초과 시 제거된 이벤트는 열에서도 빠지고, 압축 후에도 정합."""
+    engine = PanoramaMemoryEngine(PanoramaConfig(max_events=100))
+    ids = [engine.append_event(float(i), "e", importance=0.5) for i in range(5000)]
+
+    assert len(engine) == 100
+    assert engine.column_epoch > 0  # 압축 발생
+    assert engine.get_event_index(ids[0]) is None
+
+    live = ids[-100:]
+    slots = engine.get_event_indices(live + ["missing"])
+    assert slots[-1] == -1
+    columns = engine.get_columns()
+    assert np.all(columns["alive"][slots[:-1]])
+    assert np.array_equal(columns["timestamp"][slots[:-1]], np.arange(4900, 5000, dtype=float))
+    assert set(engine.get_recency_scores(5000.0)) == set(live)
+
+
+def test_incremental_sqlite_save(tmp_path):
+    """증분 저장은 변경분만 쓰고, 결과 DB는 엔진 내용과 같다."""
+    db = str(tmp_path / "panorama.db")
+    engine = PanoramaMemoryEngine(PanoramaConfig(max_events=50))
+    persistence = PanoramaPersistence(engine)
+    for i in range(40):
+        engine.append_event(float(i), "e", payload={"i": i})
+
+    first = persistence.save_sqlite_incremental(db)
+    assert first["full_rewrite"] == 1 and first["inserted"] == 40
+
+    for i in range(40, 60):  # 10개 제거 발생
+        engine.append_event(float(i), "e", payload={"i": i})
+    second = persistence.save_sqlite_incremental(db)
+    assert second == {"events": 50, "inserted": 20, "deleted": 10, "full_rewrite": 0}
+
+    streamed = list(persistence.iter_sqlite(db, batch_size=7))
+    assert [e.id for e in streamed] == [e.id for e in engine.get_all_events()]
+
+    # 로드한 엔진도 이어서 증분 저장
+    restored = PanoramaMemoryEngine(PanoramaConfig(max_events=50))
+    assert restored.load_from_sqlite(db) == 50
+    restored.append_event(100.0, "e")
+    third = PanoramaPersistence(restored).save_sqlite_incremental(db)
+    assert third == {"events": 50, "inserted": 1, "deleted": 1, "full_rewrite": 0}
+    assert [e.timestamp for e in persistence.iter_sqlite(db)][-1] == 100.0
+
+
+def test_truncated_sqlite_load_rewrites_db(tmp_path):
+    """max_events 보다 많은 행을 로드하면 다음 저장이 버린 행까지 DB 에서 지운다."""
+    db = str(tmp_path / "panorama.db")
+    engine = PanoramaMemoryEngine(PanoramaConfig(max_events=50))
+    for i in range(30):
+        engine.append_event(float(i), "e", payload={"i": i})
+    PanoramaPersistence(engine).save_sqlite_incremental(db)
+
+    small = PanoramaMemoryEngine(PanoramaConfig(max_events=10))
+    persistence = PanoramaPersistence(small)
+    assert persistence.load_sqlite(db) == 10
+    small.append_event(100.0, "e")
+    stats = persistence.save_sqlite_incremental(db)
+    assert stats["full_rewrite"] == 1
+
+    assert [e.id for e in persistence.iter_sqlite(db)] == [e.id for e in small.get_all_events()]
+
+
+def test_change_journal_idle_without_incremental_store(tmp_path):
+    """증분 저장소가 기준점을 남기기 전에는 저널에 Event 참조가 쌓이지 않는다."""
+    engine = PanoramaMemoryEngine(PanoramaConfig(max_events=20))
+    for i in range(70):
+        engine.append_event(float(i), "e", payload={"i": i})
+    engine.save_to_json(str(tmp_path / "panorama.json"))
+    assert engine._changes == []
+    assert engine.change_seq == 120  # 추가 70 + 제거 50
+
+    db = str(tmp_path / "panorama.db")
+    persistence = PanoramaPersistence(engine)
+    assert persistence.save_sqlite_incremental(db)["full_rewrite"] == 1
+    for i in range(70, 75):
+        engine.append_event(float(i), "e", payload={"i": i})
+    assert len(engine._changes) == 10
+    stats = persistence.save_sqlite_incremental(db)
+    assert (stats["full_rewrite"], stats["inserted"], stats["deleted"]) == (0, 5, 5)
+    assert engine._changes == []
+    assert [e.id for e in persistence.iter_sqlite(db)] == [e.id for e in engine.get_all_events()]
+
+
+def test_load_events_matches_replay(tmp_path):
+    """벌크 로드 결과가 append_event 재생과 같다 (순서 섞인 입력, max_events 포함)."""
+    rng = random.Random(1)
+    source = PanoramaMemoryEngine(PanoramaConfig(max_events=1000))
+    for i in range(300):
+        source.append_event(
+            float(rng.randint(0, 200)), "e",
+            payload={"emotion": 0.1}, episode_id=f"ep{i % 3}", importance=0.3,
+        )
+    events = source.get_all_events()
+    shuffled = list(events)
+    rng.shuffle(shuffled)
+
+    bulk = PanoramaMemoryEngine(PanoramaConfig(max_events=250))
+    assert bulk.load_events(shuffled) == 250
+    replay = PanoramaMemoryEngine(PanoramaConfig(max_events=250))
+    for e in sorted(shuffled, key=lambda e: e.timestamp):
+        replay.append_event(e.timestamp, e.event_type, e.payload, e.episode_id, e.importance, e.id)
+
+    assert [e.id for e in bulk.get_all_events()] == [e.id for e in replay.get_all_events()]
+    assert [e.id for e in bulk.query_range(50, 60)] == [e.id for e in replay.query_range(50, 60)]
+    assert sorted(bulk.get_episode_ids()) == sorted(replay.get_episode_ids())
+    assert [e.id for e in bulk.get_episode("ep1")] == [e.id for e in replay.get_episode("ep1")]
+    assert bulk.get_recency_scores(300.0) == replay.get_recency_scores(300.0)
+
+    # 로드 후 추가/저장도 정상
+    bulk.append_event(500.0, "e")
+    assert len(bulk) == 250 and bulk.get_recent(1)[0].timestamp == 500.0
+    path = str(tmp_path / "p.json")
+    bulk.save_to_json(path)
+    assert PanoramaMemoryEngine().load_from_json(path) == 250
+
+
+def test_append_events_matches_append_event():
+    """벌크 append 결과가 append_event 반복과 같다 (순서 섞인 시간, max_events 초과 포함)."""
+    rng = random.Random(4)
+    records = [
+        {
+            "timestamp": float(i) if rng.random() < 0.8 else float(rng.randint(0, i)),
+            "event_type": "e",
+            "payload": {"emotion": rng.random(), "word": f"w{i % 7}"},
+            "episode_id": f"ep{i % 4}",
+            "importance": rng.random(),
+            "event_id": f"id{i}",
+        }
+        for i in range(400)
+    ]
+    bulk = PanoramaMemoryEngine(PanoramaConfig(max_events=300))
+    bulk.append_event(-1.0, "seed", event_id="seed")
+    assert bulk.append_events(records[:250]) == [r["event_id"] for r in records[:250]]
+    bulk.append_events(records[250:])
+
+    replay = PanoramaMemoryEngine(PanoramaConfig(max_events=300))
+    replay.append_event(-1.0, "seed", event_id="seed")
+    for record in records:
+        replay.append_event(**record)
+
+    assert [e.id for e in bulk.get_all_events()] == [e.id for e in replay.get_all_events()]
+    assert sorted(bulk.get_episode_ids()) == sorted(replay.get_episode_ids())
+    assert [e.id for e in bulk.get_episode("ep2")] == [e.id for e in replay.get_episode("ep2")]
+    assert bulk.get_recency_scores(500.0) == replay.get_recency_scores(500.0)
+    assert bulk.keyword_matches("w3") == replay.keyword_matches("w3")
+
+
+def test_keyword_index_matches_substring_scan():
+    """역색인 조회 = 내용 텍스트 부분 문자열 검사 (제거/재추가 포함)."""
+    from cognitive_kernel.engines.panorama.keyword_index import content_text
+
+    rng = random.Random(3)
+    words = ["red", "bored", "Project", "work", "homework", "rest", "x-ray", "42"]
+    engine = PanoramaMemoryEngine(PanoramaConfig(max_events=40))
+    for i in range(100):
+        payload = {"a": " ".join(rng.sample(words, 2)), "n": i}
+        engine.append_event(float(i), "e", payload=payload)
+
+    for keyword in ["red", "work", "project", "ray", "4", "zzz", "or", "e"]:
+        expected = {
+            e.id for e in engine.get_all_events() if keyword in content_text(e.payload)
+        }
+        assert engine.keyword_matches(keyword) == expected
+        index = engine.keyword_index
+        for e in engine.get_all_events():
+            assert index.contains(e.id, keyword) == (e.id in expected)
+
+    # 공백이 든 키워드는 스캔으로 처리
+    assert engine.keyword_matches("red bored") == {
+        e.id for e in engine.get_all_events() if "red bored" in content_text(e.payload)
+    }
+
+
+def test_keyword_index_stays_bounded_under_eviction():
+    """내용이 계속 바뀌어도 색인 크기는 살아 있는 이벤트 수에 비례하고, 조회는 그대로 맞다."""
+    from cognitive_kernel.engines.panorama.keyword_index import content_text
+
+    engine = PanoramaMemoryEngine(PanoramaConfig(max_events=40))
+    index = engine.keyword_index
+    index.COMPACT_MIN_DEAD = 16
+    for i in range(3000):
+        engine.append_event(float(i), "e", payload={"text": f"tok{i} common t{i % 7}"})
+        if i % 97 == 0:
+            for keyword in ("tok", "t3", "common", f"tok{i - 39}"):
+                expected = {
+                    e.id for e in engine.get_all_events() if keyword in content_text(e.payload)
+                }
+                assert engine.keyword_matches(keyword) == expected
+
+    assert len(index._postings) <= 40 + 7 + 1
+    assert len(index._vocab) <= 2 * len(index._postings) + index.COMPACT_MIN_DEAD + 1
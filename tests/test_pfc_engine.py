@@ -0,0 +1,103 @@
+"""PFC Engine 테스트 (배열 경로)."""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cognitive_kernel.engines.pfc import (  # noqa: E402
+    PFCConfig,
+    PFCEngine,
+    Action,
+    actions_to_array,
+)
+
+
+def _actions(n: int, seed: int = 0):
+    rnd = random.Random(seed)
+    return [
+        Action(
+            id=f"a{i}",
+            name=f"tool_{i}",
+            expected_reward=rnd.uniform(-0.2, 1.2),
+            effort_cost=rnd.random() * 0.5,
+            risk=rnd.random() * 0.8,
+        )
+        for i in range(n)
+    ]
+
+
+def test_array_path_matches_list_path():
+    """select_array = select_action (효용, 확률, 선택, 갈등 신호)."""
+    pfc = PFCEngine(PFCConfig(decision_temperature=3.0))
+    actions = _actions(200)
+    table = actions_to_array(actions)
+
+    utilities = pfc.evaluate_array(table)
+    assert np.allclose(utilities, [pfc.evaluate_action(a) for a in actions])
+    assert np.allclose(
+        pfc.softmax_array(utilities),
+        pfc.softmax_probabilities([pfc.evaluate_action(a) for a in actions]),
+    )
+
+    for seed in range(20):
+        random.seed(seed)
+        expected = pfc.select_action(actions)
+        random.seed(seed)
+        result = pfc.select_array(table)
+
+        assert result.inhibited == expected.inhibited
+        if not expected.inhibited:
+            assert actions[result.index] is expected.action
+        assert abs(result.utility - expected.utility) < 1e-12
+        assert abs(result.selection_probability - expected.selection_probability) < 1e-12
+        assert abs(result.conflict_signal - expected.conflict_signal) < 1e-12
+
+    best = pfc.select_array(utilities, deterministic=True)
+    assert best.index == int(np.argmax(utilities))
+    assert pfc.select_array(np.zeros(0)).index == -1
+
+
+def test_array_selection_with_seeded_generator():
+    """같은 시드의 Generator 는 같은 선택을 재현한다."""
+    pfc = PFCEngine()
+    utilities = np.linspace(-0.5, 0.5, 1000)
+
+    rng = np.random.default_rng(42)
+    first = [pfc.select_array(utilities, rng=rng).index for _ in range(50)]
+    rng = np.random.default_rng(42)
+    second = [pfc.select_array(utilities, rng=rng).index for _ in range(50)]
+    assert first == second
+
+
+def test_working_memory_heap_eviction_and_lazy_decay():
+    """용량 초과 시 최저 relevance 제거, 감쇠는 전역 배율로 적용."""
+    pfc = PFCEngine(PFCConfig(working_memory_capacity=3, decay_rate=1.0))
+    ids = pfc.load_from_memoryrank([("m1", 0.1), ("m2", 0.4), ("m3", 0.05), ("m4", 0.3)])
+    assert len(ids) == len(set(ids)) == 4
+
+    slots = pfc.get_working_memory()
+    assert [s.content["memory_id"] for s in slots] == ["m1", "m2", "m4"]
+    assert [s.relevance for s in slots] == [0.2, 0.8, 0.6]
+
+    # 하나씩 넣어도 같은 슬롯이 남는다
+    single = PFCEngine(PFCConfig(working_memory_capacity=3))
+    for mid, score in [("m1", 0.1), ("m2", 0.4), ("m3", 0.05), ("m4", 0.3)]:
+        single.load_to_working_memory({"memory_id": mid}, min(1.0, score * 2.0))
+    assert [s.content["memory_id"] for s in single.get_working_memory()] == ["m1", "m2", "m4"]
+
+    # exp(-2) ≈ 0.135: 한 번 감쇠 후엔 모두 남고, 두 번째 감쇠에서 m1 (≈0.0037) 제거
+    pfc.update_decay(dt=2.0)
+    decayed = pfc.get_working_memory()
+    assert np.allclose([s.relevance for s in decayed], np.array([0.2, 0.8, 0.6]) * np.exp(-2.0))
+    pfc.update_decay(dt=2.0)
+    assert [s.content["memory_id"] for s in pfc.get_working_memory()] == ["m2", "m4"]
+
+    pfc.load_to_working_memory("note", 1.0)
+    assert len(pfc.get_working_memory()) == 3
+    pfc.clear_working_memory()
+    assert pfc.get_working_memory() == []
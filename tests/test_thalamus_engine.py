@@ -0,0 +1,94 @@
+"""Thalamus Engine 테스트 (현저성 매처 / 신규성 창)."""
+
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cognitive_kernel.engines.thalamus import (  # noqa: E402
+    ModalityType,
+    SensoryInput,
+    ThalamusConfig,
+    ThalamusEngine,
+)
+
+
+def _reference_salience(engine, inp, history):
+    """패턴마다 부분 문자열 검사 + 최근 10개 비교를 하던 기존 방식 (비교 기준)."""
+    config = engine.config
+    salience = inp.salience
+    if isinstance(inp.content, str):
+        content_lower = inp.content.lower()
+        for category, patterns in config.salient_patterns.items():
+            for pattern in patterns:
+                if pattern in content_lower:
+                    boost = config.salience_boost * (2 if category == 'threat' else 1)
+                    salience = min(1.0, salience * boost)
+                    break
+    salience *= inp.intensity * engine.arousal_level
+
+    if not history:
+        novelty = 1.0
+    else:
+        similar = sum(
+            1 for recent in history[-10:]
+            if isinstance(inp.content, str) and isinstance(recent.content, str)
+            and inp.content.lower() == recent.content.lower()
+        )
+        novelty = max(0.0, min(1.0, 1.0 - similar / min(10, len(history))))
+    return min(1.0, salience + novelty * config.novelty_bonus)
+
+
+def _batches(n, seed=0):
+    contents = ['위험해', 'Danger!', 'hello', 'HELLO', 'what?', '배경 음악', 42, None, '칭찬 감사']
+    rnd = random.Random(seed)
+    for _ in range(n):
+        yield [
+            SensoryInput(
+                rnd.choice(contents),
+                rnd.choice(list(ModalityType)),
+                intensity=rnd.random(),
+                salience=rnd.random(),
+            )
+            for _ in range(rnd.randint(0, 6))
+        ]
+
+
+def test_salience_and_novelty_match_reference():
+    for maxlen in (4, 50):
+        engine = ThalamusEngine(ThalamusConfig(recent_inputs_maxlen=maxlen))
+        history = []
+        for batch in _batches(300):
+            expected = [_reference_salience(engine, inp, history) for inp in batch]
+            actual = [engine._calculate_salience(inp) for inp in batch]
+            assert actual == expected
+            engine.filter(batch)
+            history = (history + batch)[-maxlen:]
+            assert list(engine.recent_inputs) == history
+
+
+def test_reset_clears_novelty_window():
+    engine = ThalamusEngine()
+    engine.filter([SensoryInput("hello", ModalityType.SEMANTIC)] * 3)
+    assert engine._compute_novelty(SensoryInput("Hello", ModalityType.SEMANTIC)) == 0.0
+
+    engine.reset()
+    assert engine._compute_novelty(SensoryInput("Hello", ModalityType.SEMANTIC)) == 1.0
+
+
+def test_array_gate_matches_tuple_path():
+    def key(outputs):
+        return [(o.content, o.modality, o.attention_weight, o.computed_salience, o.priority) for o in outputs]
+
+    for max_channels in (1, 3):
+        tuple_path = ThalamusEngine(ThalamusConfig(array_gate_min_inputs=10**9, max_channels=max_channels))
+        array_path = ThalamusEngine(ThalamusConfig(array_gate_min_inputs=0, max_channels=max_channels))
+        for i, batch in enumerate(_batches(200, seed=3)):
+            if i == 50:
+                for engine in (tuple_path, array_path):
+                    engine.set_attention_focus(ModalityType.SEMANTIC)
+                    engine.boost_attention(ModalityType.SEMANTIC, 0.3)
+            assert key(array_path.filter(batch)) == key(tuple_path.filter(batch))
+        assert array_path.stats == tuple_path.stats